@@ -0,0 +1,137 @@
+"""设计核心的asyncio接口：各计算阶段在进程池（或指定的执行器）中运行，不阻塞事件循环
+
+    async with AsyncDesignCore(max_concurrency=4) as core:
+        optimum = await core.optimum(blade_count=4, ps=7000)
+        results = await core.evaluate_many([{'ps': 6000}, {'ps': 7000, 'blade_count': 5}])
+
+max_concurrency 限制同时提交到执行器的计算数，其余请求在信号量上等待。
+取消等待中的任务时，尚未开始的计算不再提交；已在工作进程中运行的计算会算完，但结果被丢弃。
+"""
+import os
+import asyncio
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+from propeller_core import (get_chart_surface, solve_max_speed, chart_design_point, calculate_cavitation,
+                            solve_optimum_area_ratio, calc_strength, blade_section_integrals,
+                            calc_bollard_pull, calc_kt_kq)
+from design_records import compute_voyage
+from design_compare import DEFAULT_DESIGN, evaluate_design
+
+
+def max_speed_point(blade_count, ae_a0, pd, n, w, eta_h, speeds, pes):
+    """给定盘面比下的最大航速及图谱要素（图谱曲面在工作进程内取得，参数可为数组）"""
+    surface = get_chart_surface(blade_count)
+    vmax = solve_max_speed(surface, ae_a0, pd, n, w, eta_h, speeds, pes)
+    point = chart_design_point(surface, ae_a0, vmax, pd, n, w)
+    point['vmax'] = vmax
+    return point
+
+
+def voyage_characteristics(D, p_d, ae_a0, w, t, eta_r, eta_s, rpms, speeds, blade_count=4, rho=1025.0):
+    """按AU多项式计算航行特性，返回 VoyageResults"""
+    return compute_voyage(D, p_d, ae_a0, w, t, eta_r, eta_s, rpms, speeds,
+                          partial(_au_kt_kq, blade_count=blade_count), rho=rho)
+
+
+def _au_kt_kq(J, p_d, ae_a0, blade_count):
+    return calc_kt_kq(J, p_d, ae_a0, blade_count)
+
+
+class AsyncDesignCore:
+    """设计核心的异步封装
+
+    executor 为 None 时首次使用时创建 ProcessPoolExecutor(workers)，并在 close 时关闭；
+    传入的执行器由调用方负责关闭。
+    """
+
+    def __init__(self, executor=None, max_concurrency=None, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = executor
+        self._own_executor = executor is None
+        self.max_concurrency = max_concurrency or self.workers
+        self._semaphore = None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def run(self, func, *args, **kwargs):
+        """在执行器中运行 func(*args, **kwargs)，受并发数限制，可被取消"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    # 各计算阶段，参数与 propeller_core 中对应函数一致
+    async def max_speed(self, blade_count, ae_a0, pd, n, w, eta_h, speeds, pes):
+        return await self.run(max_speed_point, blade_count, ae_a0, pd, n, w, eta_h, speeds, pes)
+
+    async def cavitation(self, pd, n, w, vmax, D, p_d, eta0, hs, pv, p0, source='wag', rho=1025.0):
+        return await self.run(calculate_cavitation, pd, n, w, vmax, D, p_d, eta0, hs, pv, p0,
+                              source=source, rho=rho)
+
+    async def optimum_area_ratio(self, blade_count, pd, n, w, eta_h, speeds, pes, hs, pv, p0,
+                                 source='wag', rho=1025.0):
+        return await self.run(solve_optimum_area_ratio, blade_count, pd, n, w, eta_h, speeds, pes,
+                              hs, pv, p0, source=source, rho=rho)
+
+    async def strength(self, D, p_d, ae_a0, ne, Ne, blade_count=4, epsilon=8.0, K=1.0):
+        return await self.run(calc_strength, D, p_d, ae_a0, ne, Ne, blade_count, epsilon=epsilon, K=K)
+
+    async def mass(self, D, ae_a0, blade_count=4, rho=8400.0):
+        return await self.run(blade_section_integrals, D, ae_a0, blade_count, rho)
+
+    async def mooring(self, ps, n, D, p_d, ae_a0, t0=0.0, blade_count=4, eta_s=0.97, eta_r=1.0, rho=1025.0):
+        return await self.run(calc_bollard_pull, ps, n, D, p_d, ae_a0, t0, blade_count,
+                              eta_s=eta_s, eta_r=eta_r, rho=rho)
+
+    async def voyage(self, D, p_d, ae_a0, w, t, eta_r, eta_s, rpms, speeds, blade_count=4, rho=1025.0):
+        return await self.run(voyage_characteristics, D, p_d, ae_a0, w, t, eta_r, eta_s, rpms, speeds,
+                              blade_count, rho)
+
+    async def optimum(self, **design):
+        """按方案参数（键同 DEFAULT_DESIGN）求最佳要素，返回 (optimum, curves)"""
+        d = dict(DEFAULT_DESIGN, **design)
+        pd = d['ps'] * 0.9 * d['eta_s'] * d['eta_r']
+        eta_h = (1 - d['t']) / (1 - d['w'])
+        return await self.optimum_area_ratio(int(d['blade_count']), pd, d['N'], d['w'], eta_h, d['speeds'],
+                                             d['pes'], d['hs'], d['pv'], d['p0'], source=d['source'],
+                                             rho=d['rho'])
+
+    async def design(self, design):
+        """一个方案的完整设计流程（同 design_compare.evaluate_design）"""
+        return await self.run(evaluate_design, design)
+
+    async def evaluate_many(self, designs, return_exceptions=False):
+        """并发计算多个方案，结果顺序与输入一致"""
+        return await asyncio.gather(*(self.design(design) for design in designs),
+                                    return_exceptions=return_exceptions)
+
+    async def as_completed(self, designs):
+        """按完成先后逐个产出 (序号, 结果)；提前退出时取消其余任务"""
+        tasks = {asyncio.ensure_future(self.design(design)): i for i, design in enumerate(designs)}
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield tasks[task], task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def close(self):
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        # 等待工作进程退出的过程也放到线程中，避免阻塞事件循环
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -0,0 +1,121 @@
+"""批量设计链：对成批的输入参数依次完成最大航速、空泡校核（最佳要素）和航行特性计算，
+供不确定性分析与参数扫描调用"""
+import numpy as np
+
+from propeller_core import (get_chart_surface, solve_max_speed, chart_design_point, calculate_cavitation,
+                            calc_kt_kq, OPTIMUM_AREA_TOLERANCE)
+import solver_diagnostics
+
+# 默认工况，与界面中的默认输入一致
+DEFAULT_CONDITIONS = {
+    'ps': 6222.0, 'N': 155.0, 'eta_s': 0.97, 'w': 0.35, 't': 0.21, 'eta_r': 1.0, 'pe_scale': 1.0,
+    'speeds': [12, 13, 14, 15, 16, 17], 'pes': [1497, 1953, 2505, 3213, 4070, 5161],
+    'blade_count': 4, 'hs': 5.0, 'pv': 1706.0, 'p0': 101325.0, 'source': 'wag', 'rho': 1025.0,
+}
+
+
+def evaluate_design_chain(w, t, eta_r, pe_scale=1.0, ps=6222.0, N=155.0, eta_s=0.97,
+                          speeds=DEFAULT_CONDITIONS['speeds'], pes=DEFAULT_CONDITIONS['pes'],
+                          blade_count=4, hs=5.0, pv=1706.0, p0=101325.0, source='wag', rho=1025.0,
+                          num=9, iterations=30, diagnostics=None):
+    """向量化设计链，w、t、ηR、有效功率比例系数、主机功率、转速及沉深等按numpy规则广播为样本数组
+
+    1) 各样本在 num 个盘面比上求最大航速及图谱要素；
+    2) 空泡校核所需盘面比与对角线的交点（线性插值）即为最佳盘面比，在该处重新求解；
+    3) 按航行特性的算法，用AU多项式求最大航速下的收到功率和主机功率 PS（含10%储备）。
+    返回各量的样本数组。diagnostics（SolverDiagnostics，case_shape 取样本形状）记录
+    每个样本第2步的最大航速求解、τc插值和交点状态，据此可找出退回边界值的样本；
+    交点处所需盘面比与盘面比之差超过 OPTIMUM_AREA_TOLERANCE 时记为未收敛
+    （网格较粗而所需盘面比曲线弯曲或有折点时，线性插值得到的交点可能不满足空泡要求）。
+    """
+    w, t, eta_r, pe_scale, ps, N, eta_s, hs = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (w, t, eta_r, pe_scale, ps, N, eta_s, hs)))
+    pd = ps * 0.9 * eta_s * eta_r
+    eta_h = (1 - t) / (1 - w)
+    surface = get_chart_surface(blade_count)
+
+    # 盘面比网格沿第0维展开，样本沿其余维
+    x_min, x_max = surface.area_ratio_range
+    x = np.linspace(x_min, x_max, num).reshape((num,) + (1,) * w.ndim)
+    vmax = solve_max_speed(surface, x, pd, N, w, eta_h, speeds, pes, iterations=iterations, pe_scale=pe_scale)
+    point = chart_design_point(surface, x, vmax, pd, N, w)
+    cav = calculate_cavitation(pd, N, w, vmax, point['D'], point['p_d'], point['eta0'],
+                               hs, pv, p0, source=source, rho=rho)
+
+    # 每个样本取所需盘面比曲线与对角线的第一个交点，无交点时取最接近处
+    x_full = np.broadcast_to(x, cav['AE_A0'].shape)
+    diff = cav['AE_A0'] - x_full
+    crossing = np.sign(diff[:-1]) * np.sign(diff[1:]) <= 0
+    has_crossing = crossing.any(axis=0)
+    i = np.where(has_crossing, np.argmax(crossing, axis=0), np.argmin(np.abs(diff), axis=0))
+    i_next = np.minimum(i + 1, num - 1)
+    d0 = np.take_along_axis(diff, i[None], axis=0)[0]
+    d1 = np.take_along_axis(diff, i_next[None], axis=0)[0]
+    x0 = np.take_along_axis(x_full, i[None], axis=0)[0]
+    x1 = np.take_along_axis(x_full, i_next[None], axis=0)[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frac = np.where(has_crossing & (d0 != d1), d0 / (d0 - d1), 0.0)
+    blade_ratio = x0 + frac * (x1 - x0)
+
+    vmax = solve_max_speed(surface, blade_ratio, pd, N, w, eta_h, speeds, pes,
+                           iterations=iterations, pe_scale=pe_scale, diagnostics=diagnostics)
+    point = chart_design_point(surface, blade_ratio, vmax, pd, N, w)
+    cav = calculate_cavitation(pd, N, w, vmax, point['D'], point['p_d'], point['eta0'],
+                               hs, pv, p0, source=source, rho=rho, diagnostics=diagnostics)
+    if diagnostics is not None:
+        residual = np.abs(cav['AE_A0'] - blade_ratio)
+        status = np.where(residual > OPTIMUM_AREA_TOLERANCE, solver_diagnostics.NOT_CONVERGED,
+                          solver_diagnostics.CONVERGED)
+        diagnostics.record('optimum', np.where(has_crossing, status, solver_diagnostics.NO_CROSSING),
+                           residual=residual)
+
+    # 航行特性：最大航速下按AU多项式求转矩与主机功率
+    n = N / 60.0
+    J = 0.5144 * (1 - w) * vmax / (n * point['D'])
+    _, kq = calc_kt_kq(J, point['p_d'], cav['AE_A0'], blade_count)
+    Q = kq * rho * n ** 2 * point['D'] ** 5 / 1000
+    PD = 2 * np.pi * n * Q
+    PS = PD / 0.9 / (eta_r * eta_s)
+    return {'vmax': vmax, 'D': point['D'], 'p_d': point['p_d'], 'AE_A0': cav['AE_A0'],
+            'blade_ratio': blade_ratio, 'eta0': point['eta0'], 'J': J, 'PD': PD, 'PS': PS}
+
+
+def sweep_design_chain(axes, conditions=None, outputs=('vmax', 'D', 'AE_A0', 'eta0'), chunk_size=65536,
+                       dtype=np.float64):
+    """在输入参数的全组合网格上运行设计链
+
+    axes 为 {参数名: 一维取值} 的字典，网格按字典顺序展开，其余参数由 conditions 给定
+    （未给定的取 DEFAULT_CONDITIONS）。
+    网格按线性下标分块计算，每块中间量仍为float64，块大小限制其内存；结果直接写入
+    预先分配的 dtype 数组。dtype=np.float32 时结果占用内存减半，相对float64的
+    偏差仅为单精度舍入（约1e-7相对误差），远小于图谱插值本身的精度。
+    返回各输出的网格数组，形状为各轴长度。
+    """
+    axes, shape, conditions = sweep_setup(axes, conditions)
+    result = {key: np.empty(shape, dtype=dtype) for key in outputs}
+    flat = {key: value.reshape(-1) for key, value in result.items()}
+
+    total = int(np.prod(shape))
+    for start in range(0, total, chunk_size):
+        part = sweep_chunk(axes, conditions, outputs, start, min(start + chunk_size, total))
+        for key in outputs:
+            flat[key][start:start + chunk_size] = part[key]
+    return {'axes': axes, 'outputs': result}
+
+
+def sweep_setup(axes, conditions=None):
+    """整理扫描参数：返回 (各轴float数组, 网格形状, 去掉扫描轴后补全默认值的工况)"""
+    axes = {name: np.asarray(values, dtype=float) for name, values in axes.items()}
+    shape = tuple(len(values) for values in axes.values())
+    conditions = {key: value for key, value in (DEFAULT_CONDITIONS | dict(conditions or {})).items()
+                  if key not in axes}
+    return axes, shape, conditions
+
+
+def sweep_chunk(axes, conditions, outputs, start, stop):
+    """计算网格线性下标 [start, stop) 这一块的设计链输出，参数为 sweep_setup 的结果"""
+    shape = tuple(len(values) for values in axes.values())
+    index = np.unravel_index(np.arange(start, stop), shape)
+    part = evaluate_design_chain(**{name: values[i] for (name, values), i in zip(axes.items(), index)},
+                                 **conditions)
+    return {key: part[key] for key in outputs}
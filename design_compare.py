@@ -0,0 +1,80 @@
+"""多方案对比：在工作进程中对每个方案运行完整的无界面设计流程（最佳要素、强度、质量、
+敞水曲线、航行特性），汇总对比表并给出可叠加绘制的曲线"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from propeller_core import (blade_section_integrals, calc_kt_kq, calc_open_water, calc_strength,
+                            make_pe_curve, solve_optimum_area_ratio)
+from design_records import compute_voyage
+
+# 方案的默认参数，与界面默认输入一致
+DEFAULT_DESIGN = {
+    'name': '方案', 'blade_count': 4, 'ps': 6222.0, 'N': 155.0, 'eta_s': 0.97, 'eta_r': 1.0,
+    'w': 0.35, 't': 0.21, 'speeds': (12, 13, 14, 15, 16, 17), 'pes': (1497, 1953, 2505, 3213, 4070, 5161),
+    'hs': 5.0, 'pv': 1706.0, 'p0': 101325.0, 'source': 'wag', 'rho': 1025.0,
+    'epsilon': 8.0, 'K': 1.0, 'material_rho': 8400.0,
+}
+# 对比表的行：(字段, 显示名称, 格式)
+SUMMARY_FIELDS = (
+    ('vmax', 'Vmax (kn)', '.3f'), ('D', 'D (m)', '.4f'), ('p_d', 'P/D', '.4f'), ('AE_A0', 'AE/A0', '.4f'),
+    ('eta0', 'η0', '.4f'), ('PS', 'Vmax时主机功率 (kW)', '.1f'), ('strength_margin', '最小强度余量 (mm)', '.2f'),
+    ('mass', '桨叶质量 (kg)', '.1f'), ('inertia', '极惯性矩 (kg·m²)', '.1f'),
+)
+
+
+def evaluate_design(design, j_points=61, voyage_points=21):
+    """对一个方案运行完整设计流程，返回对比汇总、敞水曲线和航行特性曲线
+
+    计算失败时返回带 'error' 的结果而不抛出异常，其余方案的对比不受影响。
+    """
+    d = dict(DEFAULT_DESIGN, **design)
+    start_time = time.perf_counter()
+    try:
+        Z = int(d['blade_count'])
+        pd = d['ps'] * 0.9 * d['eta_s'] * d['eta_r']
+        eta_h = (1 - d['t']) / (1 - d['w'])
+        optimum, _ = solve_optimum_area_ratio(Z, pd, d['N'], d['w'], eta_h, d['speeds'], d['pes'],
+                                              d['hs'], d['pv'], d['p0'], source=d['source'], rho=d['rho'])
+        D, p_d, ae_a0 = optimum['D'], optimum['p_d'], optimum['AE_A0']
+
+        strength = calc_strength(D, p_d, ae_a0, d['N'], d['eta_s'] * d['ps'], Z, epsilon=d['epsilon'], K=d['K'])
+        integrals = blade_section_integrals(D, ae_a0, Z, d['material_rho'])
+
+        J = np.linspace(0.0, 1.2, j_points)
+        kt, ten_kq, eta0 = calc_open_water(J, p_d, ae_a0, Z)
+        # KT、KQ变负后η0没有意义，置为nan使曲线在该处断开
+        eta0 = np.where((kt > 0) & (ten_kq > 0), eta0, np.nan)
+
+        v = np.linspace(min(d['speeds']), max(d['speeds']), voyage_points)
+        voyage = compute_voyage(D, p_d, ae_a0, d['w'], d['t'], d['eta_r'], d['eta_s'], [d['N']], v,
+                                lambda J, p_d, ae_a0: calc_kt_kq(J, p_d, ae_a0, Z), rho=d['rho']).data[0]
+        summary = {key: float(optimum[key]) for key in ('vmax', 'D', 'p_d', 'AE_A0', 'eta0')}
+        summary.update(PS=float(np.interp(optimum['vmax'], voyage['V'], voyage['PS'])),
+                       strength_margin=float(strength['margin'].min()),
+                       mass=float(integrals['mass']), inertia=float(integrals['inertia']))
+        return {'name': d['name'], 'blade_count': Z, 'summary': summary,
+                'open_water': {'J': J, 'KT': kt, '10KQ': ten_kq, 'eta0': eta0},
+                'voyage': voyage, 'PE': make_pe_curve(d['speeds'], d['pes'])(v),
+                'time': time.perf_counter() - start_time}
+    except Exception as e:
+        return {'name': d['name'], 'error': str(e), 'time': time.perf_counter() - start_time}
+
+
+def compare_designs(designs, workers=None):
+    """并行计算多个方案，结果顺序与输入一致；workers 取1时在本进程内计算"""
+    workers = min(workers or os.cpu_count() or 1, max(len(designs), 1))
+    if workers <= 1:
+        return [evaluate_design(design) for design in designs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(evaluate_design, designs))
+
+
+def summary_table(results):
+    """对比表文本：行为 SUMMARY_FIELDS，列为各方案"""
+    rows = []
+    for key, label, fmt in SUMMARY_FIELDS:
+        rows.append([label] + [format(r['summary'][key], fmt) if 'summary' in r else '计算失败' for r in results])
+    return rows
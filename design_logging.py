@@ -0,0 +1,73 @@
+"""日志配置：计算过程信息统一写入 'propeller' 日志器，按级别开关，可选JSON输出
+
+计算函数用 %-格式的延迟格式化记录日志，参数以字典传入，例如
+
+    logger.debug("计算参数: PD=%(PD).1fkW, N=%(N)srpm", {'PD': pd, 'N': n})
+
+级别未开启时不做任何字符串格式化；JSON输出时字典中的各项作为结构化字段写出。
+未调用 configure_logging 时日志器只挂 NullHandler，批量计算默认不输出。
+环境变量 PROPELLER_LOG_LEVEL（如 DEBUG、INFO）和 PROPELLER_LOG_JSON=1 可在不改代码时开启。
+"""
+import os
+import sys
+import json
+import logging
+from collections.abc import Mapping
+
+import numpy as np
+
+LOGGER_NAME = 'propeller'
+logging.getLogger(LOGGER_NAME).addHandler(logging.NullHandler())
+
+
+def get_logger(name=None):
+    """'propeller' 日志器或其子日志器"""
+    return logging.getLogger(LOGGER_NAME if name is None else f'{LOGGER_NAME}.{name}')
+
+
+def _plain(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (str, int, float, bool, type(None), list, dict)):
+        return value
+    return str(value)
+
+
+class JsonFormatter(logging.Formatter):
+    """每条日志输出为一行JSON：时间、级别、日志器、消息，以及字典参数中的结构化字段"""
+
+    def format(self, record):
+        entry = {'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f'.{int(record.msecs):03d}',
+                 'level': record.levelname, 'logger': record.name, 'message': record.getMessage()}
+        if isinstance(record.args, Mapping):
+            entry['fields'] = {key: _plain(value) for key, value in record.args.items()}
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def configure_logging(level=None, json_output=None, stream=None):
+    """给 'propeller' 日志器配置输出（重复调用时替换原有输出），返回该日志器
+
+    level 默认取环境变量 PROPELLER_LOG_LEVEL，未设置时为 WARNING；
+    json_output 默认取环境变量 PROPELLER_LOG_JSON。
+    """
+    if level is None:
+        level = os.environ.get('PROPELLER_LOG_LEVEL', 'WARNING')
+    if json_output is None:
+        json_output = os.environ.get('PROPELLER_LOG_JSON', '') in ('1', 'true', 'yes')
+
+    logger = get_logger()
+    for handler in list(logger.handlers):
+        if getattr(handler, '_propeller_handler', False):
+            logger.removeHandler(handler)
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler._propeller_handler = True
+    handler.setFormatter(JsonFormatter() if json_output else
+                         logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+    return logger
@@ -0,0 +1,119 @@
+"""设计结果记录：标量结果用 __slots__ 记录，成批结果用numpy结构化数组，
+界面、批量计算与导出共用同一套字段定义"""
+import numpy as np
+
+
+class Record:
+    """__slots__ 标量结果记录，字段固定，可按属性或字段名取值（与原字典用法兼容）"""
+    __slots__ = ()
+
+    def __init__(self, **values):
+        unknown = set(values) - set(self.__slots__)
+        if unknown:
+            raise TypeError(f"{type(self).__name__} 没有字段: {', '.join(sorted(unknown))}")
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """由字典或结构化数组的一行构造，只取本记录的字段"""
+        names = mapping.dtype.names if isinstance(mapping, np.void) else mapping.keys()
+        return cls(**{name: mapping[name] for name in cls.__slots__ if name in names})
+
+    def __getitem__(self, name):
+        if name not in self.__slots__:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __contains__(self, name):
+        return name in self.__slots__ and getattr(self, name) is not None
+
+    def get(self, name, default=None):
+        return getattr(self, name) if name in self else default
+
+    def keys(self):
+        return [name for name in self.__slots__ if name in self]
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.keys()}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.as_dict().items())})"
+
+
+class DesignInputs(Record):
+    """最大航速计算的输入工况：主机功率、收到功率、转速、伴流、推力减额、各效率及PE曲线"""
+    __slots__ = ('Ps', 'PD', 'N', 'w', 't', 'eta_H', 'eta_s', 'eta_r', 'speeds', 'pes')
+
+
+class DesignPoint(Record):
+    """一个螺旋桨设计点：最大航速、直径、螺距比、盘面比、敞水效率（最佳要素另有图谱盘面比）"""
+    __slots__ = ('vmax', 'D', 'p_d', 'AE_A0', 'eta0', 'blade_ratio')
+
+
+# 空泡校核结果，每个图谱型号一行
+CAVITATION_DTYPE = np.dtype([('type', 'U16'), ('PD', 'f8'), ('vmax', 'f8'), ('p_d', 'f8'), ('D', 'f8'),
+                             ('eta0', 'f8'), ('VA', 'f8'), ('omega', 'f8'), ('V_0_7R_sq', 'f8'),
+                             ('sigma', 'f8'), ('tau_c', 'f8'), ('T', 'f8'), ('AE_A0', 'f8')])
+
+# 航行特性结果，(转速, 航速) 二维
+VOYAGE_FIELDS = ('V', 'VA', 'J', 'KT', 'KQ', 'T', 'PTE', 'Q', 'PD', 'PS')
+VOYAGE_DTYPE = np.dtype([(name, 'f8') for name in VOYAGE_FIELDS])
+
+
+class VoyageResults:
+    """各转速下的航行特性，data 为形状 (转速数, 航速数) 的结构化数组
+
+    按 'N=...rpm' 标签迭代时与原先以标签为键的字典用法一致，每个标签对应一行结构化数组。
+    """
+    __slots__ = ('rpms', 'data')
+
+    def __init__(self, rpms, data):
+        self.rpms = np.asarray(rpms, dtype=float)
+        self.data = np.asarray(data, dtype=VOYAGE_DTYPE)
+
+    def labels(self):
+        return [f'N={n}rpm' for n in self.rpms.tolist()]
+
+    def keys(self):
+        return self.labels()
+
+    def items(self):
+        return zip(self.labels(), self.data)
+
+    def __getitem__(self, label):
+        return self.data[self.labels().index(label)]
+
+    def __len__(self):
+        return len(self.rpms)
+
+    def __bool__(self):
+        return len(self.rpms) > 0
+
+
+def compute_voyage(D, p_d, ae_a0, w, t, eta_r, eta_s, rpms, speeds, kt_kq, rho=1025.0, j_max=1.5):
+    """向量化计算各转速、各航速下的航行特性
+
+    kt_kq(J, p_d, ae_a0) 返回 (KT, KQ) 数组，负值按0计；J 限制在 [0, j_max]。
+    PD 含10%功率储备，PS = PD/0.9/(ηR·ηS)。
+    """
+    rpms = np.asarray(rpms, dtype=float)
+    speeds = np.asarray(speeds, dtype=float)
+    n_rps = (rpms / 60.0)[:, None]
+    v = np.broadcast_to(speeds[None, :], (len(rpms), len(speeds)))
+
+    data = np.empty(v.shape, dtype=VOYAGE_DTYPE)
+    data['V'] = v
+    data['VA'] = 0.5144 * (1 - w) * v
+    valid = (n_rps > 0) & (D > 0)
+    J = np.where(valid, data['VA'] / np.where(valid, n_rps * D, 1.0), 0.0)
+    data['J'] = np.clip(J, 0.0, j_max)
+    kt, kq = kt_kq(data['J'], p_d, ae_a0)
+    data['KT'] = np.maximum(kt, 0.0)
+    data['KQ'] = np.maximum(kq, 0.0)
+    data['T'] = data['KT'] * rho * n_rps ** 2 * D ** 4 / 1000
+    data['PTE'] = data['T'] * (1 - t) * 0.5144 * v
+    data['Q'] = data['KQ'] * rho * n_rps ** 2 * D ** 5 / 1000
+    data['PD'] = 2 * np.pi * n_rps * data['Q']
+    data['PS'] = data['PD'] / 0.9 / (eta_r * eta_s)
+    return VoyageResults(rpms, data)
@@ -0,0 +1,391 @@
+"""本机JSON-HTTP设计服务：供其他程序调用无界面设计核心
+
+POST /<接口名> 提交一个参数字典或参数字典列表，返回对应的结果（列表）；
+GET /metrics 返回各接口的请求数、批次数、平均批量、延迟分位数与吞吐量；GET /health 检查服务状态。
+接口：max_speed、cavitation、optimum、strength、mass、mooring、voyage。
+
+同一接口短时间内到达的请求合并为一批（micro-batching），按共享参数分组后一次送入向量化计算，
+批次在进程池中执行。服务只监听本机地址，不依赖网络。
+
+    python design_service.py --port 8765
+    client = DesignClient('http://127.0.0.1:8765'); client.call('optimum', ps=7000)
+"""
+import os
+import json
+import time
+import argparse
+import threading
+import urllib.request
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from propeller_core import (get_chart_surface, solve_max_speed, chart_design_point, calculate_cavitation,
+                            calc_strength, blade_section_integrals, calc_bollard_pull, calc_kt_kq)
+from design_chain import DEFAULT_CONDITIONS, evaluate_design_chain
+from design_records import compute_voyage
+
+PE_DEFAULTS = {'speeds': DEFAULT_CONDITIONS['speeds'], 'pes': DEFAULT_CONDITIONS['pes']}
+HULL_DEFAULTS = {'ps': 6222.0, 'N': 155.0, 'eta_s': 0.97, 'eta_r': 1.0, 'w': 0.35, 't': 0.21}
+CAVITATION_DEFAULTS = {'hs': 5.0, 'pv': 1706.0, 'p0': 101325.0, 'source': 'wag', 'rho': 1025.0}
+
+
+def _max_speed(a, shared):
+    surface = get_chart_surface(shared['blade_count'])
+    pd = a['ps'] * 0.9 * a['eta_s'] * a['eta_r']
+    eta_h = (1 - a['t']) / (1 - a['w'])
+    vmax = solve_max_speed(surface, a['ae_a0'], pd, a['N'], a['w'], eta_h, shared['speeds'], shared['pes'])
+    point = chart_design_point(surface, a['ae_a0'], vmax, pd, a['N'], a['w'])
+    return {'vmax': vmax, 'PD': pd, 'p_d': point['p_d'], 'delta': point['delta'], 'D': point['D'],
+            'eta0': point['eta0']}
+
+
+def _cavitation(a, shared):
+    return calculate_cavitation(a['pd'], a['N'], a['w'], a['vmax'], a['D'], a['p_d'], a['eta0'], a['hs'],
+                                a['pv'], a['p0'], source=shared['source'], rho=a['rho'])
+
+
+def _optimum(a, shared):
+    return evaluate_design_chain(a['w'], a['t'], a['eta_r'], ps=a['ps'], N=a['N'], eta_s=a['eta_s'],
+                                 hs=a['hs'], speeds=shared['speeds'], pes=shared['pes'],
+                                 blade_count=shared['blade_count'], pv=a['pv'], p0=a['p0'],
+                                 source=shared['source'], rho=a['rho'])
+
+
+def _strength(a, shared):
+    result = calc_strength(a['D'], a['p_d'], a['ae_a0'], a['N'], a['eta_s'] * a['ps'], shared['blade_count'],
+                           epsilon=a['epsilon'], K=a['K'])
+    stations = np.broadcast_to(result['stations'], result['margin'].shape)
+    return {'stations': stations, 't_req': result['t_req'], 't_std': result['t_std'],
+            't_actual': result['t_actual'], 'margin': result['margin'], 'ok': result['ok']}
+
+
+def _mass(a, shared):
+    result = blade_section_integrals(a['D'], a['ae_a0'], shared['blade_count'], a['material_rho'])
+    return {'mass': result['mass'], 'inertia': result['inertia']}
+
+
+def _mooring(a, shared):
+    return calc_bollard_pull(a['ps'], a['N'], a['D'], a['p_d'], a['ae_a0'], a['t0'], shared['blade_count'],
+                             eta_s=a['eta_s'], eta_r=a['eta_r'], rho=a['rho'])
+
+
+def _voyage(a, shared):
+    # 各请求的转速、航速序列长度可以不同，逐个计算后按对象数组返回
+    Z = shared['blade_count']
+    out = np.empty(len(a['D']), dtype=object)
+    for i in range(len(out)):
+        voyage = compute_voyage(a['D'][i], a['p_d'][i], a['ae_a0'][i], a['w'][i], a['t'][i], a['eta_r'][i],
+                                a['eta_s'][i], shared['rpms'][i], shared['voyage_speeds'][i],
+                                lambda J, p_d, ae_a0: calc_kt_kq(J, p_d, ae_a0, Z), rho=a['rho'][i])
+        out[i] = {'labels': voyage.labels(), **{name: voyage.data[name] for name in voyage.data.dtype.names}}
+    return {'voyage': out}
+
+
+# 接口定义：(默认参数, 分组用的共享参数, 批量计算函数)；共享参数相同的请求合成数组一起计算
+ENDPOINTS = {
+    'max_speed': ({'blade_count': 4, 'ae_a0': 0.55, **HULL_DEFAULTS, **PE_DEFAULTS},
+                  ('blade_count', 'speeds', 'pes'), _max_speed),
+    'cavitation': ({'pd': 5431.806, 'N': 155.0, 'w': 0.35, 'vmax': 15.5, 'D': 4.8, 'p_d': 0.67, 'eta0': 0.55,
+                    **CAVITATION_DEFAULTS}, ('source',), _cavitation),
+    'optimum': ({'blade_count': 4, **HULL_DEFAULTS, **PE_DEFAULTS, **CAVITATION_DEFAULTS},
+                ('blade_count', 'speeds', 'pes', 'source'), _optimum),
+    'strength': ({'blade_count': 4, 'D': 4.8, 'p_d': 0.67, 'ae_a0': 0.49, 'N': 155.0, 'ps': 6222.0,
+                  'eta_s': 0.97, 'epsilon': 8.0, 'K': 1.0}, ('blade_count',), _strength),
+    'mass': ({'blade_count': 4, 'D': 4.8, 'ae_a0': 0.49, 'material_rho': 8400.0}, ('blade_count',), _mass),
+    'mooring': ({'blade_count': 4, 'ps': 6222.0, 'N': 155.0, 'D': 4.8, 'p_d': 0.67, 'ae_a0': 0.49, 't0': 0.0,
+                 'eta_s': 0.97, 'eta_r': 1.0, 'rho': 1025.0}, ('blade_count',), _mooring),
+    'voyage': ({'blade_count': 4, 'D': 4.8, 'p_d': 0.67, 'ae_a0': 0.49, 'w': 0.35, 't': 0.21, 'eta_r': 1.0,
+                'eta_s': 0.97, 'rho': 1025.0, 'rpms': (165.0, 155.0, 145.0),
+                'voyage_speeds': (12, 13, 14, 15, 16, 17)}, ('blade_count',), _voyage),
+}
+# voyage 的序列参数逐请求使用，不参与分组
+_PER_ITEM_SEQUENCES = ('rpms', 'voyage_speeds')
+
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {k: _to_json(v) for k, v in value.items()}
+    return value
+
+
+def _hashable(value):
+    return tuple(_hashable(v) for v in value) if isinstance(value, (list, tuple)) else value
+
+
+def run_batch(endpoint, items):
+    """计算一批请求（在工作进程中执行），返回与 items 等长的结果列表
+
+    请求按共享参数分组，每组的其余参数拼成数组后调用一次向量化函数。
+    某组计算出错时改为逐个计算，只有出错的请求返回 {'error': ...}。
+    """
+    defaults, shared_keys, func = ENDPOINTS[endpoint]
+    params = []
+    for item in items:
+        unknown = set(item) - set(defaults)
+        params.append({'error': f"未知参数: {', '.join(sorted(unknown))}"} if unknown else dict(defaults, **item))
+
+    groups = {}
+    for i, p in enumerate(params):
+        if 'error' not in p:
+            groups.setdefault(tuple(_hashable(p[k]) for k in shared_keys), []).append(i)
+
+    results = [p if 'error' in p else None for p in params]
+
+    def evaluate(indices):
+        shared = {k: params[indices[0]][k] for k in shared_keys}
+        shared.update({k: [params[i][k] for i in indices] for k in _PER_ITEM_SEQUENCES if k in defaults})
+        arrays = {k: np.array([params[i][k] for i in indices], dtype=float)
+                  for k in defaults if k not in shared_keys and k not in _PER_ITEM_SEQUENCES}
+        out = func(arrays, shared)
+        for n, i in enumerate(indices):
+            results[i] = {k: _to_json(np.asarray(v)[n] if np.ndim(v) else v) for k, v in out.items()}
+
+    for indices in groups.values():
+        try:
+            evaluate(indices)
+        except Exception:
+            for i in indices:
+                try:
+                    evaluate([i])
+                except Exception as e:
+                    results[i] = {'error': str(e)}
+    return results
+
+
+class EndpointMetrics:
+    """单个接口的统计：请求数、批次数、错误数及最近请求的延迟
+
+    批处理线程和各请求线程都会更新计数，读写均在锁内进行。
+    """
+
+    def __init__(self, window=2000):
+        self.requests = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=window)
+        self.lock = threading.Lock()
+
+    def record_batch(self, size):
+        with self.lock:
+            self.batches += 1
+            self.batched_items += size
+
+    def record_request(self, items, errors, latency):
+        with self.lock:
+            self.requests += items
+            self.errors += errors
+            self.latencies.append(latency)
+
+    def snapshot(self, uptime):
+        with self.lock:
+            requests, batches, batched_items, errors = self.requests, self.batches, self.batched_items, self.errors
+            lat = np.array(self.latencies) * 1000 if self.latencies else np.zeros(1)
+        return {'requests': requests, 'batches': batches, 'errors': errors,
+                'mean_batch_size': batched_items / batches if batches else 0.0,
+                'latency_ms': {'mean': float(lat.mean()), 'p50': float(np.percentile(lat, 50)),
+                               'p95': float(np.percentile(lat, 95)), 'max': float(lat.max())},
+                'throughput_per_s': requests / uptime if uptime > 0 else 0.0}
+
+
+class DesignHTTPServer(ThreadingHTTPServer):
+    """每个连接一个线程的HTTP服务器，监听队列加长到128
+
+    默认队列长度5，几十个客户端同时连接时会被拒绝（ConnectionResetError）。
+    """
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class MicroBatcher:
+    """把同一接口短时间内到达的请求合成一批，交给进程池计算
+
+    第一个请求到达后最多等待 max_delay 秒或凑满 max_batch 个请求即提交一批。
+    """
+
+    def __init__(self, endpoint, executor, metrics, max_batch=256, max_delay=0.005):
+        self.endpoint = endpoint
+        self.executor = executor
+        self.metrics = metrics
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.pending = []
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def submit(self, items):
+        """提交若干请求，返回各请求的 Future"""
+        futures = [Future() for _ in items]
+        with self.condition:
+            self.pending.extend(zip(items, futures))
+            self.condition.notify()
+        return futures
+
+    def _loop(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                deadline = time.perf_counter() + self.max_delay
+                while len(self.pending) < self.max_batch:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                batch, self.pending = self.pending[:self.max_batch], self.pending[self.max_batch:]
+            self.metrics.record_batch(len(batch))
+            done = self.executor.submit(run_batch, self.endpoint, [item for item, _ in batch])
+            done.add_done_callback(lambda f, batch=batch: self._resolve(f, batch))
+
+    @staticmethod
+    def _resolve(done, batch):
+        try:
+            results = done.result()
+        except Exception as e:
+            results = [{'error': str(e)}] * len(batch)
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+class DesignService:
+    """设计服务：进程池、各接口的批处理器与统计"""
+
+    def __init__(self, host='127.0.0.1', port=8765, workers=None, max_batch=256, max_delay=0.005):
+        self.executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self.metrics = {name: EndpointMetrics() for name in ENDPOINTS}
+        self.batchers = {name: MicroBatcher(name, self.executor, self.metrics[name], max_batch, max_delay)
+                         for name in ENDPOINTS}
+        self.start_time = time.perf_counter()
+        self.server = DesignHTTPServer((host, port), self._handler_class())
+
+    @property
+    def address(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def metrics_snapshot(self):
+        uptime = time.perf_counter() - self.start_time
+        return {'uptime_s': uptime, 'endpoints': {name: m.snapshot(uptime) for name, m in self.metrics.items()}}
+
+    def handle(self, endpoint, payload):
+        """处理一次请求：单个参数字典返回单个结果，列表返回结果列表"""
+        single = isinstance(payload, dict)
+        items = [payload] if single else list(payload)
+        if not all(isinstance(item, dict) for item in items):
+            raise ValueError("请求体应为参数字典或参数字典列表")
+        start = time.perf_counter()
+        results = [future.result() for future in self.batchers[endpoint].submit(items)]
+        self.metrics[endpoint].record_request(len(items), sum('error' in r for r in results),
+                                              time.perf_counter() - start)
+        return results[0] if single else results
+
+    def _handler_class(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, body):
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path == '/metrics':
+                    self._reply(200, service.metrics_snapshot())
+                elif self.path == '/health':
+                    self._reply(200, {'status': 'ok', 'endpoints': sorted(ENDPOINTS)})
+                else:
+                    self._reply(404, {'error': f"未知路径: {self.path}"})
+
+            def do_POST(self):
+                endpoint = self.path.strip('/')
+                if endpoint not in ENDPOINTS:
+                    self._reply(404, {'error': f"未知接口: {endpoint}"})
+                    return
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    payload = json.loads(self.rfile.read(length) or b'{}')
+                    self._reply(200, service.handle(endpoint, payload))
+                except (ValueError, TypeError) as e:
+                    self._reply(400, {'error': str(e)})
+
+            def log_message(self, format, *args):
+                # 批量调用时不逐条输出访问日志
+                pass
+
+        return Handler
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def start(self):
+        """在后台线程中运行，返回服务地址（测试与嵌入使用）"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self.address
+
+    def shutdown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+class DesignClient:
+    """设计服务的简单客户端"""
+
+    def __init__(self, base_url='http://127.0.0.1:8765', timeout=60.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def _request(self, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode('utf-8')
+        request = urllib.request.Request(self.base_url + path, data=data,
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def call(self, endpoint, **params):
+        """调用一个接口，参数未给出时取服务端默认值"""
+        return self._request(f'/{endpoint}', params)
+
+    def call_many(self, endpoint, items):
+        """一次提交多组参数，返回结果列表"""
+        return self._request(f'/{endpoint}', list(items))
+
+    def metrics(self):
+        return self._request('/metrics')
+
+    def health(self):
+        return self._request('/health')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="螺旋桨设计本机JSON服务")
+    parser.add_argument('--host', default='127.0.0.1', help="监听地址，默认只监听本机")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None, help="计算进程数，默认CPU核数")
+    parser.add_argument('--max-batch', type=int, default=256, help="每批最多请求数")
+    parser.add_argument('--max-delay', type=float, default=5.0, help="凑批最长等待时间 (ms)")
+    args = parser.parse_args()
+
+    service = DesignService(args.host, args.port, args.workers, args.max_batch, args.max_delay / 1000)
+    print(f"设计服务已启动: {service.address}，接口: {', '.join(sorted(ENDPOINTS))}")
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.shutdown()
+
+
+if __name__ == '__main__':
+    main()
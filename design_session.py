@@ -0,0 +1,107 @@
+"""设计会话文件：把全部输入和各阶段计算结果保存为一个npz压缩文件，重新打开时无需重算
+
+文件中的键按 '类别/名称' 组织：
+    input/<控件名>        输入框等控件的文本
+    text/<控件名>         结果文本框内容
+    table/<表格名>        表格单元格文本（二维字符串数组），另有 .../header、.../vheader
+    res/<字段>、opt_res/<字段>、optimum_results/<字段>   DesignInputs、DesignPoint 记录
+    cavitation_results    空泡校核结构化数组
+    voyage/rpms、voyage/data                            航行特性
+    mass_details/<字段>   质量计算各站数组
+    voyage_intersections  航行特性交点结构化数组
+不使用pickle，读取时 allow_pickle=False。
+"""
+import numpy as np
+
+from design_records import DesignInputs, DesignPoint, CAVITATION_DTYPE, VoyageResults
+
+SESSION_VERSION = 1
+RECORDS = {'res': DesignInputs, 'opt_res': DesignPoint, 'optimum_results': DesignPoint}
+INTERSECTION_DTYPE = np.dtype([('rpm', 'U32'), ('state', 'U32'), ('speed', 'f8'), ('pte', 'f8'),
+                               ('pe', 'f8'), ('ps', 'f8'), ('color', 'U16')])
+
+
+def _strings(values):
+    """字符串数组（空数组时也保持Unicode类型）"""
+    return np.array(values, dtype=str) if len(values) else np.zeros(0, dtype='U1')
+
+
+def save_session(path, inputs, texts, tables, state):
+    """保存会话
+
+    inputs、texts 为 {控件名: 文本}；tables 为 {表格名: (单元格, 水平表头, 垂直表头)}；
+    state 为各阶段结果：res、opt_res、optimum_results、cavitation_results、
+    voyage_results、mass_details、voyage_intersections，未计算的阶段为 None 或空。
+    """
+    data = {'version': np.array(SESSION_VERSION)}
+    for name, value in inputs.items():
+        data[f'input/{name}'] = np.array(value, dtype=str)
+    for name, value in texts.items():
+        data[f'text/{name}'] = np.array(value, dtype=str)
+    for name, (cells, header, vheader) in tables.items():
+        data[f'table/{name}'] = np.array(cells, dtype=str).reshape(len(cells), -1) if len(cells) else \
+            np.zeros((0, 0), dtype='U1')
+        data[f'table/{name}/header'] = _strings(header)
+        data[f'table/{name}/vheader'] = _strings(vheader)
+
+    for key in RECORDS:
+        record = state.get(key)
+        if record is not None:
+            for name, value in record.as_dict().items():
+                data[f'{key}/{name}'] = np.asarray(value, dtype=float)
+    if state.get('cavitation_results') is not None:
+        data['cavitation_results'] = np.asarray(state['cavitation_results'], dtype=CAVITATION_DTYPE)
+    voyage = state.get('voyage_results')
+    if voyage:
+        data['voyage/rpms'] = voyage.rpms
+        data['voyage/data'] = voyage.data
+    for name, value in (state.get('mass_details') or {}).items():
+        data[f'mass_details/{name}'] = np.asarray(value)
+    points = state.get('voyage_intersections') or []
+    data['voyage_intersections'] = np.array(
+        [tuple(point[name] for name in INTERSECTION_DTYPE.names) for point in points], dtype=INTERSECTION_DTYPE)
+    np.savez_compressed(path, **data)
+
+
+def _value(array):
+    """0维数组还原为标量，一维数组还原为列表"""
+    return array.item() if array.ndim == 0 else array.tolist()
+
+
+def load_session(path):
+    """读取会话，返回 (inputs, texts, tables, state)，格式与 save_session 的参数相同"""
+    inputs, texts, tables = {}, {}, {}
+    state = {key: None for key in RECORDS}
+    state.update(cavitation_results=None, voyage_results=None, mass_details={}, voyage_intersections=[])
+    records = {key: {} for key in RECORDS}
+
+    with np.load(path, allow_pickle=False) as data:
+        version = int(data['version']) if 'version' in data.files else 0
+        if version > SESSION_VERSION:
+            raise ValueError(f"会话文件版本 {version} 高于程序支持的版本 {SESSION_VERSION}")
+        for key in data.files:
+            kind, _, name = key.partition('/')
+            if kind == 'input':
+                inputs[name] = str(data[key])
+            elif kind == 'text':
+                texts[name] = str(data[key])
+            elif kind == 'table' and '/' not in name:
+                tables[name] = (data[key].tolist(), data[f'{key}/header'].tolist(),
+                                data[f'{key}/vheader'].tolist())
+            elif kind in records:
+                records[kind][name] = _value(data[key])
+            elif kind == 'mass_details':
+                value = data[key]
+                state['mass_details'][name] = value.tolist() if value.dtype.kind == 'U' else value
+        if 'cavitation_results' in data.files:
+            state['cavitation_results'] = data['cavitation_results']
+        if 'voyage/data' in data.files:
+            state['voyage_results'] = VoyageResults(data['voyage/rpms'], data['voyage/data'])
+        if 'voyage_intersections' in data.files:
+            state['voyage_intersections'] = [{name: _value(row[name]) for name in INTERSECTION_DTYPE.names}
+                                             for row in data['voyage_intersections']]
+
+    for key, cls in RECORDS.items():
+        if records[key]:
+            state[key] = cls(**records[key])
+    return inputs, texts, tables, state
@@ -0,0 +1,241 @@
+"""标准算例库：一组参考设计（界面默认的6222 kW/155 rpm算例及若干油船、散货船、拖轮，
+4叶与5叶系列）各计算阶段的期望输出，兼作性能基准
+
+    python golden_cases.py            # 逐例重算并与 golden_cases.json 比较数值和耗时
+    python golden_cases.py --update   # 重新生成期望输出（确认结果变化是有意为之时使用）
+
+任何为提速而修改计算核心的工作都应先保证本检查通过，即结果没有变化。
+耗时为各阶段多次重复中的最短时间，超过记录值的 time_factor 倍（另加少量余量）时报告变慢；
+不同机器的耗时不可直接比较，换机器后应先 --update 建立新的基准。
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+
+import numpy as np
+
+from propeller_core import (get_chart_surface, solve_max_speed, chart_design_point, calculate_cavitation,
+                            solve_optimum_area_ratio, calc_strength, blade_section_integrals,
+                            calc_pitch_correction, calc_bollard_pull, calc_open_water, calc_kt_kq)
+from design_records import compute_voyage
+from design_compare import DEFAULT_DESIGN
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden_cases.json')
+GOLDEN_VERSION = 1
+
+
+def _pe_curve(speeds, coefficient):
+    """按 PE = c·V³ 生成有效功率曲线（取整到kW）"""
+    return [round(coefficient * v ** 3) for v in speeds]
+
+
+# 船型：(名称, 说明, 主机功率kW, 转速rpm, w, t, 航速kn, PE系数, 沉深m)
+SHIPS = (
+    ('default', '界面默认算例', 6222.0, 155.0, 0.35, 0.21, (12, 13, 14, 15, 16, 17), None, 5.0),
+    ('tanker_small', '小型成品油船', 5500.0, 130.0, 0.38, 0.22, (11, 12, 13, 14, 15, 16), 1.1, 5.0),
+    ('tanker_mr', 'MR型油船', 9000.0, 110.0, 0.40, 0.23, (12, 13, 14, 15, 16, 17), 1.6, 6.0),
+    ('tanker_aframax', '阿芙拉型油船', 13500.0, 95.0, 0.42, 0.24, (12, 13, 14, 15, 16, 17), 2.4, 7.0),
+    ('bulker_handy', '灵便型散货船', 7000.0, 120.0, 0.36, 0.21, (11, 12, 13, 14, 15, 16), 1.4, 5.5),
+    ('bulker_panamax', '巴拿马型散货船', 10500.0, 100.0, 0.39, 0.22, (11, 12, 13, 14, 15, 16), 2.1, 6.5),
+    ('tug_harbour', '港作拖轮', 2400.0, 220.0, 0.20, 0.15, (8, 9, 10, 11, 12, 13), 0.9, 3.0),
+    ('tug_ocean', '远洋拖轮', 4200.0, 170.0, 0.22, 0.16, (9, 10, 11, 12, 13, 14), 0.9, 3.5),
+)
+
+
+def build_cases():
+    """展开为算例列表，每种船型分别计算4叶和5叶系列"""
+    cases = []
+    for name, title, ps, N, w, t, speeds, coefficient, hs in SHIPS:
+        pes = list(DEFAULT_DESIGN['pes']) if coefficient is None else _pe_curve(speeds, coefficient)
+        for Z in (4, 5):
+            cases.append(dict(DEFAULT_DESIGN, name=f'{name}_z{Z}', title=f'{title}（{Z}叶）', blade_count=Z,
+                              ps=ps, N=N, w=w, t=t, speeds=list(speeds), pes=pes, hs=hs))
+    return cases
+
+
+CASES = build_cases()
+
+
+def _stage_max_speed(d, ctx):
+    surface = get_chart_surface(d['blade_count'])
+    ae_a0 = surface.area_ratios
+    vmax = solve_max_speed(surface, ae_a0, ctx['pd'], d['N'], d['w'], ctx['eta_h'], d['speeds'], d['pes'])
+    point = chart_design_point(surface, ae_a0, vmax, ctx['pd'], d['N'], d['w'])
+    ctx['series'] = dict(point, vmax=vmax)
+    return {'vmax': vmax, 'p_d': point['p_d'], 'delta': point['delta'], 'D': point['D'], 'eta0': point['eta0']}
+
+
+def _stage_cavitation(d, ctx):
+    s = ctx['series']
+    cav = calculate_cavitation(ctx['pd'], d['N'], d['w'], s['vmax'], s['D'], s['p_d'], s['eta0'],
+                               d['hs'], d['pv'], d['p0'], source=d['source'], rho=d['rho'])
+    return {key: cav[key] for key in ('sigma', 'tau_c', 'T', 'AE_A0')}
+
+
+def _stage_optimum(d, ctx):
+    optimum, _ = solve_optimum_area_ratio(d['blade_count'], ctx['pd'], d['N'], d['w'], ctx['eta_h'],
+                                          d['speeds'], d['pes'], d['hs'], d['pv'], d['p0'],
+                                          source=d['source'], rho=d['rho'])
+    ctx['optimum'] = optimum
+    return optimum
+
+
+def _stage_strength(d, ctx):
+    o = ctx['optimum']
+    result = calc_strength(o['D'], o['p_d'], o['AE_A0'], d['N'], d['eta_s'] * d['ps'], d['blade_count'],
+                           epsilon=d['epsilon'], K=d['K'])
+    return {key: result[key] for key in ('t_req', 't_std', 'margin')}
+
+
+def _stage_mass(d, ctx):
+    o = ctx['optimum']
+    result = blade_section_integrals(o['D'], o['AE_A0'], d['blade_count'], d['material_rho'])
+    return {key: result[key] for key in ('sum_4x5', 'sum_6x7', 'sum_6x8', 'mass', 'inertia')}
+
+
+def _stage_pitch(d, ctx):
+    o = ctx['optimum']
+    result = calc_pitch_correction(0.18, o['D'], o['p_d'], o['AE_A0'], o['vmax'], d['N'], d['w'],
+                                   d['blade_count'])
+    return {key: result[key] for key in ('delta_PoD_t', 'delta_PoD', 'p_d_corrected')}
+
+
+def _stage_mooring(d, ctx):
+    o = ctx['optimum']
+    result = calc_bollard_pull(d['ps'], d['N'], o['D'], o['p_d'], o['AE_A0'], 0.0, d['blade_count'],
+                               eta_s=d['eta_s'], eta_r=d['eta_r'], rho=d['rho'])
+    return {key: result[key] for key in ('T', 'Q', 'n_mooring', 'KT0', 'KQ0')}
+
+
+def _stage_open_water(d, ctx):
+    o = ctx['optimum']
+    J = np.linspace(0.0, 1.2, 25)
+    kt, ten_kq, eta0 = calc_open_water(J, o['p_d'], o['AE_A0'], d['blade_count'])
+    return {'KT': kt, '10KQ': ten_kq, 'eta0': eta0}
+
+
+def _stage_voyage(d, ctx):
+    o = ctx['optimum']
+    Z = d['blade_count']
+    voyage = compute_voyage(o['D'], o['p_d'], o['AE_A0'], d['w'], d['t'], d['eta_r'], d['eta_s'],
+                            [d['N'], 0.9 * d['N'], 0.8 * d['N']], d['speeds'],
+                            lambda J, p_d, ae_a0: calc_kt_kq(J, p_d, ae_a0, Z), rho=d['rho'])
+    return {key: voyage.data[key] for key in ('J', 'T', 'PTE', 'PS')}
+
+
+# 计算阶段按顺序执行，后面的阶段使用前面阶段放入 ctx 的结果
+STAGES = (
+    ('max_speed', _stage_max_speed), ('cavitation', _stage_cavitation), ('optimum', _stage_optimum),
+    ('strength', _stage_strength), ('mass', _stage_mass), ('pitch', _stage_pitch),
+    ('mooring', _stage_mooring), ('open_water', _stage_open_water), ('voyage', _stage_voyage),
+)
+
+
+def run_case(case, repeat=3):
+    """依次计算各阶段，返回 (各阶段输出, 各阶段耗时)；耗时取 repeat 次中的最短值"""
+    d = dict(DEFAULT_DESIGN, **case)
+    ctx = {'pd': d['ps'] * 0.9 * d['eta_s'] * d['eta_r'], 'eta_h': (1 - d['t']) / (1 - d['w'])}
+    outputs, times = {}, {}
+    for name, stage in STAGES:
+        best = np.inf
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            result = stage(d, ctx)
+            best = min(best, time.perf_counter() - start)
+        outputs[name] = {key: np.asarray(value, dtype=float).tolist() for key, value in result.items()}
+        times[name] = best
+    return outputs, times
+
+
+def _warm_up():
+    """预先建立图谱曲面缓存（及numba编译），避免首个算例的耗时偏大"""
+    for case in CASES[:2]:
+        run_case(case, repeat=1)
+
+
+def update_golden(path=GOLDEN_PATH, repeat=3):
+    """重新计算全部算例并写入期望输出文件"""
+    _warm_up()
+    cases = {}
+    for case in CASES:
+        outputs, times = run_case(case, repeat)
+        cases[case['name']] = {'inputs': case, 'outputs': outputs, 'times': times}
+    golden = {'version': GOLDEN_VERSION, 'machine': platform.platform(), 'python': platform.python_version(),
+              'numpy': np.__version__, 'cases': cases}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(golden, f, ensure_ascii=False, indent=1)
+    return golden
+
+
+def check_golden(path=GOLDEN_PATH, rtol=1e-9, atol=1e-9, time_factor=2.0, time_slack=0.002, repeat=3):
+    """逐例重算并与期望输出比较
+
+    返回报告列表，每个算例一项：name、各阶段最大相对偏差 errors、数值不符的阶段 mismatched、
+    变慢的阶段 slow（当前耗时, 记录耗时）、总耗时 time 与记录总耗时 golden_time。
+    """
+    with open(path, encoding='utf-8') as f:
+        golden = json.load(f)
+    _warm_up()
+    report = []
+    for name, expected in golden['cases'].items():
+        outputs, times = run_case(expected['inputs'], repeat)
+        entry = {'name': name, 'errors': {}, 'mismatched': [], 'slow': {},
+                 'time': sum(times.values()), 'golden_time': sum(expected['times'].values())}
+        for stage, values in expected['outputs'].items():
+            worst = 0.0
+            ok = stage in outputs and set(outputs[stage]) == set(values)
+            for key, reference in values.items() if ok else ():
+                actual, reference = np.asarray(outputs[stage][key]), np.asarray(reference)
+                if actual.shape != reference.shape or not np.allclose(actual, reference, rtol=rtol, atol=atol,
+                                                                      equal_nan=True):
+                    ok = False
+                if actual.shape == reference.shape:
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        rel = np.abs(actual - reference) / np.maximum(np.abs(reference), atol)
+                    worst = max(worst, float(np.nanmax(rel, initial=0.0)))
+            entry['errors'][stage] = worst
+            if not ok:
+                entry['mismatched'].append(stage)
+            limit = expected['times'].get(stage, np.inf) * time_factor + time_slack
+            if times.get(stage, 0.0) > limit:
+                entry['slow'][stage] = (times[stage], expected['times'][stage])
+        report.append(entry)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="标准算例回归检查与性能基准")
+    parser.add_argument('--update', action='store_true', help="重新生成期望输出")
+    parser.add_argument('--path', default=GOLDEN_PATH)
+    parser.add_argument('--rtol', type=float, default=1e-9)
+    parser.add_argument('--time-factor', type=float, default=2.0, help="耗时超过记录值的倍数时报告变慢")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.update:
+        golden = update_golden(args.path, args.repeat)
+        print(f"已写入 {len(golden['cases'])} 个算例到 {args.path}")
+        return 0
+
+    report = check_golden(args.path, rtol=args.rtol, time_factor=args.time_factor, repeat=args.repeat)
+    failed = 0
+    for entry in report:
+        worst = max(entry['errors'].values(), default=0.0)
+        status = '数值不符' if entry['mismatched'] else ('变慢' if entry['slow'] else '通过')
+        print(f"{entry['name']:<20} {status:<4} 最大相对偏差 {worst:.1e}  "
+              f"耗时 {entry['time'] * 1000:7.2f} ms（基准 {entry['golden_time'] * 1000:7.2f} ms）")
+        for stage in entry['mismatched']:
+            print(f"    {stage}: 最大相对偏差 {entry['errors'][stage]:.2e}")
+        for stage, (now, before) in entry['slow'].items():
+            print(f"    {stage}: {now * 1000:.2f} ms，基准 {before * 1000:.2f} ms")
+        failed += bool(entry['mismatched'])
+    total = sum(entry['time'] for entry in report)
+    print(f"{len(report)} 个算例，{failed} 个数值不符，总耗时 {total * 1000:.1f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
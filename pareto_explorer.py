@@ -0,0 +1,237 @@
+"""多目标方案探索：批量评价大量候选方案（叶数、AE/A0、D、P/D、N），
+求 η0、Vmax、空泡裕度、桨叶质量与极惯性矩的Pareto前沿"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.stats import qmc
+
+from propeller_core import blade_section_integrals, get_chart_surface
+from propeller_optimizer import evaluate_designs
+
+# 目标名称及方向（1为越大越好，-1为越小越好）
+OBJECTIVES = (('eta0', 1), ('vmax', 1), ('cav_margin', 1), ('mass', -1), ('inertia', -1))
+# ε-支配的分辨率：目标差别小于该值的方案视为等价，只保留一个，以控制前沿规模
+DEFAULT_EPSILONS = {'eta0': 0.005, 'vmax': 0.05, 'cav_margin': 0.02, 'mass': 50.0, 'inertia': 200.0}
+
+
+def evaluate_population(Z, D, p_d, ae_a0, N, conditions):
+    """批量评价一组候选方案，返回目标值字典及可行性
+
+    conditions 为 evaluate_designs 所需的工况参数字典，另可含材料密度 material_rho。
+    可行方案要求功率、强度约束满足、所需盘面比不超过实际盘面比，
+    且平衡航速不低于PE曲线的最低航速（低于时航速被截断，无法比较）。
+    """
+    Z = np.asarray(Z, dtype=int)
+    conditions = dict(conditions)
+    material_rho = conditions.pop('material_rho', 8400.0)
+    out = {name: np.zeros(Z.shape) for name, _ in OBJECTIVES}
+    feasible = np.zeros(Z.shape, dtype=bool)
+    # 多项式系数随叶数不同，按叶数分组向量化计算
+    for z in np.unique(Z):
+        idx = Z == z
+        result = evaluate_designs(D[idx], p_d[idx], ae_a0[idx], N[idx], int(z), **conditions)
+        integrals = blade_section_integrals(D[idx], ae_a0[idx], int(z), material_rho)
+        out['eta0'][idx] = result['eta0']
+        out['vmax'][idx] = result['vmax']
+        ae_req = result['AE_req']
+        out['cav_margin'][idx] = np.where(ae_req > 0, ae_a0[idx] / np.where(ae_req > 0, ae_req, 1.0) - 1, 0.0)
+        out['mass'][idx] = integrals['mass']
+        out['inertia'][idx] = integrals['inertia']
+        feasible[idx] = result['feasible'] & (result['vmax'] > min(conditions['speeds'])) & (ae_req > 0)
+    return out, feasible
+
+
+def _evaluate_chunk(args):
+    """进程池任务：评价一块方案，只返回可行方案"""
+    designs, conditions = args
+    out, feasible = evaluate_population(designs['Z'], designs['D'], designs['p_d'],
+                                        designs['ae_a0'], designs['N'], conditions)
+    return ({key: value[feasible] for key, value in designs.items()},
+            {key: value[feasible] for key, value in out.items()})
+
+
+def objective_matrix(objectives):
+    """把目标字典转换为统一求最小的矩阵"""
+    return np.stack([-sign * np.asarray(objectives[name], dtype=float) for name, sign in OBJECTIVES], axis=-1)
+
+
+def dominated_by(front, points, block=2048):
+    """points 中被 front 任一点支配的掩码（各列均为越小越好）
+
+    逐列累积比较结果，避免生成 (前沿数, 点数, 目标数) 的三维数组。
+    """
+    mask = np.zeros(len(points), dtype=bool)
+    if len(front) == 0:
+        return mask
+    for start in range(0, len(points), block):
+        p = points[start:start + block]
+        no_worse = np.ones((len(front), len(p)), dtype=bool)
+        better = np.zeros((len(front), len(p)), dtype=bool)
+        for k in range(points.shape[1]):
+            f_k, p_k = front[:, k, None], p[None, :, k]
+            no_worse &= f_k <= p_k
+            better |= f_k < p_k
+        mask[start:start + block] = np.any(no_worse & better, axis=0)
+    return mask
+
+
+def non_dominated(points, block=1024):
+    """返回非劣解的布尔掩码（各列均为越小越好）
+
+    按目标字典序排序后分块处理：排在后面的点不可能严格支配前面的点，
+    因此每块只需与已确定的前沿和块内其他点比较。
+    """
+    points = np.asarray(points, dtype=float)
+    order = np.lexsort(points.T[::-1])
+    front = np.zeros(0, dtype=np.intp)
+    for start in range(0, len(order), block):
+        cand = order[start:start + block]
+        cand = cand[~dominated_by(points[front], points[cand])]
+        cand = cand[~dominated_by(points[cand], points[cand])]
+        front = np.concatenate([front, cand])
+    mask = np.zeros(len(points), dtype=bool)
+    mask[front] = True
+    return mask
+
+
+class ParetoArchive:
+    """增量维护的ε-非劣解集：目标按ε划分网格，每个网格最多保留一个方案
+
+    新的一批方案先在批内求ε-非劣解，再与已有前沿互相比较，已有前沿不必重新筛选。
+    五个目标的前沿规模随取样增多而迅速增大，超过 max_size 时按1.5倍放大ε重新筛选。
+    """
+
+    def __init__(self, epsilons=None, max_size=5000):
+        eps = dict(DEFAULT_EPSILONS, **(epsilons or {}))
+        self.epsilons = np.array([eps[name] for name, _ in OBJECTIVES], dtype=float)
+        self.max_size = max_size
+        self.designs = None
+        self.objectives = None
+        self.boxes = None
+
+    def __len__(self):
+        return 0 if self.designs is None else len(self.designs['D'])
+
+    def add(self, designs, objectives):
+        if len(designs['D']) == 0:
+            return
+        self._merge(designs, objectives)
+        while len(self) > self.max_size:
+            self.epsilons = self.epsilons * 1.5
+            designs, objectives = self.designs, self.objectives
+            self.designs = self.objectives = self.boxes = None
+            self._merge(designs, objectives)
+
+    def _merge(self, designs, objectives):
+        points = objective_matrix(objectives) / self.epsilons
+        boxes = np.floor(points)
+        # 同一网格内保留最靠近网格角点的方案，再求批内非劣解
+        distance = np.linalg.norm(points - boxes, axis=-1)
+        order = np.lexsort((distance, *boxes.T[::-1]))
+        _, first = np.unique(boxes[order], axis=0, return_index=True)
+        keep = order[first]
+        keep = keep[non_dominated(boxes[keep])]
+
+        if self.boxes is not None:
+            # 已占用的网格保留原方案；被前沿支配的新方案淘汰，被新方案支配的旧方案移除
+            occupied = {tuple(b) for b in self.boxes}
+            keep = keep[[tuple(b) not in occupied for b in boxes[keep]]]
+            keep = keep[~dominated_by(self.boxes, boxes[keep])]
+            survivors = ~dominated_by(boxes[keep], self.boxes)
+            designs = {k: np.concatenate([self.designs[k][survivors], v[keep]]) for k, v in designs.items()}
+            objectives = {k: np.concatenate([self.objectives[k][survivors], v[keep]])
+                          for k, v in objectives.items()}
+            self.boxes = np.concatenate([self.boxes[survivors], boxes[keep]])
+        else:
+            designs = {k: v[keep] for k, v in designs.items()}
+            objectives = {k: v[keep] for k, v in objectives.items()}
+            self.boxes = boxes[keep]
+        self.designs, self.objectives = designs, objectives
+
+
+def _sample_designs(u, blade_counts, limits):
+    """由 [0,1] 样本生成方案，盘面比范围随叶数变化"""
+    Z = np.asarray(blade_counts)[np.minimum((u[:, 0] * len(blade_counts)).astype(int), len(blade_counts) - 1)]
+    designs = {'Z': Z}
+    for k, name in enumerate(('D', 'p_d', 'N'), start=1):
+        lo, hi = limits[name]
+        designs[name] = lo + u[:, k] * (hi - lo)
+    ae_lo = np.array([limits['ae_a0'][z][0] for z in Z])
+    ae_hi = np.array([limits['ae_a0'][z][1] for z in Z])
+    designs['ae_a0'] = ae_lo + u[:, 4] * (ae_hi - ae_lo)
+    return designs
+
+
+def _design_to_unit(designs, blade_counts, limits):
+    """方案映射回 [0,1] 空间，供下一代变异"""
+    u = np.empty((len(designs['D']), 5))
+    u[:, 0] = (np.searchsorted(blade_counts, designs['Z']) + 0.5) / len(blade_counts)
+    for k, name in enumerate(('D', 'p_d', 'N'), start=1):
+        lo, hi = limits[name]
+        u[:, k] = (designs[name] - lo) / (hi - lo) if hi > lo else 0.5
+    ae_lo = np.array([limits['ae_a0'][z][0] for z in designs['Z']])
+    ae_hi = np.array([limits['ae_a0'][z][1] for z in designs['Z']])
+    u[:, 4] = (designs['ae_a0'] - ae_lo) / (ae_hi - ae_lo)
+    return u
+
+
+def explore_pareto(conditions, D_max, N, blade_counts=(4, 5), population=100000, generations=3,
+                   n_range=(0.8, 1.2), bounds=None, chunk_size=16384, workers=None, sigma=0.08,
+                   epsilons=None, max_front=5000, seed=0):
+    """分代探索Pareto前沿
+
+    第0代在整个设计空间内用Sobol序列取样，以后各代在当前前沿附近高斯变异取样；
+    每代方案分块交给进程池并行评价，评价结果按分块顺序并入非劣解集，
+    同一 seed 的结果与进程数无关。
+    workers 为进程数，取1时在本进程内计算；epsilons 为各目标的初始ε-支配分辨率，
+    前沿超过 max_front 个方案时自动放大。
+    返回前沿方案、目标值及统计信息。
+    """
+    start_time = time.perf_counter()
+    blade_counts = np.array(sorted(blade_counts))
+    limits = {'D': (0.4 * D_max, D_max), 'p_d': (0.5, 1.4), 'N': (n_range[0] * N, n_range[1] * N),
+              'ae_a0': {int(z): get_chart_surface(int(z)).area_ratio_range for z in blade_counts}}
+    limits.update(bounds or {})
+    workers = workers or os.cpu_count() or 1
+    rng = np.random.default_rng(seed)
+    sobol = qmc.Sobol(d=5, seed=seed)
+    archive = ParetoArchive(epsilons, max_front)
+    evaluations, feasible_count = 0, 0
+    history = []
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for generation in range(generations):
+            if generation == 0 or len(archive) == 0:
+                # Sobol序列按2的整数次幂取点，再截取所需数量
+                u = sobol.random_base2(int(np.ceil(np.log2(population))))[:population]
+            else:
+                parents = _design_to_unit(archive.designs, blade_counts, limits)
+                u = parents[rng.integers(len(parents), size=population)]
+                scale = sigma / (1 + generation)
+                u = np.clip(u + rng.normal(0.0, scale, u.shape), 0.0, 1.0 - 1e-9)
+                # 少量个体随机换叶数
+                switch = rng.random(population) < 0.1
+                u[switch, 0] = rng.random(switch.sum())
+            designs = _sample_designs(u, blade_counts, limits)
+
+            chunks = [({k: v[i:i + chunk_size] for k, v in designs.items()}, conditions)
+                      for i in range(0, population, chunk_size)]
+            # 非劣解集的合并与顺序有关，须按分块顺序并入
+            results = map(_evaluate_chunk, chunks) if executor is None else executor.map(_evaluate_chunk, chunks)
+            for chunk_designs, chunk_objectives in results:
+                feasible_count += len(chunk_designs['D'])
+                archive.add(chunk_designs, chunk_objectives)
+
+            evaluations += population
+            history.append({'generation': generation, 'front_size': len(archive),
+                            'epsilons': dict(zip((name for name, _ in OBJECTIVES), archive.epsilons.tolist())),
+                            'time': time.perf_counter() - start_time})
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return {'designs': archive.designs, 'objectives': archive.objectives, 'evaluations': evaluations,
+            'feasible': feasible_count, 'history': history, 'time': time.perf_counter() - start_time}
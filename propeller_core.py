@@ -0,0 +1,764 @@
+"""船用螺旋桨图谱设计核心计算模块（不依赖Qt界面，可供批量计算调用）"""
+from functools import lru_cache
+
+import numpy as np
+from scipy.interpolate import Akima1DInterpolator, CubicSpline
+
+import propeller_kernels
+import solver_diagnostics
+
+# ---------- 全局常量 ----------
+SIGMA_WAG = [0.1136, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0, 1.488]
+TAU_C_WAG = [0.0777, 0.135, 0.1582, 0.1846, 0.206, 0.2304, 0.2633, 0.2876, 0.34]
+SIGMA_BER = [0.36, 0.389, 0.407, 0.416, 0.481, 0.54, 0.6, 0.7, 0.806, 0.834, 0.848, 0.9, 1.82]
+TAU_C_BER = [0.14, 0.162, 0.164, 0.169, 0.175, 0.190, 0.200, 0.223, 0.224, 0.227, 0.228, 0.251, 0.35]
+# 最大航速求解的收敛容差：PTE-PE残差不超过PE最大值的此比例
+MAX_SPEED_TOLERANCE = 1e-6
+# 最佳盘面比的收敛容差：最佳点处所需盘面比与盘面比之差超过此值时记为未收敛
+OPTIMUM_AREA_TOLERANCE = 0.005
+
+# MAU系列各半径处的厚度、宽度百分比及面积系数
+MAU_THICKNESS = {'0.2R': 4.06, '0.3R': 3.59, '0.4R': 3.12, '0.5R': 2.65,
+                 '0.6R': 2.18, '0.7R': 1.71, '0.8R': 1.24, '0.9R': 0.77, '1.0R': 0.30}
+MAU_WIDTH = {'0.2R': 66.54, '0.3R': 77.70, '0.4R': 87.08, '0.5R': 94.34,
+             '0.6R': 99.11, '0.7R': 99.64, '0.8R': 92.92, '0.9R': 73.62, '1.0R': 0.0}
+SIMPSON_COEFF = {'0.2R': 1, '0.3R': 4, '0.4R': 2, '0.5R': 4, '0.6R': 2,
+                 '0.7R': 4, '0.8R': 2, '0.9R': 4, '1.0R': 1}
+AREA_COEFF = {'0.2R': 0.674, '0.3R': 0.674, '0.4R': 0.674, '0.5R': 0.6745,
+              '0.6R': 0.6745, '0.7R': 0.677, '0.8R': 0.683, '0.9R': 0.695, '1.0R': 0.700}
+MAU_STATIONS = np.array([float(key[:-1]) for key in MAU_THICKNESS])  # r/R
+MAU_THICKNESS_PCT = np.array(list(MAU_THICKNESS.values()))
+MAU_WIDTH_PCT = np.array(list(MAU_WIDTH.values()))
+
+# 规范强度校核系数 K1~K8，按半径列表
+STRENGTH_RULE_STATIONS = np.array([0.25, 0.6])
+STRENGTH_RULE_COEFFS = np.array([
+    [634, 250, 1410, 4, 82, 34, 41, 380],  # 0.25R
+    [207, 151, 635, 34, 23, 12, 65, 330],  # 0.6R
+], dtype=float)
+
+
+# MAU螺旋桨系数管理类
+class AUCoefficients:
+    """AU螺旋桨系数管理类"""
+
+    def __init__(self):
+        # 4叶桨KT系数表
+        self.kt_coeffs_4 = [
+            {'value': -0.2536277E-01, 'i': 0, 'j': 0, 'k': 0},
+            {'value': -0.2072556E+00, 'i': 0, 'j': 1, 'k': 0},
+            {'value': 0.5724472E+00, 'i': 1, 'j': 0, 'k': 0},
+            {'value': 0.1939063E+00, 'i': 2, 'j': 0, 'k': 3},
+            {'value': -0.2890781E+00, 'i': 0, 'j': 2, 'k': 2},
+            {'value': -0.1074432E+01, 'i': 1, 'j': 2, 'k': 2},
+            {'value': -0.2131741E+00, 'i': 2, 'j': 0, 'k': 0},
+            {'value': 0.2703334E+00, 'i': 2, 'j': 0, 'k': 1},
+            {'value': 0.1870137E-01, 'i': 3, 'j': 1, 'k': 0},
+            {'value': 0.9646077E+00, 'i': 0, 'j': 3, 'k': 3},
+            {'value': -0.2029306E+00, 'i': 0, 'j': 4, 'k': 3},
+            {'value': 0.1305797E-02, 'i': 7, 'j': 0, 'k': 1},
+            {'value': -0.5234681E-01, 'i': 0, 'j': 0, 'k': 1},
+            {'value': -0.1710635E+00, 'i': 0, 'j': 2, 'k': 0},
+            {'value': 0.7317558E+00, 'i': 1, 'j': 2, 'k': 1},
+            {'value': -0.1049158E+00, 'i': 1, 'j': 0, 'k': 2},
+            {'value': 0.6117029E-01, 'i': 5, 'j': 1, 'k': 3},
+            {'value': -0.1214246E+00, 'i': 0, 'j': 3, 'k': 1},
+            {'value': -0.5872456E-02, 'i': 7, 'j': 2, 'k': 1},
+            {'value': -0.1525986E+00, 'i': 1, 'j': 1, 'k': 1},
+            {'value': 0.1006423E-02, 'i': 7, 'j': 4, 'k': 1},
+            {'value': -0.8940443E-01, 'i': 4, 'j': 0, 'k': 3}
+        ]
+
+        # 4叶桨KQ系数表
+        self.kq_coeffs_4 = [
+            {'value': 0.3899004E-01, 'i': 0, 'j': 0, 'k': 0},
+            {'value': 0.2886616E+00, 'i': 2, 'j': 0, 'k': 0},
+            {'value': 0.9977187E-01, 'i': 1, 'j': 1, 'k': 0},
+            {'value': 0.7850744E+00, 'i': 2, 'j': 0, 'k': 1},
+            {'value': 0.1847187E+00, 'i': 0, 'j': 2, 'k': 2},
+            {'value': -0.6893466E-01, 'i': 3, 'j': 0, 'k': 0},
+            {'value': 0.9402823E+00, 'i': 0, 'j': 3, 'k': 3},
+            {'value': -0.4649396E+00, 'i': 1, 'j': 2, 'k': 2},
+            {'value': -0.5417402E+00, 'i': 0, 'j': 4, 'k': 3},
+            {'value': 0.1052512E+00, 'i': 3, 'j': 2, 'k': 1},
+            {'value': -0.3419544E+00, 'i': 1, 'j': 0, 'k': 3},
+            {'value': -0.2585986E+00, 'i': 0, 'j': 4, 'k': 0},
+            {'value': 0.3239788E-01, 'i': 6, 'j': 1, 'k': 1},
+            {'value': -0.5742804E-01, 'i': 2, 'j': 3, 'k': 0},
+            {'value': -0.7892603E+00, 'i': 1, 'j': 1, 'k': 1},
+            {'value': -0.5324799E+00, 'i': 0, 'j': 2, 'k': 1},
+            {'value': 0.4870383E-02, 'i': 3, 'j': 3, 'k': 0},
+            {'value': 0.3483905E+00, 'i': 1, 'j': 4, 'k': 1},
+            {'value': 0.3204546E-01, 'i': 4, 'j': 3, 'k': 0},
+            {'value': 0.5473935E-02, 'i': 7, 'j': 4, 'k': 3},
+            {'value': 0.1084547E-01, 'i': 5, 'j': 0, 'k': 1},
+            {'value': -0.1448536E+00, 'i': 4, 'j': 3, 'k': 1},
+            {'value': 0.2210349E+00, 'i': 1, 'j': 3, 'k': 0},
+            {'value': -0.5244457E-01, 'i': 4, 'j': 1, 'k': 0},
+            {'value': 0.3545902E+00, 'i': 0, 'j': 1, 'k': 3},
+            {'value': -0.1878683E-01, 'i': 6, 'j': 0, 'k': 2}
+        ]
+
+        # 5叶桨KT系数表
+        self.kt_coeffs_5 = [
+            {'value': 0.5367018E-01, 'i': 0, 'j': 0, 'k': 0},
+            {'value': -0.3023566E+00, 'i': 0, 'j': 1, 'k': 0},
+            {'value': 0.4333625E+00, 'i': 1, 'j': 0, 'k': 0},
+            {'value': -0.1065471E+00, 'i': 0, 'j': 2, 'k': 1},
+            {'value': -0.6582904E+00, 'i': 2, 'j': 0, 'k': 3},
+            {'value': 0.1189101E+00, 'i': 1, 'j': 3, 'k': 1},
+            {'value': -0.4408557E-03, 'i': 6, 'j': 0, 'k': 0},
+            {'value': -0.3317857E-01, 'i': 1, 'j': 4, 'k': 1},
+            {'value': 0.1151124E+01, 'i': 2, 'j': 0, 'k': 2},
+            {'value': 0.1960773E+00, 'i': 0, 'j': 0, 'k': 3},
+            {'value': -0.9747062E-01, 'i': 3, 'j': 0, 'k': 1},
+            {'value': 0.2036384E+00, 'i': 1, 'j': 1, 'k': 0},
+            {'value': -0.2566153E+00, 'i': 1, 'j': 1, 'k': 1},
+            {'value': -0.1370242E+00, 'i': 0, 'j': 2, 'k': 0},
+            {'value': -0.2874294E+00, 'i': 0, 'j': 0, 'k': 2},
+            {'value': -0.2854609E+00, 'i': 2, 'j': 0, 'k': 1}
+        ]
+
+        # 5叶桨KQ系数表
+        self.kq_coeffs_5 = [
+            {'value': -0.9251390E-01, 'i': 0, 'j': 0, 'k': 0},
+            {'value': -0.1229000E+00, 'i': 2, 'j': 0, 'k': 0},
+            {'value': 0.3050697E+00, 'i': 1, 'j': 1, 'k': 0},
+            {'value': -0.2935303E+00, 'i': 0, 'j': 2, 'k': 0},
+            {'value': -0.3991474E+00, 'i': 2, 'j': 0, 'k': 1},
+            {'value': -0.1022050E+01, 'i': 1, 'j': 1, 'k': 1},
+            {'value': 0.1022833E-01, 'i': 7, 'j': 0, 'k': 0},
+            {'value': 0.3521100E-02, 'i': 1, 'j': 0, 'k': 3},
+            {'value': 0.2552059E-02, 'i': 5, 'j': 2, 'k': 0},
+            {'value': 0.2143532E+00, 'i': 0, 'j': 1, 'k': 3},
+            {'value': 0.7131110E-03, 'i': 4, 'j': 4, 'k': 0},
+            {'value': 0.2078488E+00, 'i': 1, 'j': 2, 'k': 1},
+            {'value': 0.6397058E+00, 'i': 1, 'j': 0, 'k': 0},
+            {'value': 0.9404846E-03, 'i': 7, 'j': 1, 'k': 0},
+            {'value': -0.2930044E-01, 'i': 0, 'j': 1, 'k': 1},
+            {'value': -0.7807623E-01, 'i': 0, 'j': 4, 'k': 0},
+            {'value': -0.3025523E+00, 'i': 2, 'j': 2, 'k': 3},
+            {'value': 0.1855105E+00, 'i': 1, 'j': 3, 'k': 1},
+            {'value': -0.6724210E+00, 'i': 2, 'j': 1, 'k': 2},
+            {'value': -0.2087142E+00, 'i': 4, 'j': 0, 'k': 3},
+            {'value': 0.9400654E+00, 'i': 3, 'j': 0, 'k': 1},
+            {'value': 0.9316346E+00, 'i': 2, 'j': 1, 'k': 3},
+            {'value': -0.4348397E-01, 'i': 6, 'j': 0, 'k': 0}
+        ]
+
+        # 当前选中的系数表
+        self.current_kt_coeffs = self.kt_coeffs_4
+        self.current_kq_coeffs = self.kq_coeffs_4
+
+    def update_coefficients_by_blade_count(self, blade_count):
+        """根据桨叶数更新当前系数表"""
+        if blade_count == 4:
+            self.current_kt_coeffs = self.kt_coeffs_4
+            self.current_kq_coeffs = self.kq_coeffs_4
+            return True
+        elif blade_count == 5:
+            self.current_kt_coeffs = self.kt_coeffs_5
+            self.current_kq_coeffs = self.kq_coeffs_5
+            return True
+        else:
+            return False
+
+
+class AUPolynomial:
+    """AU系列KT/10KQ多项式的数组形式，用于向量化求值"""
+
+    def __init__(self, coeffs):
+        self.values = np.array([c['value'] for c in coeffs])
+        self.i = np.array([c['i'] for c in coeffs])  # P/D 指数
+        self.j = np.array([c['j'] for c in coeffs])  # J 指数
+        self.k = np.array([c['k'] for c in coeffs])  # AE/A0 指数
+
+    def __call__(self, J, p_d, ae_a0):
+        """求多项式值，参数按numpy规则广播"""
+        J, p_d, ae_a0 = np.broadcast_arrays(np.asarray(J, dtype=float),
+                                            np.asarray(p_d, dtype=float),
+                                            np.asarray(ae_a0, dtype=float))
+        if propeller_kernels.enabled():
+            return propeller_kernels.au_polynomial(self.values, self.i, self.j, self.k, J, p_d, ae_a0)
+        # 预先计算各变量的幂次，逐项累加以控制内存
+        pd_pow = [np.ones_like(p_d)]
+        for _ in range(self.i.max()):
+            pd_pow.append(pd_pow[-1] * p_d)
+        j_pow = [np.ones_like(J)]
+        for _ in range(self.j.max()):
+            j_pow.append(j_pow[-1] * J)
+        ae_pow = [np.ones_like(ae_a0)]
+        for _ in range(self.k.max()):
+            ae_pow.append(ae_pow[-1] * ae_a0)
+
+        result = np.zeros_like(J)
+        for value, i, j, k in zip(self.values, self.i, self.j, self.k):
+            result += value * pd_pow[i] * j_pow[j] * ae_pow[k]
+        return result
+
+
+_AU = AUCoefficients()
+AU_POLYNOMIALS = {
+    4: (AUPolynomial(_AU.kt_coeffs_4), AUPolynomial(_AU.kq_coeffs_4)),
+    5: (AUPolynomial(_AU.kt_coeffs_5), AUPolynomial(_AU.kq_coeffs_5)),
+}
+
+
+def calc_kt_kq(J, p_d, ae_a0, blade_count):
+    """向量化计算AU系列的KT和KQ（未截断负值）"""
+    if blade_count not in AU_POLYNOMIALS:
+        raise ValueError(f"暂不支持{blade_count}叶桨的计算")
+    kt_poly, kq_poly = AU_POLYNOMIALS[blade_count]
+    return kt_poly(J, p_d, ae_a0), kq_poly(J, p_d, ae_a0) / 10.0
+
+
+def calc_open_water(J, p_d, ae_a0, blade_count):
+    """计算敞水性能曲线，返回 (KT, 10KQ, η0)"""
+    kt, kq = calc_kt_kq(J, p_d, ae_a0, blade_count)
+    J = np.broadcast_to(np.asarray(J, dtype=float), kt.shape)
+    valid = (J != 0) & (kq != 0)
+    eta0 = np.where(valid, kt * J / (2 * np.pi * np.where(valid, kq, 1.0)), 0.0)
+    return kt, 10.0 * kq, eta0
+
+
+@lru_cache(maxsize=4096)
+def bollard_coefficients(blade_count, p_d, ae_a0):
+    """系柱工况 (J=0) 的 KT0、KQ0，按 (叶数, P/D, AE/A0) 缓存"""
+    kt, kq = calc_kt_kq(0.0, p_d, ae_a0, blade_count)
+    return float(kt), float(kq)
+
+
+def bollard_pull(ps, n, D, kt0, kq0, t0=0.0, eta_s=0.97, eta_r=1.0, rho=1025.0):
+    """由J=0系数向量化计算系柱推力、转矩与系柱转速，参数按numpy规则广播
+
+    返回字典：PD(kW)、Q(kN·m)、T(kN)、T_eff(扣除推力减额后的系柱拉力, kN)、n_mooring(rpm)
+    """
+    ps, n, D, kt0, kq0, t0 = np.broadcast_arrays(*(np.asarray(a, dtype=float)
+                                                   for a in (ps, n, D, kt0, kq0, t0)))
+    pd = ps * eta_r * eta_s
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Q = np.where(n > 0, pd / (2 * np.pi * n / 60), 0.0)
+        T = np.where((kq0 > 0) & (D > 0), kt0 / kq0 * Q / D, 0.0)
+        ok = (D > 0) & (kt0 > 0) & (T > 0)
+        n_mooring = np.where(ok, 60 * np.sqrt(T * 1000 / (rho * D ** 4 * kt0)), 0.0)
+    return {'PD': pd, 'Q': Q, 'T': T, 'T_eff': T * (1 - t0), 'n_mooring': n_mooring}
+
+
+def calc_bollard_pull(ps, n, D, p_d, ae_a0, t0=0.0, blade_count=4, eta_s=0.97, eta_r=1.0, rho=1025.0):
+    """批量系柱计算：Ps、转速、直径、P/D、AE/A0、推力减额均可为数组（如拖轮系柱拉力图）"""
+    p_d, ae_a0 = np.broadcast_arrays(np.asarray(p_d, dtype=float), np.asarray(ae_a0, dtype=float))
+    # 只对不同的 (P/D, AE/A0) 组合求一次J=0系数
+    pairs, inverse = np.unique(np.stack([p_d.ravel(), ae_a0.ravel()], axis=-1), axis=0, return_inverse=True)
+    coeffs = np.array([bollard_coefficients(blade_count, float(a), float(b)) for a, b in pairs])
+    kt0 = coeffs[inverse.ravel(), 0].reshape(p_d.shape)
+    kq0 = coeffs[inverse.ravel(), 1].reshape(p_d.shape)
+    result = bollard_pull(ps, n, D, kt0, kq0, t0, eta_s=eta_s, eta_r=eta_r, rho=rho)
+    result['KT0'] = kt0
+    result['KQ0'] = kq0
+    return result
+
+
+def strength_coefficients(stations):
+    """各半径处的规范系数 K1~K8，形状 (半径数, 8)
+
+    规范只给出0.25R和0.6R的系数，其余半径按 r/R 线性插值、两端取端点值，仅供方案筛选参考。
+    """
+    stations = np.atleast_1d(np.asarray(stations, dtype=float))
+    return np.stack([np.interp(stations, STRENGTH_RULE_STATIONS, column)
+                     for column in STRENGTH_RULE_COEFFS.T], axis=-1)
+
+
+def calc_strength(D, p_d, ae_a0, ne, Ne, blade_count=4, epsilon=8.0, K=1.0, G=7.6,
+                  stations=STRENGTH_RULE_STATIONS):
+    """向量化强度校核：多个方案 × 多个半径一次求出规范所需厚度与MAU标准厚度
+
+    D、P/D、AE/A0、转速ne、功率Ne等参数按numpy规则广播为方案数组，
+    结果各项形状为 方案形状 + (半径数,)，margin = 标准厚度 - 所需厚度 (mm)。
+    """
+    stations = np.atleast_1d(np.asarray(stations, dtype=float))
+    D, p_d, ae_a0, ne, Ne, Z, epsilon, K = (
+        a[..., None] for a in np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+            D, p_d, ae_a0, ne, Ne, blade_count, epsilon, K))))
+    K1, K2, K3, K4, K5, K6, K7, K8 = strength_coefficients(stations).T
+
+    # 弦长：0.66R处最大宽度乘以各半径的MAU宽度百分比
+    b_66 = (0.226 * D * ae_a0) / (0.1 * Z)
+    b = b_66 * np.interp(stations, MAU_STATIONS, MAU_WIDTH_PCT) / 100
+    t_std = np.interp(stations, MAU_STATIONS, MAU_THICKNESS_PCT) * D * 10
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        D_P = np.where(p_d > 0, 1.0 / p_d, 0.0)
+        A1 = D_P * (K1 - K2 * D_P) + K3 * D_P - K4
+        Y = np.where(Z * b * ne > 0, (1.36 * A1 * Ne) / (Z * b * ne), 0.0)
+        A2 = D_P * (K5 + K6 * epsilon) + K7 * epsilon + K8
+        X = np.where(Z * b > 0, (A2 * G * ae_a0 * ne ** 2 * D ** 3) / (1e10 * Z * b), 0.0)
+        t_req = np.where((K - X > 0) & (Y > 0), np.sqrt(Y / (K - X)), 0.0)
+
+    A1, Y, A2, X, t_req, t_std, b = np.broadcast_arrays(A1, Y, A2, X, t_req, t_std, b)
+    margin = t_std - t_req
+    return {'stations': stations, 'b': b, 'A1': A1, 'Y': Y, 'A2': A2, 'X': X,
+            't_req': t_req, 't_std': t_std, 't_actual': np.maximum(t_std, t_req),
+            'margin': margin, 'ok': margin >= 0}
+
+
+def simpson_coefficients(num):
+    """辛普森系数 1, 4, 2, ..., 4, 1，站数须为奇数"""
+    if num < 3 or num % 2 == 0:
+        raise ValueError("辛普森积分的站数必须为不小于3的奇数")
+    sm = np.full(num, 2.0)
+    sm[1::2] = 4.0
+    sm[0] = sm[-1] = 1.0
+    return sm
+
+
+def mau_offsets(stations):
+    """各半径处的MAU厚度百分比、宽度百分比和面积系数，非表列半径用三次样条插值"""
+    stations = np.asarray(stations, dtype=float)
+    if stations.shape == MAU_STATIONS.shape and np.allclose(stations, MAU_STATIONS):
+        return MAU_THICKNESS_PCT, MAU_WIDTH_PCT, np.array(list(AREA_COEFF.values()))
+    t_pct = CubicSpline(MAU_STATIONS, MAU_THICKNESS_PCT)(stations)
+    b_pct = np.maximum(CubicSpline(MAU_STATIONS, MAU_WIDTH_PCT)(stations), 0.0)
+    ka = CubicSpline(MAU_STATIONS, list(AREA_COEFF.values()))(stations)
+    return t_pct, b_pct, ka
+
+
+def blade_section_integrals(D, ae_a0, blade_count=4, rho=8400.0, num=9):
+    """辛普森法计算桨叶切面面积的各阶矩，D、AE/A0、叶数按numpy规则广播为方案数组
+
+    num为0.2R~1.0R之间的站数（奇数），默认9站即每0.1R一站；加密时按步长折算，
+    使各列求和与0.1R间距的表格可以直接比较。返回各站数组、求和以及由此积分得到的
+    桨叶质量 (kg) 与桨叶质量惯性矩 (kg·m²)。
+    """
+    stations = np.linspace(0.2, 1.0, num)
+    t_pct, b_pct, ka = mau_offsets(stations)
+    D, ae_a0, Z, rho = (a[..., None] for a in np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (D, ae_a0, blade_count, rho))))
+
+    b_ref = 0.226 * D * ae_a0 / (0.1 * Z)  # 0.66R处弦长
+    b_t = (b_pct / 100.0 * b_ref) * (t_pct / 100.0 * D)
+    section_area = b_t * ka
+    sm = simpson_coefficients(num) * (stations[1] - stations[0]) / 0.1
+    col_4x5 = section_area * sm
+    col_6x7 = col_4x5 * stations
+    col_6x8 = col_4x5 * stations ** 2
+
+    # 沿半径积分：dr = 0.1R·(辛普森求和)/3
+    sum_4x5 = section_area @ sm
+    sum_6x7 = section_area @ (sm * stations)
+    sum_6x8 = section_area @ (sm * stations ** 2)
+    R = D[..., 0] / 2
+    mass = rho[..., 0] * Z[..., 0] * 0.1 * R / 3 * sum_4x5
+    inertia = rho[..., 0] * Z[..., 0] * 0.1 * R ** 3 / 3 * sum_6x8
+    return {'r_R': stations, 'Ka': ka, 'SM': sm, 'b_t': b_t, 'section_area': section_area,
+            'col_4x5': col_4x5, 'col_6x7': col_6x7, 'col_6x8': col_6x8,
+            'sum_4x5': sum_4x5, 'sum_6x7': sum_6x7, 'sum_6x8': sum_6x8,
+            'mass': mass, 'inertia': inertia}
+
+
+def calc_pitch_correction(dh_D, D, p_d, ae_a0, vmax, N, w, blade_count=4):
+    """向量化螺距修正：厚度修正与毂径比修正，参数按numpy规则广播
+
+    返回字典，包含各中间量、Δ(P/D)ₜ、Δ(P/D)ₕ、总修正量及修正后螺距比。
+    """
+    dh_D, D, p_d, ae_a0, vmax, N, w, Z = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+        dh_D, D, p_d, ae_a0, vmax, N, w, blade_count)))
+    t_02 = MAU_THICKNESS['0.2R'] / 100.0 * D * 1000  # mm
+    t_06 = MAU_THICKNESS['0.6R'] / 100.0 * D * 1000  # mm
+    t_07 = MAU_THICKNESS['0.7R'] / 100.0 * D * 1000  # mm
+
+    # 0.7R处弦长，标准桨取盘面比0.55
+    b_07 = MAU_WIDTH['0.7R'] / 100.0 * 0.226 * D * ae_a0 / (0.1 * Z)
+    b_07_std = MAU_WIDTH['0.7R'] / 100.0 * 0.226 * D * 0.55 / (0.1 * Z)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tob_des = (t_07 / 1000.0) / b_07
+        tob_std = (t_07 / 1000.0) / b_07_std
+        delta_tob = (tob_des - tob_std) * 0.75
+
+        # 滑脱比 1-s = VA / (P·n)
+        VA = 0.5144 * vmax * (1 - w)
+        P = p_d * D
+        n = N / 60.0
+        one_minus_s = np.where(P * n > 0, VA / (P * n), 0.0)
+
+    delta_PoD_t = -2 * p_d * one_minus_s * delta_tob
+    delta_PoD_h = np.where(np.abs(dh_D - 0.18) < 1e-6, 0.0, (dh_D - 0.18) / 10.0)
+    delta_PoD = delta_PoD_t + delta_PoD_h
+    return {'dh_D': dh_D, 'D': D, 'p_d': p_d, 'ae_a0': ae_a0, 'vmax': vmax, 'N': N, 'Z': Z,
+            't_02': t_02, 't_06': t_06, 't_07': t_07, 'b_07': b_07,
+            'tob_des': tob_des, 'tob_std': tob_std, 'delta_tob': delta_tob,
+            'VA': VA, 'P': P, 'n': n, 'one_minus_s': one_minus_s,
+            'delta_PoD_t': delta_PoD_t, 'delta_PoD_h': delta_PoD_h,
+            'delta_PoD': delta_PoD, 'p_d_corrected': p_d + delta_PoD}
+
+
+def pitch_correction_report(result, index=()):
+    """按需生成单个方案的螺距修正文字报告，index为方案在结果数组中的下标"""
+    r = {key: float(np.asarray(value)[index]) for key, value in result.items()}
+    return (f"螺距修正计算结果：\n\n"
+            f"设计参数（使用最佳要素确定结果）：\n"
+            f"- 螺旋桨直径 D = {r['D']:.3f} m\n"
+            f"- 最佳螺距比 P/D = {r['p_d']:.4f}\n"
+            f"- 最佳盘面比 Ae/Ao = {r['ae_a0']:.4f}\n"
+            f"- 桨叶数 Z = {r['Z']:.0f}\n"
+            f"- 最大航速 Vmax = {r['vmax']:.2f} kn\n"
+            f"- 主机转速 N = {r['N']} rpm\n"
+            f"- 毂径比 dh/D = {r['dh_D']:.3f}\n\n"
+
+            f"厚度修正计算：\n"
+            f"1) 设计桨0.2R厚度 t₀.₂ = {r['t_02']:.1f} mm\n"
+            f"2) 设计桨0.6R厚度 t₀.₆ = {r['t_06']:.1f} mm\n"
+            f"3) 设计桨0.7R厚度 t₀.₇ = {r['t_07']:.1f} mm\n"
+            f"4) 设计桨0.7R弦长 b₀.₇ = {r['b_07']:.4f} m\n"
+            f"5) 设计桨[t/b]₀.₇ = {r['tob_des']:.6f}\n"
+            f"6) 标准桨[t/b]₀.₇ = {r['tob_std']:.6f}\n"
+            f"7) Δ[t/b]₀.₇ = {r['delta_tob']:.6f}\n\n"
+
+            f"滑脱比计算：\n"
+            f"8) 进速 VA = {r['VA']:.3f} m/s\n"
+            f"9) 螺距 P = {r['P']:.3f} m\n"
+            f"10) 转速 n = {r['n']:.3f} rps\n"
+            f"11) 滑脱比 1-s = {r['one_minus_s']:.4f}\n\n"
+
+            f"修正量计算：\n"
+            f"12) 厚度修正 Δ(P/D)ₜ = {r['delta_PoD_t']:.6f}\n"
+            f"13) 毂径比修正 Δ(P/D)ₕ = {r['delta_PoD_h']:.6f}\n"
+            f"14) 总修正量 Δ(P/D) = {r['delta_PoD']:.6f}\n"
+            f"15) 修正后螺距比 (P/D)' = {r['p_d_corrected']:.4f}\n\n"
+
+            f"验证：原最佳P/D {r['p_d']:.4f} + 修正量 {r['delta_PoD']:.6f} = {r['p_d_corrected']:.4f}")
+
+
+# MAU系列Bp-δ图谱数据 (横坐标为 sqrt(Bp))
+BP_CHART_DATA = {
+    'MAU4-40': {
+        'sqrt': [2.43, 2.5, 2.75, 3, 3.25, 3.5, 3.75, 4, 4.25, 4.5, 4.75, 5, 5.25, 5.5, 5.75, 6, 6.25, 6.5,
+                 6.75, 7, 7.25, 7.5, 7.75, 8, 8.25, 8.5, 8.75, 9, 9.25, 9.5, 9.75, 10, 10.07],
+        'delta': [32.1337, 33.0527, 35.6638, 38.8661, 41.6769, 44.1932, 47.0351, 49.4805, 52.5412, 55.0486,
+                  57.6749, 60.6623, 62.792, 65.4302, 68, 70.9688, 73.4625, 75.5852, 78.1068, 80.4074, 82.4419,
+                  84.9337, 87.5578, 89.5028, 92.4124, 94, 96, 98.9679, 100.738, 102.8976, 105.1432, 107.2132,
+                  107.7646],
+        'p_d': [1.11168, 1.08883, 1.02299, 0.95694, 0.91488, 0.87439, 0.83645, 0.81378, 0.78523, 0.75768,
+                0.7395, 0.72046, 0.7014, 0.68219, 0.672, 0.65867, 0.64867, 0.6405, 0.63474, 0.6282, 0.61852,
+                0.61276, 0.60609, 0.60127, 0.59407, 0.59, 0.582, 0.57692, 0.57457, 0.57087, 0.56892, 0.56446,
+                0.56274],
+        'eta': [0.76169, 0.75949, 0.75125, 0.73741, 0.72345, 0.70847, 0.69006, 0.67778, 0.66364, 0.65216,
+                0.64142, 0.62654, 0.61688, 0.60503, 0.592, 0.5806, 0.56823, 0.55987, 0.5475, 0.53862, 0.53122,
+                0.52179, 0.51156, 0.50677, 0.49276, 0.485, 0.48, 0.47189, 0.4657, 0.45899, 0.45096, 0.44431,
+                0.44269],
+    },
+    'MAU4-55': {
+        'sqrt': [4.586, 4.971, 5.419, 5.945, 6.5, 7.0, 7.5, 8.0, 8.5, 9.0, 9.5, 10.0, 11.0, 13.01],
+        'delta': [55.6, 58.8, 63.4, 69.1, 74.0, 78.5, 82.8, 86.9, 90.8, 94.5, 98.0, 101.0, 107.0, 132.3],
+        'p_d': [0.807, 0.774, 0.742, 0.711, 0.68, 0.65, 0.62, 0.595, 0.57, 0.545, 0.525, 0.505, 0.47, 0.4],
+        'eta': [0.634, 0.614, 0.592, 0.565, 0.54, 0.515, 0.49, 0.465, 0.44, 0.415, 0.39, 0.365, 0.33, 0.26],
+    },
+    'MAU4-70': {
+        'sqrt': [2.65, 2.75, 3, 3.25, 3.5, 3.75, 4, 4.25, 4.5, 4.75, 5, 5.25, 5.5, 5.75, 6, 6.25, 6.5, 6.75, 7,
+                 7.25, 7.5, 7.75, 8, 8.25, 8.5, 8.75, 9, 9.25, 9.5, 9.75, 10, 10.07],
+        'delta': [32, 33.3173, 36.5182, 39.3473, 42, 45.3888, 48, 51.0038, 53.4893, 56, 58, 60.6577, 63.5746,
+                  65.5697, 68, 70.4972, 73.0047, 75.485, 78, 80, 83.0763, 85.5071, 87.658, 89.4571, 92.5176,
+                  94.4395, 97.0423, 99.2439, 101.1474, 103.479, 106, 106.5729],
+        'p_d': [1.21, 1.17707, 1.09708, 1.02612, 0.97, 0.91193, 0.88, 0.84889, 0.83298, 0.81, 0.79, 0.76611,
+                0.75225, 0.74212, 0.73, 0.71751, 0.70499, 0.69253, 0.68, 0.67, 0.66274, 0.65275, 0.64117,
+                0.63713, 0.62315, 0.62297, 0.62177, 0.61714, 0.61053, 0.60743, 0.606, 0.6045],
+        'eta': [0.705, 0.69778, 0.68784, 0.6728, 0.66, 0.64316, 0.63, 0.61942, 0.60725, 0.595, 0.585, 0.57443,
+                0.56195, 0.55306, 0.541, 0.531, 0.5215, 0.512, 0.503, 0.495, 0.48542, 0.47661, 0.47013, 0.46359,
+                0.45545, 0.44874, 0.44245, 0.43662, 0.42907, 0.42284, 0.416, 0.41471],
+    },
+    'MAU5-50': {
+        'sqrt': [2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0],
+        'delta': [30.0, 35.0, 40.0, 45.0, 50.0, 55.0, 60.0, 65.0, 70.0, 75.0, 80.0, 85.0],
+        'p_d': [1.1, 1.05, 0.95, 0.88, 0.82, 0.78, 0.74, 0.71, 0.68, 0.65, 0.63, 0.61],
+        'eta': [0.75, 0.73, 0.7, 0.67, 0.64, 0.61, 0.58, 0.55, 0.52, 0.49, 0.46, 0.43],
+    },
+    'MAU5-65': {
+        'sqrt': [2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0],
+        'delta': [32.0, 38.0, 44.0, 50.0, 56.0, 62.0, 68.0, 74.0, 80.0, 86.0, 92.0, 98.0],
+        'p_d': [1.08, 1.02, 0.93, 0.85, 0.79, 0.74, 0.7, 0.67, 0.64, 0.61, 0.59, 0.57],
+        'eta': [0.72, 0.7, 0.67, 0.64, 0.61, 0.58, 0.55, 0.52, 0.49, 0.46, 0.43, 0.4],
+    },
+    'MAU5-80': {
+        'sqrt': [2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0],
+        'delta': [34.0, 41.0, 48.0, 55.0, 62.0, 69.0, 76.0, 83.0, 90.0, 97.0, 104.0, 111.0],
+        'p_d': [1.05, 0.98, 0.9, 0.83, 0.77, 0.72, 0.68, 0.65, 0.62, 0.59, 0.57, 0.55],
+        'eta': [0.68, 0.66, 0.63, 0.6, 0.57, 0.54, 0.51, 0.48, 0.45, 0.42, 0.39, 0.36],
+    },
+}
+# 各桨叶数对应的图谱系列及其盘面比
+CHART_SERIES = {
+    4: (("MAU4-40", 0.40), ("MAU4-55", 0.55), ("MAU4-70", 0.70)),
+    5: (("MAU5-50", 0.50), ("MAU5-65", 0.65), ("MAU5-80", 0.80)),
+}
+
+
+def get_bp_data(tp):
+    """获取指定型号的Bp图谱数据，未知型号返回MAU4-55的数据"""
+    return BP_CHART_DATA.get(tp, BP_CHART_DATA["MAU4-55"])
+
+
+def series_types(blade_count):
+    """返回桨叶数对应的图谱型号列表"""
+    return [name for name, _ in CHART_SERIES[blade_count]]
+
+
+def make_pe_curve(speeds, pes):
+    """拟合有效功率曲线，三次样条失败时退化为Akima插值"""
+    try:
+        return CubicSpline(speeds, pes)
+    except Exception:
+        return Akima1DInterpolator(speeds, pes)
+
+
+def calc_sqrt_bp(pd, n, va):
+    """计算 sqrt(Bp)，pd为收到功率(kW)，n为转速(r/min)，va为进速(kn)"""
+    bp = (n * np.sqrt(pd)) / (va ** 2.5) * 1.166
+    return np.sqrt(bp)
+
+
+def get_tau_c(sigma, source='wag', diagnostics=None, detail=''):
+    """统一 τc 计算，sigma可为标量或数组
+
+    diagnostics 为 SolverDiagnostics 时记录每个σ是否超出限界线范围（取上限或被截断）。
+    """
+    sigma = np.asarray(sigma, dtype=float)
+    if source == 'wag':
+        raw = Akima1DInterpolator(SIGMA_WAG, TAU_C_WAG)(sigma)
+        # 超出限界线范围时Akima返回nan，按上限取值（与原单点计算一致）
+        limit = np.isnan(raw)
+        tau_c = np.where(limit, 0.5, raw)
+        table = SIGMA_WAG
+    else:  # ber
+        raw = Akima1DInterpolator(SIGMA_BER, TAU_C_BER)(np.clip(sigma, SIGMA_BER[0], SIGMA_BER[-1]))
+        limit = np.zeros(sigma.shape, dtype=bool)
+        tau_c = raw
+        table = SIGMA_BER
+    clipped = (tau_c < 0.05) | (tau_c > 0.5)
+    tau_c = np.clip(tau_c, 0.05, 0.5)
+    if diagnostics is not None:
+        outside = (sigma < table[0]) | (sigma > table[-1])
+        status = np.where(limit, solver_diagnostics.LIMIT,
+                          np.where(clipped | outside, solver_diagnostics.CLIPPED, solver_diagnostics.OK))
+        diagnostics.record('tau_c', status, extrapolated=outside, detail=detail)
+    return float(tau_c) if tau_c.ndim == 0 else tau_c
+
+
+def calculate_cavitation(pd, n, w, vmax, D, p_d, eta0, hs, pv, p0,
+                         source='wag', rho=1025.0, g=9.81, diagnostics=None, detail=''):
+    """空泡校核，按Burrill方法求不发生空泡所需的最小盘面比（支持数组）"""
+    p0_total = p0 + rho * g * hs
+    VA = 0.5144 * vmax * (1 - w)
+    omega = 0.7 * np.pi * n * D / 60
+    V_0_7R_sq = VA ** 2 + omega ** 2
+    sigma = (p0_total - pv) / (0.5 * rho * V_0_7R_sq)
+    tau_c = get_tau_c(sigma, source, diagnostics, detail)
+    T = pd * eta0 * 1000 / VA
+    Ap = T / (0.5 * rho * V_0_7R_sq * tau_c)
+    AE = Ap / (1.067 - 0.229 * p_d)
+    AE_A0 = AE / (np.pi * D ** 2 / 4)
+    return {'VA': VA, 'omega': omega, 'V_0_7R_sq': V_0_7R_sq, 'sigma': sigma,
+            'tau_c': tau_c, 'T': T, 'AE_A0': AE_A0}
+
+
+class ChartSurface:
+    """某一桨叶数的连续图谱曲面：(sqrt(Bp), AE/A0) -> δ, P/D, η0
+
+    每个图谱系列沿 sqrt(Bp) 方向用三次样条插值，盘面比方向对各系列
+    取Lagrange插值（三个系列时即为过三点的抛物线，与原先对三个离散点
+    做CubicSpline拟合的结果一致），因此可在任意盘面比处直接求值。
+    """
+
+    KEYS = ('delta', 'p_d', 'eta')
+
+    def __init__(self, blade_count):
+        if blade_count not in CHART_SERIES:
+            raise ValueError(f"暂不支持{blade_count}叶桨的图谱")
+        self.blade_count = blade_count
+        self.series = [name for name, _ in CHART_SERIES[blade_count]]
+        self.area_ratios = np.array([ratio for _, ratio in CHART_SERIES[blade_count]])
+        self.splines = {key: [CubicSpline(get_bp_data(tp)['sqrt'], get_bp_data(tp)[key])
+                              for tp in self.series]
+                        for key in self.KEYS}
+        self.packed = ({key: propeller_kernels.pack_splines(self.area_ratios, self.splines[key]) for key in self.KEYS}
+                       if propeller_kernels.NUMBA_AVAILABLE else None)
+
+    @property
+    def area_ratio_range(self):
+        return float(self.area_ratios.min()), float(self.area_ratios.max())
+
+    @property
+    def sqrt_bp_range(self):
+        """各系列图谱都有数据的 sqrt(Bp) 范围，超出时样条外插"""
+        splines = self.splines['delta']
+        return max(float(s.x[0]) for s in splines), min(float(s.x[-1]) for s in splines)
+
+    def is_extrapolated(self, sqrt_bp, ae_a0, eps=1e-9):
+        """(sqrt(Bp), AE/A0) 是否超出图谱数据范围"""
+        bp_lo, bp_hi = self.sqrt_bp_range
+        ae_lo, ae_hi = self.area_ratio_range
+        return ((np.asarray(sqrt_bp) < bp_lo - eps) | (np.asarray(sqrt_bp) > bp_hi + eps) |
+                (np.asarray(ae_a0) < ae_lo - eps) | (np.asarray(ae_a0) > ae_hi + eps))
+
+    def weights(self, ae_a0):
+        """盘面比方向的Lagrange插值权重，返回形状 (系列数, ...)"""
+        x = np.asarray(ae_a0, dtype=float)
+        nodes = self.area_ratios
+        w = []
+        for k, xk in enumerate(nodes):
+            wk = np.ones_like(x)
+            for m, xm in enumerate(nodes):
+                if m != k:
+                    wk = wk * (x - xm) / (xk - xm)
+            w.append(wk)
+        return np.array(w)
+
+    def evaluate(self, key, sqrt_bp, ae_a0):
+        """在 (sqrt(Bp), AE/A0) 处求图谱量，参数按numpy规则广播"""
+        sqrt_bp, ae_a0 = np.broadcast_arrays(np.asarray(sqrt_bp, dtype=float),
+                                             np.asarray(ae_a0, dtype=float))
+        if propeller_kernels.enabled():
+            result = propeller_kernels.chart_surface(self.packed[key], sqrt_bp, ae_a0)
+            return float(result) if result.ndim == 0 else result
+        w = self.weights(ae_a0)
+        result = sum(w[k] * spline(sqrt_bp) for k, spline in enumerate(self.splines[key]))
+        return float(result) if result.ndim == 0 else result
+
+    def delta(self, sqrt_bp, ae_a0):
+        return self.evaluate('delta', sqrt_bp, ae_a0)
+
+    def p_d(self, sqrt_bp, ae_a0):
+        return self.evaluate('p_d', sqrt_bp, ae_a0)
+
+    def eta0(self, sqrt_bp, ae_a0):
+        return self.evaluate('eta', sqrt_bp, ae_a0)
+
+
+_SURFACE_CACHE = {}
+
+
+def get_chart_surface(blade_count):
+    """获取（缓存的）图谱曲面"""
+    if blade_count not in _SURFACE_CACHE:
+        _SURFACE_CACHE[blade_count] = ChartSurface(blade_count)
+    return _SURFACE_CACHE[blade_count]
+
+
+def solve_max_speed(surface, ae_a0, pd, n, w, eta_h, speeds, pes, iterations=60, pe_scale=1.0,
+                    diagnostics=None, detail=''):
+    """向量化求解各盘面比下PTE与PE曲线交点对应的最大航速
+
+    在PE曲线航速范围内做二分求根，交点超出范围时取边界值，
+    与原先fsolve后限制在有效范围内的处理一致。盘面比、功率、伴流分数、
+    船身效率及有效功率比例系数 pe_scale 均可为数组，按numpy规则广播。
+
+    注意：界面默认算例的结果与改用二分法之前不同（如MAU4-40的Vmax由17.00 kn变为15.62 kn）。
+    原程序的PTE函数对fsolve传入的一维数组调用 float()，新版NumPy下抛出TypeError，
+    被 except 捕获后返回航速上限 max(speeds)，即原来的17.00 kn并不是交点。
+    修正该调用后fsolve得到 15.62/15.45/15.27 kn，与二分法一致。
+    diagnostics 为 SolverDiagnostics 时记录每个解的状态、残差达到容差所用迭代次数、
+    残差 (kW) 及图谱是否外插。
+    """
+    pe_func = make_pe_curve(speeds, pes)
+    ae_a0 = np.asarray(ae_a0, dtype=float)
+    shape = np.broadcast_shapes(*(np.shape(v) for v in (ae_a0, pd, n, w, eta_h, pe_scale)))
+
+    def residual(v):
+        sqrt_bp = calc_sqrt_bp(pd, n, (1 - w) * v)
+        return pd * eta_h * surface.eta0(sqrt_bp, ae_a0) - pe_scale * pe_func(v)
+
+    v_lo = np.full(shape, float(min(speeds)))
+    v_hi = np.full(shape, float(max(speeds)))
+    f_lo = residual(v_lo)
+    f_hi = residual(v_hi)
+    f_start, f_end = f_lo, f_hi
+    if diagnostics is not None:
+        tolerance = MAX_SPEED_TOLERANCE * max(abs(float(np.max(pes))), 1.0)
+        settled = np.full(shape, iterations)
+    for k in range(iterations):
+        v_mid = 0.5 * (v_lo + v_hi)
+        f_mid = residual(v_mid)
+        go_right = np.sign(f_mid) == np.sign(f_lo)
+        v_lo = np.where(go_right, v_mid, v_lo)
+        f_lo = np.where(go_right, f_mid, f_lo)
+        v_hi = np.where(go_right, v_hi, v_mid)
+        if diagnostics is not None:
+            settled = np.where((settled == iterations) & (np.abs(f_mid) <= tolerance), k + 1, settled)
+    # PTE始终高于PE时交点在范围之外，取最大航速；始终低于PE时取最小航速
+    vmax = np.where(f_end >= 0, float(max(speeds)),
+                    np.where(f_start <= 0, float(min(speeds)), 0.5 * (v_lo + v_hi)))
+    if diagnostics is not None:
+        _record_max_speed(diagnostics, surface, ae_a0, pd, n, w, vmax, residual(vmax), f_start, f_end,
+                          settled, tolerance, detail)
+    return float(vmax) if vmax.ndim == 0 else vmax
+
+
+def _record_max_speed(diagnostics, surface, ae_a0, pd, n, w, vmax, res, f_start, f_end, settled, tolerance,
+                      detail):
+    bracketed = ~((f_end >= 0) | (f_start <= 0))
+    status = np.where(f_end >= 0, solver_diagnostics.CLIPPED_HIGH,
+                      np.where(f_start <= 0, solver_diagnostics.CLIPPED_LOW, solver_diagnostics.CONVERGED))
+    status = np.where(bracketed & ~(np.abs(res) <= tolerance), solver_diagnostics.NOT_CONVERGED, status)
+    status = np.where(np.isnan(vmax) | np.isnan(res), solver_diagnostics.FAILED, status)
+    extrapolated = surface.is_extrapolated(calc_sqrt_bp(pd, n, (1 - w) * vmax), ae_a0)
+    diagnostics.record('max_speed', status, np.where(bracketed, settled, 0), np.abs(res), extrapolated, detail)
+
+
+def chart_design_point(surface, ae_a0, vmax, pd, n, w):
+    """由最大航速求图谱设计点的 δ, P/D, D, η0"""
+    VA = (1 - w) * np.asarray(vmax, dtype=float)
+    sqrt_bp = calc_sqrt_bp(pd, n, VA)
+    delta = surface.delta(sqrt_bp, ae_a0)
+    p_d = surface.p_d(sqrt_bp, ae_a0)
+    eta0 = surface.eta0(sqrt_bp, ae_a0)
+    D = (delta * VA) / n
+    return {'delta': delta, 'p_d': p_d, 'D': D, 'eta0': eta0}
+
+
+def solve_optimum_area_ratio(blade_count, pd, n, w, eta_h, speeds, pes,
+                             hs, pv, p0, source='wag', rho=1025.0, num=201, diagnostics=None):
+    """在连续盘面比上一次性求解满足空泡要求的最佳要素
+
+    对盘面比网格向量化求出最大航速、图谱要素及空泡校核所需盘面比，
+    所需盘面比曲线与对角线 AE/A0 = x 的交点即为最佳盘面比。
+    返回 (最佳要素字典, 曲线字典)。diagnostics 记录最佳点处各求解器的状态，
+    以及交点是否存在（无交点时取最接近处）、残差是否在 OPTIMUM_AREA_TOLERANCE 以内。
+    """
+    surface = get_chart_surface(blade_count)
+    x_min, x_max = surface.area_ratio_range
+    x = np.linspace(x_min, x_max, num)
+
+    vmax = solve_max_speed(surface, x, pd, n, w, eta_h, speeds, pes)
+    point = chart_design_point(surface, x, vmax, pd, n, w)
+    cav = calculate_cavitation(pd, n, w, vmax, point['D'], point['p_d'], point['eta0'],
+                               hs, pv, p0, source=source, rho=rho)
+    curves = {'blade_ratio': x, 'AE_A0': cav['AE_A0'], 'p_d': point['p_d'],
+              'D': point['D'], 'eta0': point['eta0'], 'vmax': vmax}
+
+    # 找到所需盘面比与对角线的交点，无交点时取最接近处
+    diff = cav['AE_A0'] - x
+    crossing = np.nonzero(np.sign(diff[:-1]) * np.sign(diff[1:]) <= 0)[0]
+    if len(crossing):
+        i = crossing[0]
+        frac = diff[i] / (diff[i] - diff[i + 1]) if diff[i] != diff[i + 1] else 0.0
+        opt_r = x[i] + frac * (x[i + 1] - x[i])
+    else:
+        opt_r = x[np.argmin(np.abs(diff))]
+
+    opt_v = solve_max_speed(surface, opt_r, pd, n, w, eta_h, speeds, pes, diagnostics=diagnostics,
+                            detail='最佳要素')
+    opt_point = chart_design_point(surface, opt_r, opt_v, pd, n, w)
+    opt_cav = calculate_cavitation(pd, n, w, opt_v, opt_point['D'], opt_point['p_d'],
+                                   opt_point['eta0'], hs, pv, p0, source=source, rho=rho,
+                                   diagnostics=diagnostics, detail='最佳要素')
+    if diagnostics is not None:
+        residual = abs(float(opt_cav['AE_A0']) - float(opt_r))
+        if not len(crossing):
+            status = solver_diagnostics.NO_CROSSING
+        elif residual > OPTIMUM_AREA_TOLERANCE:
+            status = solver_diagnostics.NOT_CONVERGED
+        else:
+            status = solver_diagnostics.CONVERGED
+        diagnostics.record('optimum', status, residual=residual)
+    optimum = {'blade_ratio': float(opt_r), 'AE_A0': float(opt_cav['AE_A0']),
+               'p_d': float(opt_point['p_d']), 'D': float(opt_point['D']),
+               'eta0': float(opt_point['eta0']), 'vmax': float(opt_v)}
+    return optimum, curves
@@ -0,0 +1,211 @@
+"""可选的numba编译内核：AU系列KT/KQ多项式、KT/KQ网格三线性插值及图谱曲面样条求值
+
+安装了numba时 propeller_core 中对应的计算自动改用编译内核，逐点一次完成全部运算，
+避免NumPy逐项生成临时数组的开销；未安装numba或设置环境变量 PROPELLER_NO_JIT=1 时
+保持原NumPy实现。check_parity 比较两种实现的结果。
+sqrt(Bp) 只是一个逐元素表达式，NumPy已足够快（编译内核反而更慢），不提供内核。
+"""
+import os
+import time
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+_enabled = NUMBA_AVAILABLE and os.environ.get('PROPELLER_NO_JIT', '') not in ('1', 'true', 'yes')
+
+
+def enabled():
+    """当前是否使用编译内核"""
+    return _enabled
+
+
+def set_enabled(flag):
+    """开启或关闭编译内核（未安装numba时始终关闭），返回原状态"""
+    global _enabled
+    previous = _enabled
+    _enabled = bool(flag) and NUMBA_AVAILABLE
+    return previous
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _au_polynomial(values, pi, pj, pk, J, p_d, ae_a0, out):
+        max_i, max_j, max_k = pi.max(), pj.max(), pk.max()
+        pd_pow = np.empty(max_i + 1)
+        j_pow = np.empty(max_j + 1)
+        ae_pow = np.empty(max_k + 1)
+        for n in range(out.size):
+            pd_pow[0] = j_pow[0] = ae_pow[0] = 1.0
+            for m in range(max_i):
+                pd_pow[m + 1] = pd_pow[m] * p_d[n]
+            for m in range(max_j):
+                j_pow[m + 1] = j_pow[m] * J[n]
+            for m in range(max_k):
+                ae_pow[m + 1] = ae_pow[m] * ae_a0[n]
+            total = 0.0
+            for t in range(values.size):
+                total += values[t] * pd_pow[pi[t]] * j_pow[pj[t]] * ae_pow[pk[t]]
+            out[n] = total
+
+    @numba.njit(cache=True)
+    def _chart_surface(nodes, breaks, coeffs, lengths, sqrt_bp, ae_a0, out):
+        series = nodes.size
+        for m in range(out.size):
+            x, a = sqrt_bp[m], ae_a0[m]
+            total = 0.0
+            for s in range(series):
+                # 盘面比方向的Lagrange权重
+                weight = 1.0
+                for q in range(series):
+                    if q != s:
+                        weight *= (a - nodes[q]) / (nodes[s] - nodes[q])
+                # 三次样条分段多项式，区间外按端部多项式外插（与CubicSpline一致）
+                lo, hi = 0, lengths[s] - 2
+                if x >= breaks[s, hi]:
+                    lo = hi
+                else:
+                    while lo < hi:
+                        mid = (lo + hi + 1) // 2
+                        if breaks[s, mid] <= x:
+                            lo = mid
+                        else:
+                            hi = mid - 1
+                dx = x - breaks[s, lo]
+                value = ((coeffs[s, 0, lo] * dx + coeffs[s, 1, lo]) * dx + coeffs[s, 2, lo]) * dx + coeffs[s, 3, lo]
+                total += weight * value
+            out[m] = total
+
+
+    @numba.njit(cache=True)
+    def _trilinear(kt_table, kq_table, start, step, shape, J, p_d, ae_a0, kt, kq, inside):
+        n1, n2 = shape[1], shape[2]
+        for m in range(J.size):
+            x0 = (J[m] - start[0]) / step[0]
+            x1 = (p_d[m] - start[1]) / step[1]
+            x2 = (ae_a0[m] - start[2]) / step[2]
+            # 网格外（含NaN）的点由调用方按多项式计算
+            if not (0.0 <= x0 <= shape[0] - 1 and 0.0 <= x1 <= n1 - 1 and 0.0 <= x2 <= n2 - 1):
+                inside[m] = False
+                continue
+            inside[m] = True
+            i0 = min(int(x0), shape[0] - 2)
+            i1 = min(int(x1), n1 - 2)
+            i2 = min(int(x2), n2 - 2)
+            f0, f1, f2 = x0 - i0, x1 - i1, x2 - i2
+            base = (i0 * n1 + i1) * n2 + i2
+            total_kt = 0.0
+            total_kq = 0.0
+            for d0 in range(2):
+                w0 = f0 if d0 else 1.0 - f0
+                for d1 in range(2):
+                    w01 = w0 * (f1 if d1 else 1.0 - f1)
+                    corner = base + d0 * n1 * n2 + d1 * n2
+                    w_lo, w_hi = w01 * (1.0 - f2), w01 * f2
+                    total_kt += kt_table[corner] * w_lo + kt_table[corner + 1] * w_hi
+                    total_kq += kq_table[corner] * w_lo + kq_table[corner + 1] * w_hi
+            kt[m] = total_kt
+            kq[m] = total_kq
+
+
+def _flat_inputs(*arrays):
+    """广播并展平为连续的float64数组，返回 (展平数组列表, 形状)"""
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in arrays))
+    return [np.ascontiguousarray(a).ravel() for a in arrays], arrays[0].shape
+
+
+def au_polynomial(values, pi, pj, pk, J, p_d, ae_a0):
+    """编译内核求AU多项式值，参数按numpy规则广播"""
+    (J, p_d, ae_a0), shape = _flat_inputs(J, p_d, ae_a0)
+    out = np.empty(J.size)
+    _au_polynomial(values, pi, pj, pk, J, p_d, ae_a0, out)
+    return out.reshape(shape)
+
+
+def pack_splines(nodes, splines):
+    """把各系列的CubicSpline整理成等长数组（不足处补零），供图谱内核使用"""
+    size = max(len(s.x) for s in splines)
+    breaks = np.zeros((len(splines), size))
+    coeffs = np.zeros((len(splines), 4, size - 1))
+    lengths = np.zeros(len(splines), dtype=np.int64)
+    for s, spline in enumerate(splines):
+        lengths[s] = len(spline.x)
+        breaks[s, :len(spline.x)] = spline.x
+        coeffs[s, :, :len(spline.x) - 1] = spline.c
+    return np.asarray(nodes, dtype=float), breaks, coeffs, lengths
+
+
+def chart_surface(packed, sqrt_bp, ae_a0):
+    """编译内核在 (sqrt(Bp), AE/A0) 处求图谱量，packed 为 pack_splines 的结果"""
+    (sqrt_bp, ae_a0), shape = _flat_inputs(sqrt_bp, ae_a0)
+    out = np.empty(sqrt_bp.size)
+    _chart_surface(*packed, sqrt_bp, ae_a0, out)
+    return out.reshape(shape)
+
+
+def trilinear(tables, start, step, shape, J, p_d, ae_a0):
+    """编译内核在等间距网格上三线性插值KT、KQ，返回展平的 (KT, KQ, 是否在网格内) 及输入形状"""
+    (J, p_d, ae_a0), out_shape = _flat_inputs(J, p_d, ae_a0)
+    kt, kq = np.empty(J.size), np.empty(J.size)
+    inside = np.empty(J.size, dtype=np.bool_)
+    _trilinear(tables[0], tables[1], start, step, np.asarray(shape, dtype=np.int64), J, p_d, ae_a0, kt, kq, inside)
+    return kt, kq, inside, out_shape
+
+
+def check_parity(size=100000, seed=0, blade_counts=(4, 5)):
+    """比较编译内核与NumPy实现的最大相对偏差及耗时，未安装numba时返回None"""
+    if not NUMBA_AVAILABLE:
+        return None
+    from propeller_core import calc_kt_kq, calc_sqrt_bp, get_chart_surface
+    from open_water_atlas import KTKQGrid
+
+    rng = np.random.default_rng(seed)
+    J = rng.uniform(0.0, 1.4, size)
+    p_d = rng.uniform(0.4, 1.6, size)
+    pd = rng.uniform(500.0, 20000.0, size)
+    n = rng.uniform(60.0, 400.0, size)
+    va = rng.uniform(5.0, 15.0, size)
+
+    cases = {}
+    for z in blade_counts:
+        surface = get_chart_surface(z)
+        ae_a0 = rng.uniform(*surface.area_ratio_range, size)
+        cases[f'kt_kq_{z}'] = lambda z=z, ae_a0=ae_a0: np.stack(calc_kt_kq(J, p_d, ae_a0, z))
+        cases[f'grid_{z}'] = lambda grid=KTKQGrid(z), ae_a0=ae_a0: np.stack(grid(J, p_d, ae_a0))
+        cases[f'chart_{z}'] = lambda surface=surface, ae_a0=ae_a0: np.stack(
+            [surface.evaluate(key, calc_sqrt_bp(pd, n, va), ae_a0) for key in surface.KEYS])
+
+    previous = set_enabled(True)
+    try:
+        report = {}
+        for name, func in cases.items():
+            func()  # 预先编译
+            timing = {}
+            for flag in (False, True):
+                set_enabled(flag)
+                start = time.perf_counter()
+                timing[flag] = (func(), time.perf_counter() - start)
+            reference, compiled = timing[False][0], timing[True][0]
+            scale = np.maximum(np.abs(reference), 1e-12)
+            report[name] = {'max_rel_error': float(np.max(np.abs(compiled - reference) / scale)),
+                            'max_abs_error': float(np.max(np.abs(compiled - reference))),
+                            'numpy_time': timing[False][1], 'jit_time': timing[True][1]}
+    finally:
+        set_enabled(previous)
+    return report
+
+
+if __name__ == '__main__':
+    # 以脚本运行时本文件是 __main__ 模块，开关须作用于 propeller_core 导入的同名模块
+    import propeller_kernels
+    result = propeller_kernels.check_parity()
+    if result is None:
+        print("未安装numba，使用NumPy实现")
+    else:
+        for name, r in result.items():
+            print(f"{name}: 最大相对偏差 {r['max_rel_error']:.1e}，最大绝对偏差 {r['max_abs_error']:.1e}，"
+                  f"NumPy {r['numpy_time'] * 1000:.1f} ms，JIT {r['jit_time'] * 1000:.1f} ms")
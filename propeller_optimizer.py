@@ -0,0 +1,208 @@
+"""螺旋桨要素连续寻优：在 D、P/D、AE/A0（可选转速N）上按AU多项式求最大航速或最高敞水效率，
+同时满足主机功率、空泡、强度与直径限制"""
+import time
+import warnings
+
+import numpy as np
+from scipy.optimize import minimize
+from scipy.stats import qmc
+
+from propeller_core import (calc_kt_kq, calculate_cavitation, calc_strength, get_chart_surface,
+                            make_pe_curve)
+
+# 优化变量顺序
+VARIABLES = ('D', 'p_d', 'ae_a0', 'N')
+# 精修时各约束留出的余量，避免结果恰好落在约束边界外一点
+POLISH_MARGIN = 1e-6
+# 精修的差分步长（归一化变量）、迭代次数上限与总耗时上限 (s)
+POLISH_STEP = 1e-6
+POLISH_MAX_ITER = 30
+POLISH_TIME_BUDGET = 0.25
+
+
+class InfeasibleDesignWarning(UserWarning):
+    """变量范围内找不到满足全部约束的方案"""
+
+
+def solve_equilibrium_speed(D, p_d, ae_a0, N, blade_count, w, t, speeds, pes, rho=1025.0, iterations=40):
+    """向量化二分求解推力功率 T(1-t)V 与有效功率 PE(V) 相等时的航速 (kn)
+
+    交点超出PE曲线航速范围时取边界值，与图谱法求最大航速的处理一致。
+    """
+    pe_func = make_pe_curve(speeds, pes)
+    D, p_d, ae_a0, N = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (D, p_d, ae_a0, N)))
+    n = N / 60.0
+
+    def residual(v):
+        J = 0.5144 * v * (1 - w) / (n * D)
+        kt, _ = calc_kt_kq(J, p_d, ae_a0, blade_count)
+        thrust = kt * rho * n ** 2 * D ** 4 / 1000  # kN
+        return thrust * (1 - t) * 0.5144 * v - pe_func(v)
+
+    v_lo = np.full(D.shape, float(min(speeds)))
+    v_hi = np.full(D.shape, float(max(speeds)))
+    f_start = f_lo = residual(v_lo)
+    f_end = residual(v_hi)
+    for _ in range(iterations):
+        v_mid = 0.5 * (v_lo + v_hi)
+        f_mid = residual(v_mid)
+        go_right = np.sign(f_mid) == np.sign(f_lo)
+        v_lo = np.where(go_right, v_mid, v_lo)
+        f_lo = np.where(go_right, f_mid, f_lo)
+        v_hi = np.where(go_right, v_hi, v_mid)
+    return np.where(f_end >= 0, float(max(speeds)),
+                    np.where(f_start <= 0, float(min(speeds)), 0.5 * (v_lo + v_hi)))
+
+
+def evaluate_designs(D, p_d, ae_a0, N, blade_count, pd, w, t, speeds, pes, hs, pv, p0,
+                     Ne, source='wag', epsilon=8.0, K=1.0, rho=1025.0, thickness_allowance=1.0):
+    """批量评价设计方案，返回航速、敞水性能、约束余量及总违反量
+
+    约束（均以 ≤0 为满足）：吸收功率/PD - 1，所需盘面比/盘面比 - 1，
+    0.25R与0.6R处 所需厚度/(允许加厚系数×标准厚度) - 1。
+    """
+    D, p_d, ae_a0, N = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (D, p_d, ae_a0, N)))
+    vmax = solve_equilibrium_speed(D, p_d, ae_a0, N, blade_count, w, t, speeds, pes, rho=rho)
+
+    n = N / 60.0
+    J = 0.5144 * vmax * (1 - w) / (n * D)
+    kt, kq = calc_kt_kq(J, p_d, ae_a0, blade_count)
+    eta0 = np.where(kq > 0, J * kt / (2 * np.pi * np.where(kq > 0, kq, 1.0)), 0.0)
+    p_abs = 2 * np.pi * n ** 3 * D ** 5 * rho * kq / 1000  # kW
+
+    cav = calculate_cavitation(p_abs, N, w, vmax, D, p_d, eta0, hs, pv, p0, source=source, rho=rho)
+    strength = calc_strength(D, p_d, ae_a0, N, Ne, blade_count, epsilon=epsilon, K=K)
+
+    constraints = np.stack([p_abs / pd - 1,
+                            cav['AE_A0'] / ae_a0 - 1,
+                            *np.moveaxis(strength['t_req'] / (thickness_allowance * strength['t_std']) - 1,
+                                         -1, 0)], axis=-1)
+    # KT≤0 的方案没有意义，一并计入违反量
+    violation = np.maximum(constraints, 0).sum(axis=-1) + np.maximum(-kt, 0)
+    return {'D': D, 'p_d': p_d, 'ae_a0': ae_a0, 'N': N, 'vmax': vmax, 'J': J, 'KT': kt, 'KQ': kq,
+            'eta0': eta0, 'P_abs': p_abs, 'AE_req': cav['AE_A0'], 'strength_margin': strength['margin'],
+            'constraints': constraints, 'violation': violation, 'feasible': violation <= 0}
+
+
+def optimize_design(blade_count, pd, N, w, t, speeds, pes, hs, pv, p0, D_max, Ne,
+                    objective='vmax', vary_n=False, bounds=None, starts=16, tol=1e-3,
+                    max_iter=40, seed=0, source='wag', epsilon=8.0, K=1.0, rho=1025.0,
+                    thickness_allowance=1.0, polish=3):
+    """多起点向量化坐标搜索（compass search）求约束最优设计，再用SLSQP精修
+
+    所有起点在每一步同时沿各变量正负方向试探，一次批量评价全部试探点；
+    可行方案按目标值比较，不可行方案排在所有可行方案之后并按违反量比较。
+    坐标搜索沿弯曲的约束边界只能走锯齿，常停在局部最优，因此最后从得分最高的
+    polish 个可行起点出发用SLSQP精修，精修结果可行且更优时采用（polish=0 不精修）。
+    精修时每个点连同前向差分点一次批量评价，目标与约束共用；各起点合计最多
+    POLISH_TIME_BUDGET 秒，每次至多 POLISH_MAX_ITER 步，整个调用通常在0.5秒以内。
+    没有可行起点时不精修。
+    objective 为 'vmax' 或 'eta0'；vary_n 为 True 时转速N也参与寻优；
+    thickness_allowance 为允许桨叶相对MAU标准厚度加厚的倍数。
+    找不到可行方案时发出 InfeasibleDesignWarning，返回违反量最小的方案（feasible=False）。
+    """
+    if objective not in ('vmax', 'eta0'):
+        raise ValueError(f"不支持的优化目标: {objective}")
+    start_time = time.perf_counter()
+
+    # 变量范围，默认盘面比取该叶数图谱系列的范围
+    ae_min, ae_max = get_chart_surface(blade_count).area_ratio_range
+    limits = {'D': (0.4 * D_max, D_max), 'p_d': (0.5, 1.4), 'ae_a0': (ae_min, ae_max),
+              'N': (0.8 * N, 1.2 * N) if vary_n else (N, N)}
+    limits.update(bounds or {})
+    limits['D'] = (limits['D'][0], min(limits['D'][1], D_max))
+    lower = np.array([limits[v][0] for v in VARIABLES], dtype=float)
+    upper = np.array([limits[v][1] for v in VARIABLES], dtype=float)
+    active = upper > lower
+    dim = int(active.sum())
+
+    def evaluate(u):
+        x = lower + u * (upper - lower)
+        result = evaluate_designs(x[..., 0], x[..., 1], x[..., 2], x[..., 3], blade_count, pd, w, t,
+                                  speeds, pes, hs, pv, p0, Ne, source=source, epsilon=epsilon, K=K, rho=rho,
+                                  thickness_allowance=thickness_allowance)
+        score = np.where(result['feasible'], result[objective], -1e6 - result['violation'])
+        return score, result
+
+    # 拉丁超立方取起点（归一化到 [0, 1]）
+    u = np.full((starts, len(VARIABLES)), 0.5)
+    u[:, active] = qmc.LatinHypercube(d=dim, seed=seed).random(starts)
+    score, _ = evaluate(u)
+    step = np.full(starts, 0.25)
+    evaluations = starts
+
+    # 试探方向：各活动变量的正负单位向量
+    directions = np.zeros((2 * dim, len(VARIABLES)))
+    for k, index in enumerate(np.flatnonzero(active)):
+        directions[2 * k, index] = 1.0
+        directions[2 * k + 1, index] = -1.0
+
+    iterations = 0
+    while iterations < max_iter and np.any(step >= tol):
+        iterations += 1
+        trial = np.clip(u[:, None, :] + step[:, None, None] * directions[None], 0.0, 1.0)
+        trial_score, _ = evaluate(trial)
+        evaluations += trial_score.size
+        best = np.argmax(trial_score, axis=1)
+        best_score = trial_score[np.arange(starts), best]
+        improved = (best_score > score) & (step >= tol)
+        u[improved] = trial[np.flatnonzero(improved), best[improved]]
+        score[improved] = best_score[improved]
+        step = np.where(improved, step, step / 2)
+
+    # SLSQP精修：只对活动变量寻优，约束按 ≤ -POLISH_MARGIN 处理，只接受可行且更优的结果
+    def expand(z):
+        x = np.full(z.shape[:-1] + (len(VARIABLES),), 0.5)
+        x[..., active] = z
+        return x
+
+    cache = {}
+
+    def linearize(z):
+        """目标、约束及其前向差分导数，同一点只批量评价一次"""
+        nonlocal evaluations
+        key = z.tobytes()
+        if key not in cache:
+            h = np.where(z + POLISH_STEP <= 1.0, POLISH_STEP, -POLISH_STEP)
+            points = np.vstack([z, z + np.diag(h)])
+            _, result = evaluate(expand(points))
+            f = -result[objective]
+            c = -result['constraints'] - POLISH_MARGIN
+            cache.clear()
+            cache[key] = (f[0], (f[1:] - f[0]) / h, c[0], ((c[1:] - c[0]) / h[:, None]).T)
+            evaluations += len(points)
+        return cache[key]
+
+    polish_end = time.perf_counter() + POLISH_TIME_BUDGET
+
+    def check_budget(_):
+        if time.perf_counter() > polish_end:
+            raise StopIteration
+
+    feasible_starts = np.flatnonzero(score >= -1e6)
+    for index in feasible_starts[np.argsort(score[feasible_starts])[::-1]][:polish if dim else 0]:
+        if time.perf_counter() > polish_end:
+            break
+        refined = minimize(lambda z: linearize(z)[0], u[index, active], jac=lambda z: linearize(z)[1],
+                           method='SLSQP', bounds=[(0.0, 1.0)] * dim,
+                           constraints={'type': 'ineq', 'fun': lambda z: linearize(z)[2],
+                                        'jac': lambda z: linearize(z)[3]},
+                           callback=check_budget, options={'maxiter': POLISH_MAX_ITER, 'ftol': 1e-9})
+        candidate = expand(np.clip(refined.x, 0.0, 1.0))
+        candidate_score, _ = evaluate(candidate)
+        if candidate_score > score[index]:
+            u[index], score[index] = candidate, candidate_score
+
+    winner = int(np.argmax(score))
+    _, result = evaluate(u[winner])
+    if not result['feasible']:
+        warnings.warn(f"变量范围内找不到满足全部约束的方案，返回违反量最小的方案"
+                      f"（违反量 {float(result['violation']):.3g}）", InfeasibleDesignWarning, stacklevel=2)
+    optimum = {key: float(result[key]) for key in ('D', 'p_d', 'ae_a0', 'N', 'vmax', 'J', 'KT', 'KQ',
+                                                   'eta0', 'P_abs', 'AE_req', 'violation')}
+    optimum['feasible'] = bool(result['feasible'])
+    optimum['strength_margin'] = result['strength_margin']
+    optimum['iterations'] = iterations
+    optimum['evaluations'] = evaluations
+    optimum['time'] = time.perf_counter() - start_time
+    return optimum
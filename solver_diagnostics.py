@@ -0,0 +1,126 @@
+"""求解诊断记录：收集一次计算中各求解器、插值器调用的收敛状态、迭代次数、残差，
+以及是否外插、是否退回默认值
+
+核心函数（solve_max_speed、get_tau_c、calculate_cavitation、solve_optimum_area_ratio、
+evaluate_design_chain）接受可选参数 diagnostics，不传时没有任何额外开销。
+批量计算时样本沿数组的末尾几维排列，构造时给出 case_shape 即可把每条记录对应到样本序号：
+
+    diag = SolverDiagnostics(case_shape=w.shape)
+    evaluate_design_chain(w, t, eta_r, diagnostics=diag)
+    diag.fallback_cases()     # 退回默认值（未收敛）的样本序号
+"""
+import numpy as np
+
+# 状态：converged/ok 为正常；其余均表示结果来自边界值或默认值
+CONVERGED = 'converged'
+OK = 'ok'
+CLIPPED_HIGH = 'clipped_high'      # 范围内无交点，PTE始终高于PE，取最大航速
+CLIPPED_LOW = 'clipped_low'        # 范围内无交点，PTE始终低于PE，取最小航速
+NO_CROSSING = 'no_crossing'        # 所需盘面比与对角线无交点，取最接近处
+LIMIT = 'limit'                    # σ超出限界线范围，τc取上限
+CLIPPED = 'clipped'                # 插值自变量或结果被限制在表格范围内
+NOT_CONVERGED = 'not_converged'    # 迭代求解器报告未收敛
+OUT_OF_RANGE = 'out_of_range'      # 解落在有效范围外被舍弃
+FAILED = 'failed'                  # 求解抛出异常或结果为nan
+NORMAL_STATUS = (CONVERGED, OK)
+
+DIAGNOSTICS_DTYPE = np.dtype([('solver', 'U24'), ('case', 'i8'), ('status', 'U16'), ('iterations', 'i4'),
+                              ('residual', 'f8'), ('extrapolated', '?'), ('detail', 'U64')])
+
+
+class SolverDiagnostics:
+    """一次运行的诊断记录，各求解器调用追加记录，按需汇总"""
+
+    def __init__(self, case_shape=()):
+        self.case_shape = tuple(case_shape)
+        self._parts = []
+
+    def _cases(self, shape):
+        # 样本沿末尾几维，前面的维（如盘面比网格）对应同一样本
+        n_cases = int(np.prod(self.case_shape))
+        size = int(np.prod(shape))
+        if self.case_shape and shape[len(shape) - len(self.case_shape):] == self.case_shape:
+            return np.arange(size) % n_cases
+        return np.zeros(size, dtype=int) if size == 1 else np.arange(size)
+
+    def record(self, solver, status, iterations=0, residual=np.nan, extrapolated=False, detail='', case=None):
+        """追加记录，status、iterations、residual、extrapolated 可为数组，按numpy规则广播"""
+        status, iterations, residual, extrapolated = np.broadcast_arrays(
+            np.asarray(status, dtype=DIAGNOSTICS_DTYPE['status']), np.asarray(iterations),
+            np.asarray(residual, dtype=float), np.asarray(extrapolated, dtype=bool))
+        part = np.empty(status.size, dtype=DIAGNOSTICS_DTYPE)
+        part['solver'] = solver
+        part['case'] = self._cases(status.shape) if case is None else np.broadcast_to(case, status.shape).ravel()
+        part['status'] = status.ravel()
+        part['iterations'] = iterations.ravel()
+        part['residual'] = residual.ravel()
+        part['extrapolated'] = extrapolated.ravel()
+        part['detail'] = detail
+        self._parts.append(part)
+
+    def records(self):
+        """全部记录的结构化数组（DIAGNOSTICS_DTYPE）"""
+        return np.concatenate(self._parts) if self._parts else np.zeros(0, dtype=DIAGNOSTICS_DTYPE)
+
+    def fallback_mask(self, records=None):
+        records = self.records() if records is None else records
+        return ~np.isin(records['status'], NORMAL_STATUS)
+
+    def fallback_cases(self, solver=None):
+        """结果来自边界值或默认值的样本序号"""
+        records = self.records()
+        mask = self.fallback_mask(records)
+        if solver is not None:
+            mask &= records['solver'] == solver
+        return np.unique(records['case'][mask])
+
+    def extrapolated_cases(self, solver=None):
+        """插值发生外插的样本序号"""
+        records = self.records()
+        mask = records['extrapolated'].copy()
+        if solver is not None:
+            mask &= records['solver'] == solver
+        return np.unique(records['case'][mask])
+
+    def summary(self):
+        """按求解器汇总：调用数、各状态计数、外插数、最大迭代次数与最大残差"""
+        records = self.records()
+        result = {}
+        for solver in dict.fromkeys(records['solver'].tolist()):
+            part = records[records['solver'] == solver]
+            statuses, counts = np.unique(part['status'], return_counts=True)
+            residual = part['residual'][~np.isnan(part['residual'])]
+            result[solver] = {'calls': len(part), 'status': dict(zip(statuses.tolist(), counts.tolist())),
+                              'fallback': int(self.fallback_mask(part).sum()),
+                              'extrapolated': int(part['extrapolated'].sum()),
+                              'max_iterations': int(part['iterations'].max()),
+                              'max_residual': float(residual.max()) if len(residual) else np.nan}
+        return result
+
+    def report(self, limit=10):
+        """文字报告：各求解器的汇总，以及最多 limit 条非正常记录"""
+        lines = []
+        for solver, s in self.summary().items():
+            status = '，'.join(f'{k} {v}' for k, v in s['status'].items())
+            residual = '' if np.isnan(s['max_residual']) else f"，最大残差 {s['max_residual']:.3g}"
+            lines.append(f"{solver}: {s['calls']} 次（{status}），外插 {s['extrapolated']} 次，"
+                         f"最大迭代 {s['max_iterations']}{residual}")
+        records = self.records()
+        abnormal = records[self.fallback_mask(records) | records['extrapolated']]
+        for r in abnormal[:limit]:
+            flag = '，外插' if r['extrapolated'] else ''
+            detail = f" [{r['detail']}]" if r['detail'] else ''
+            lines.append(f"  - {r['solver']} 样本 {r['case']}{detail}: {r['status']}{flag}，残差 {r['residual']:.3g}")
+        if len(abnormal) > limit:
+            lines.append(f"  …… 另有 {len(abnormal) - limit} 条")
+        return '\n'.join(lines) if lines else "没有求解记录"
+
+    def has_issues(self):
+        records = self.records()
+        return bool((self.fallback_mask(records) | records['extrapolated']).any())
+
+    def clear(self):
+        self._parts = []
+
+    def __len__(self):
+        return sum(len(part) for part in self._parts)
@@ -0,0 +1,212 @@
+"""可断点续算的长时间参数扫描
+
+扫描网格按线性下标分块，每算完一块立即写入 <目录>/chunks/chunk_XXXXXX.npz，
+随后更新 <目录>/manifest.json 记录已完成的块；两者都先写临时文件再 os.replace，
+进程在任何时刻被中止都不会留下半个文件。重新运行同一目录时跳过已完成的块，
+分块与 sweep_design_chain 相同，结果与一次算完完全一致。
+
+多台机器分担时，各机用 shard/shards 取连续的一段块、写入各自目录，
+算完后用 merge_shards 合并：
+
+    python sweep_runner.py config.json out_0 --shard 0 --shards 2
+    python sweep_runner.py config.json out_1 --shard 1 --shards 2
+    python sweep_runner.py --merge merged.npz out_0 out_1
+
+config.json 为 {"axes": {参数名: 取值列表}, "conditions": {...}, "outputs": [...], "chunk_size": ...}。
+"""
+import os
+import json
+import time
+import hashlib
+import argparse
+
+import numpy as np
+
+from design_chain import sweep_setup, sweep_chunk
+
+MANIFEST_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+DEFAULT_OUTPUTS = ('vmax', 'D', 'AE_A0', 'eta0')
+
+
+def _jsonable(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def _atomic_write(path, write):
+    """先写到同目录的临时文件再 os.replace 到目标路径"""
+    tmp = f'{path}.tmp{os.getpid()}'
+    try:
+        with open(tmp, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def shard_range(n_chunks, shard=0, shards=1):
+    """把 n_chunks 个块均分为 shards 段，返回第 shard 段的块号 range"""
+    if not 0 <= shard < shards:
+        raise ValueError(f"分片号 {shard} 超出范围 0~{shards - 1}")
+    return range(shard * n_chunks // shards, (shard + 1) * n_chunks // shards)
+
+
+class SweepRunner:
+    """一个扫描任务及其检查点目录
+
+    配置（各轴取值、工况、输出、块大小、数据类型）的哈希记在清单中，
+    目录里已有不同配置的清单时拒绝续算，避免把两个扫描的块混在一起。
+    """
+
+    def __init__(self, directory, axes, conditions=None, outputs=DEFAULT_OUTPUTS, chunk_size=65536,
+                 dtype='float64'):
+        self.directory = directory
+        self.axes, self.shape, self.conditions = sweep_setup(axes, conditions)
+        self.outputs = tuple(outputs)
+        self.chunk_size = int(chunk_size)
+        self.dtype = np.dtype(dtype)
+        self.total = int(np.prod(self.shape))
+        self.n_chunks = -(-self.total // self.chunk_size)
+        self.config = {'axes': {name: values.tolist() for name, values in self.axes.items()},
+                       'conditions': {key: _jsonable(value) for key, value in self.conditions.items()},
+                       'outputs': list(self.outputs), 'chunk_size': self.chunk_size, 'dtype': self.dtype.str}
+        self.fingerprint = hashlib.sha256(json.dumps(self.config, sort_keys=True).encode()).hexdigest()
+        self.manifest = self._load_manifest()
+
+    @classmethod
+    def open(cls, directory):
+        """按目录中的清单重建扫描任务"""
+        with open(os.path.join(directory, MANIFEST_NAME), encoding='utf-8') as f:
+            config = json.load(f)['config']
+        return cls(directory, config['axes'], config['conditions'], config['outputs'], config['chunk_size'],
+                   config['dtype'])
+
+    def chunk_path(self, index):
+        return os.path.join(self.directory, 'chunks', f'chunk_{index:06d}.npz')
+
+    def chunk_bounds(self, index):
+        start = index * self.chunk_size
+        return start, min(start + self.chunk_size, self.total)
+
+    def _load_manifest(self):
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return {'version': MANIFEST_VERSION, 'fingerprint': self.fingerprint, 'config': self.config,
+                    'n_chunks': self.n_chunks, 'completed': {}}
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('fingerprint') != self.fingerprint:
+            raise ValueError(f"目录 {self.directory} 中已有其他配置的扫描，请换用新目录")
+        return manifest
+
+    def _save_manifest(self):
+        data = json.dumps(self.manifest, ensure_ascii=False, indent=1).encode('utf-8')
+        _atomic_write(os.path.join(self.directory, MANIFEST_NAME), lambda f: f.write(data))
+
+    def completed(self):
+        """已完成且块文件存在的块号集合"""
+        return {int(i) for i in self.manifest['completed'] if os.path.exists(self.chunk_path(int(i)))}
+
+    def pending(self, chunks=None):
+        done = self.completed()
+        return [i for i in (chunks if chunks is not None else range(self.n_chunks)) if i not in done]
+
+    def run(self, chunks=None, progress=None):
+        """计算 chunks（默认全部）中尚未完成的块，progress(已完成数, 总数) 每块回调一次
+
+        返回本次计算的块数。
+        """
+        os.makedirs(os.path.join(self.directory, 'chunks'), exist_ok=True)
+        if not os.path.exists(os.path.join(self.directory, MANIFEST_NAME)):
+            self._save_manifest()
+        chunks = list(chunks if chunks is not None else range(self.n_chunks))
+        todo = self.pending(chunks)
+        for count, index in enumerate(todo, 1):
+            start, stop = self.chunk_bounds(index)
+            start_time = time.perf_counter()
+            part = sweep_chunk(self.axes, self.conditions, self.outputs, start, stop)
+            arrays = {key: np.asarray(part[key], dtype=self.dtype) for key in self.outputs}
+            _atomic_write(self.chunk_path(index), lambda f: np.savez(f, **arrays))
+            self.manifest['completed'][str(index)] = {'start': start, 'stop': stop,
+                                                     'time': time.perf_counter() - start_time}
+            self._save_manifest()
+            if progress is not None:
+                progress(len(chunks) - len(todo) + count, len(chunks))
+        return len(todo)
+
+    def result(self):
+        """读取全部块组装结果，格式同 sweep_design_chain；有块未完成时报错"""
+        return merge_shards([self.directory])
+
+
+def run_sweep(directory, axes, conditions=None, outputs=DEFAULT_OUTPUTS, chunk_size=65536, dtype='float64',
+              shard=0, shards=1, progress=None):
+    """运行（或续算）扫描的第 shard 段，返回 SweepRunner"""
+    runner = SweepRunner(directory, axes, conditions, outputs, chunk_size, dtype)
+    runner.run(shard_range(runner.n_chunks, shard, shards), progress)
+    return runner
+
+
+def merge_shards(directories):
+    """合并一个或多个分片目录的块，返回 {'axes', 'outputs'}，各分片的配置须一致"""
+    runners = [SweepRunner.open(directory) for directory in directories]
+    first = runners[0]
+    if any(runner.fingerprint != first.fingerprint for runner in runners[1:]):
+        raise ValueError("各分片的扫描配置不一致，不能合并")
+
+    sources = {}
+    for runner in runners:
+        for index in runner.completed():
+            sources.setdefault(index, runner)
+    missing = sorted(set(range(first.n_chunks)) - set(sources))
+    if missing:
+        raise ValueError(f"还有 {len(missing)} 个块未完成（如第 {missing[0]} 块），不能合并")
+
+    outputs = {key: np.empty(first.shape, dtype=first.dtype) for key in first.outputs}
+    flat = {key: value.reshape(-1) for key, value in outputs.items()}
+    for index, runner in sorted(sources.items()):
+        start, stop = first.chunk_bounds(index)
+        with np.load(runner.chunk_path(index), allow_pickle=False) as data:
+            for key in first.outputs:
+                flat[key][start:stop] = data[key]
+    return {'axes': first.axes, 'outputs': outputs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="可断点续算的设计链参数扫描")
+    parser.add_argument('config', nargs='?', help="扫描配置JSON文件")
+    parser.add_argument('directory', nargs='+', help="检查点目录；--merge 时为各分片目录")
+    parser.add_argument('--shard', type=int, default=0, help="本机计算的分片号")
+    parser.add_argument('--shards', type=int, default=1, help="分片总数")
+    parser.add_argument('--merge', metavar='OUTPUT', help="合并各分片目录并保存为npz")
+    args = parser.parse_args()
+
+    if args.merge:
+        directories = ([args.config] if args.config else []) + args.directory
+        result = merge_shards(directories)
+        np.savez_compressed(args.merge, **{f'axis/{k}': v for k, v in result['axes'].items()},
+                            **result['outputs'])
+        print(f"已合并 {len(directories)} 个目录，保存到 {args.merge}")
+        return
+
+    with open(args.config, encoding='utf-8') as f:
+        config = json.load(f)
+    runner = run_sweep(args.directory[0], config['axes'], config.get('conditions'),
+                       config.get('outputs', DEFAULT_OUTPUTS), config.get('chunk_size', 65536),
+                       config.get('dtype', 'float64'), args.shard, args.shards,
+                       progress=lambda done, total: print(f"\r块 {done}/{total}", end='', flush=True))
+    print(f"\n分片 {args.shard}/{args.shards} 完成，目录 {runner.directory} 共 {len(runner.completed())}"
+          f"/{runner.n_chunks} 块")
+
+
+if __name__ == '__main__':
+    main()
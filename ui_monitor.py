@@ -0,0 +1,151 @@
+"""界面响应监测：记录各标签页最近一次计算的耗时，并用看门狗检测Qt事件循环被阻塞的情况
+
+主线程中的定时器按固定间隔更新心跳时间；后台线程发现心跳停顿超过阈值（默认100 ms）时
+抓取主线程调用栈，记下正在运行的按钮处理函数，心跳恢复后在主线程中登记这次阻塞。
+这些数据用来判断哪些处理函数最需要移出界面线程。
+
+计算耗时只统计到处理函数第一次进入嵌套事件循环（如弹出“计算完成”对话框）为止，
+不包括用户阅读对话框的时间。
+"""
+import os
+import sys
+import time
+import functools
+import threading
+import traceback
+from collections import deque
+from contextlib import contextmanager
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from design_logging import get_logger
+
+logger = get_logger('ui')
+_PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def timed_handler(func):
+    """按钮处理函数装饰器：实例有 ui_monitor 时记录耗时和正在运行的处理函数
+
+    包装函数只接受 self，信号的 checked 等参数不会传入原函数。
+    """
+    @functools.wraps(func)
+    def wrapper(self):
+        monitor = getattr(self, 'ui_monitor', None)
+        if monitor is None:
+            return func(self)
+        with monitor.track(func.__name__):
+            return func(self)
+    return wrapper
+
+
+class UiMonitor(QObject):
+    """各标签页的计算耗时与事件循环阻塞记录
+
+    tab_name() 返回当前标签页名称；latency_recorded(标签页, 处理函数, 秒) 与
+    block_detected(记录字典) 信号均在主线程中发出。
+    """
+    latency_recorded = pyqtSignal(str, str, float)
+    block_detected = pyqtSignal(dict)
+
+    def __init__(self, tab_name, threshold=0.1, interval=0.02, history=200, parent=None):
+        super().__init__(parent)
+        self.tab_name = tab_name
+        self.threshold = threshold
+        self.interval = interval
+        self.latencies = {}  # 标签页 -> (处理函数, 秒)
+        self.blocks = deque(maxlen=history)
+        self.block_count = 0
+        self._active = []  # 正在运行的处理函数：[名称, 标签页, 开始时间, 首次进入事件循环的时间]
+        self._beat = time.perf_counter()
+        self._captured = None
+        self._main_id = threading.main_thread().ident
+        self._stop = threading.Event()
+        self._thread = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(interval * 1000))
+        self._timer.timeout.connect(self._heartbeat)
+
+    def current_tab(self):
+        return self.tab_name()
+
+    @contextmanager
+    def track(self, name, tab=None):
+        """记录一次处理函数的运行"""
+        entry = [name, tab or self.tab_name(), time.perf_counter(), None]
+        self._active.append(entry)
+        try:
+            yield
+        finally:
+            self._active.remove(entry)
+            end = entry[3] or time.perf_counter()
+            self.record(name, end - entry[2], entry[1])
+
+    def record(self, name, seconds, tab=None):
+        """登记一次计算耗时（后台计算完成时也可直接调用）"""
+        tab = tab or self.tab_name()
+        self.latencies[tab] = (name, seconds)
+        logger.debug("%(tab)s %(handler)s 用时 %(ms).1f ms", {'tab': tab, 'handler': name, 'ms': seconds * 1000})
+        self.latency_recorded.emit(tab, name, seconds)
+
+    def start(self):
+        self._beat = time.perf_counter()
+        self._timer.start()
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name='ui-watchdog', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _heartbeat(self):
+        now = time.perf_counter()
+        gap = now - self._beat
+        self._beat = now
+        # 处理函数运行中心跳仍在走，说明已进入嵌套事件循环（对话框），计算部分到此结束
+        for entry in self._active:
+            if entry[3] is None:
+                entry[3] = now
+        if gap - self.interval > self.threshold:
+            captured, self._captured = self._captured, None
+            block = dict(captured or self._describe(None), duration=gap - self.interval, time=time.time())
+            self.blocks.append(block)
+            self.block_count += 1
+            logger.warning("界面阻塞 %(ms).0f ms，处理函数 %(handler)s（%(location)s）",
+                           {'ms': block['duration'] * 1000, 'handler': block['handler'],
+                            'location': block['location']})
+            self.block_detected.emit(block)
+        else:
+            self._captured = None
+
+    def _watch(self):
+        while not self._stop.wait(self.interval / 2):
+            if self._captured is None and time.perf_counter() - self._beat > self.threshold + self.interval:
+                self._captured = self._describe(sys._current_frames().get(self._main_id))
+
+    def _describe(self, frame):
+        """阻塞时正在运行的处理函数及主线程中最内层的项目代码位置"""
+        stack = traceback.extract_stack(frame) if frame is not None else []
+        own = [f for f in stack if f.filename.startswith(_PROJECT_DIR) and f.filename != __file__]
+        if self._active:
+            handler, tab = self._active[-1][0], self._active[-1][1]
+        else:
+            # 未装饰的处理函数：取主程序调用栈中最外层的函数（事件循环之下第一层）
+            handler = own[1].name if len(own) > 1 else (own[0].name if own else '未知')
+            tab = self.tab_name()
+        location = f"{os.path.basename(own[-1].filename)}:{own[-1].lineno} {own[-1].name}" if own else ''
+        return {'handler': handler, 'tab': tab, 'location': location}
+
+    def report(self, limit=10):
+        """文字报告：各标签页最近一次计算耗时及最近的阻塞记录"""
+        lines = [f"{tab}: {name} {seconds * 1000:.1f} ms" for tab, (name, seconds) in self.latencies.items()]
+        lines.append(f"事件循环阻塞（>{self.threshold * 1000:.0f} ms）共 {self.block_count} 次")
+        for block in list(self.blocks)[-limit:]:
+            lines.append(f"  - {block['duration'] * 1000:.0f} ms  {block['tab']} {block['handler']}"
+                         + (f"（{block['location']}）" if block['location'] else ''))
+        return '\n'.join(lines)
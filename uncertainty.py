@@ -0,0 +1,57 @@
+"""设计输入不确定性分析：对伴流分数w、推力减额t、相对旋转效率ηR及有效功率曲线做蒙特卡洛抽样，
+经批量设计链传播后统计最大航速、直径、盘面比与主机功率的分布"""
+import time
+
+import numpy as np
+
+from design_chain import DEFAULT_CONDITIONS, evaluate_design_chain
+
+# 不确定输入及默认标准差（pe_scale为有效功率曲线的整体比例系数）
+UNCERTAIN_INPUTS = ('w', 't', 'eta_r', 'pe_scale')
+DEFAULT_SPREADS = {'w': 0.02, 't': 0.02, 'eta_r': 0.02, 'pe_scale': 0.05}
+# 抽样值的合理范围，超出时截断
+INPUT_LIMITS = {'w': (0.0, 0.7), 't': (0.0, 0.5), 'eta_r': (0.8, 1.2), 'pe_scale': (0.5, 1.5)}
+OUTPUTS = ('vmax', 'D', 'AE_A0', 'PS')
+
+
+def sample_inputs(size, nominal=None, spreads=None, seed=0, dtype=np.float64):
+    """按正态分布抽取不确定输入样本，nominal 为名义值，spreads 为标准差，样本按 dtype 存储"""
+    nominal = {key: DEFAULT_CONDITIONS[key] for key in UNCERTAIN_INPUTS} | dict(nominal or {})
+    spreads = DEFAULT_SPREADS | dict(spreads or {})
+    rng = np.random.default_rng(seed)
+    return {key: np.clip(rng.normal(nominal[key], spreads[key], size), *INPUT_LIMITS[key]).astype(dtype)
+            for key in UNCERTAIN_INPUTS}
+
+
+def summarize(values, percentiles=(5, 50, 95)):
+    """统计均值、标准差和分位数"""
+    values = np.asarray(values, dtype=float)
+    summary = {'mean': float(values.mean()), 'std': float(values.std())}
+    for p, v in zip(percentiles, np.percentile(values, percentiles)):
+        summary[f'p{p:g}'] = float(v)
+    return summary
+
+
+def monte_carlo(size=100000, nominal=None, spreads=None, conditions=None, chunk_size=50000,
+                percentiles=(5, 50, 95), seed=0, dtype=np.float64):
+    """蒙特卡洛不确定性传播
+
+    conditions 为设计链的其余确定工况（主机功率、转速、PE曲线等），样本分块送入设计链
+    以控制内存。dtype=np.float32 时样本与输出均按单精度存储，内存减半；与float64相比
+    Vmax、D、AE/A0、PS各样本的相对偏差不超过1e-7量级（单精度舍入）。
+    返回样本、各输出数组及其统计量。
+    """
+    start_time = time.perf_counter()
+    conditions = {key: value for key, value in (conditions or {}).items() if key not in UNCERTAIN_INPUTS}
+    samples = sample_inputs(size, nominal, spreads, seed, dtype)
+
+    outputs = {key: np.empty(size, dtype=dtype) for key in OUTPUTS}
+    for start in range(0, size, chunk_size):
+        part = {key: value[start:start + chunk_size] for key, value in samples.items()}
+        result = evaluate_design_chain(**part, **conditions)
+        for key in OUTPUTS:
+            outputs[key][start:start + chunk_size] = result[key]
+
+    return {'samples': samples, 'outputs': outputs,
+            'summary': {key: summarize(outputs[key], percentiles) for key in OUTPUTS},
+            'time': time.perf_counter() - start_time}
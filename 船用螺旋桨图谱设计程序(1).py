@@ -1,171 +1,59 @@
 import sys
+import os
 import csv
-import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout,
                              QGroupBox, QFormLayout, QLabel, QLineEdit, QPushButton,
                              QTableWidget, QTableWidgetItem, QTextEdit, QHBoxLayout,
                              QFileDialog, QMessageBox, QGridLayout, QRadioButton,
                              QDialog, QDialogButtonBox, QSpinBox, QDoubleSpinBox, QComboBox,
-                             QFrame, QSizePolicy, QSpacerItem)
+                             QFrame, QSizePolicy, QSpacerItem, QCheckBox)
 from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QPixmap, QFontDatabase
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer
 from scipy.optimize import fsolve
-from scipy.interpolate import interp1d, Akima1DInterpolator, CubicSpline
+from scipy.interpolate import CubicSpline
 import matplotlib
 
+from propeller_core import (AUCoefficients, AU_POLYNOMIALS, BP_CHART_DATA, get_chart_surface, solve_max_speed,
+                            chart_design_point, solve_optimum_area_ratio, calc_kt_kq, calc_open_water, bollard_pull,
+                            MAU_THICKNESS, STRENGTH_RULE_COEFFS, calc_strength, blade_section_integrals,
+                            calc_pitch_correction, pitch_correction_report,
+                            calculate_cavitation as core_cavitation, get_tau_c as core_tau_c)
+from open_water_atlas import load_atlas
+from design_records import DesignInputs, DesignPoint, CAVITATION_DTYPE, compute_voyage
+from design_session import save_session, load_session
+from design_compare import DEFAULT_DESIGN, SUMMARY_FIELDS, evaluate_design, summary_table
+from solver_diagnostics import SolverDiagnostics, CONVERGED, NOT_CONVERGED, OUT_OF_RANGE, FAILED
+from design_logging import get_logger, configure_logging
+from ui_monitor import UiMonitor, timed_handler
+
 matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
 # 解决matplotlib中文显示问题
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
 
-plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'SimSun']  # 用来正常显示中文标签
+# 只保留已安装的中文字体，缺失的字体每次绘制文字都会重新查找，显著拖慢重绘
+_installed_fonts = {font.name for font in font_manager.fontManager.ttflist}
+plt.rcParams['font.sans-serif'] = [name for name in ('SimHei', 'Microsoft YaHei', 'SimSun')
+                                   if name in _installed_fonts] + ['DejaVu Sans']  # 用来正常显示中文标签
 plt.rcParams['axes.unicode_minus'] = False  # 用来正常显示负号
 plt.rcParams['font.size'] = 10  # 设置全局字体大小
 
-# ---------- 全局常量 ----------
-SIGMA_WAG = [0.1136, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0, 1.488]
-TAU_C_WAG = [0.0777, 0.135, 0.1582, 0.1846, 0.206, 0.2304, 0.2633, 0.2876, 0.34]
-SIGMA_BER = [0.36, 0.389, 0.407, 0.416, 0.481, 0.54, 0.6, 0.7, 0.806, 0.834, 0.848, 0.9, 1.82]
-TAU_C_BER = [0.14, 0.162, 0.164, 0.169, 0.175, 0.190, 0.200, 0.223, 0.224, 0.227, 0.228, 0.251, 0.35]
-
-MAU_THICKNESS = {'0.2R': 4.06, '0.3R': 3.59, '0.4R': 3.12, '0.5R': 2.65,
-                 '0.6R': 2.18, '0.7R': 1.71, '0.8R': 1.24, '0.9R': 0.77, '1.0R': 0.30}
-MAU_WIDTH = {'0.2R': 66.54, '0.3R': 77.70, '0.4R': 87.08, '0.5R': 94.34,
-             '0.6R': 99.11, '0.7R': 99.64, '0.8R': 92.92, '0.9R': 73.62, '1.0R': 0.0}
-SIMPSON_COEFF = {'0.2R': 1, '0.3R': 4, '0.4R': 2, '0.5R': 4, '0.6R': 2,
-                 '0.7R': 4, '0.8R': 2, '0.9R': 4, '1.0R': 1}
-AREA_COEFF = {'0.2R': 0.674, '0.3R': 0.674, '0.4R': 0.674, '0.5R': 0.6745,
-              '0.6R': 0.6745, '0.7R': 0.677, '0.8R': 0.683, '0.9R': 0.695, '1.0R': 0.700}
-
-
-# MAU螺旋桨系数管理类
-class AUCoefficients:
-    """AU螺旋桨系数管理类"""
-
-    def __init__(self):
-        # 4叶桨KT系数表
-        self.kt_coeffs_4 = [
-            {'value': -0.2536277E-01, 'i': 0, 'j': 0, 'k': 0},
-            {'value': -0.2072556E+00, 'i': 0, 'j': 1, 'k': 0},
-            {'value': 0.5724472E+00, 'i': 1, 'j': 0, 'k': 0},
-            {'value': 0.1939063E+00, 'i': 2, 'j': 0, 'k': 3},
-            {'value': -0.2890781E+00, 'i': 0, 'j': 2, 'k': 2},
-            {'value': -0.1074432E+01, 'i': 1, 'j': 2, 'k': 2},
-            {'value': -0.2131741E+00, 'i': 2, 'j': 0, 'k': 0},
-            {'value': 0.2703334E+00, 'i': 2, 'j': 0, 'k': 1},
-            {'value': 0.1870137E-01, 'i': 3, 'j': 1, 'k': 0},
-            {'value': 0.9646077E+00, 'i': 0, 'j': 3, 'k': 3},
-            {'value': -0.2029306E+00, 'i': 0, 'j': 4, 'k': 3},
-            {'value': 0.1305797E-02, 'i': 7, 'j': 0, 'k': 1},
-            {'value': -0.5234681E-01, 'i': 0, 'j': 0, 'k': 1},
-            {'value': -0.1710635E+00, 'i': 0, 'j': 2, 'k': 0},
-            {'value': 0.7317558E+00, 'i': 1, 'j': 2, 'k': 1},
-            {'value': -0.1049158E+00, 'i': 1, 'j': 0, 'k': 2},
-            {'value': 0.6117029E-01, 'i': 5, 'j': 1, 'k': 3},
-            {'value': -0.1214246E+00, 'i': 0, 'j': 3, 'k': 1},
-            {'value': -0.5872456E-02, 'i': 7, 'j': 2, 'k': 1},
-            {'value': -0.1525986E+00, 'i': 1, 'j': 1, 'k': 1},
-            {'value': 0.1006423E-02, 'i': 7, 'j': 4, 'k': 1},
-            {'value': -0.8940443E-01, 'i': 4, 'j': 0, 'k': 3}
-        ]
-
-        # 4叶桨KQ系数表
-        self.kq_coeffs_4 = [
-            {'value': 0.3899004E-01, 'i': 0, 'j': 0, 'k': 0},
-            {'value': 0.2886616E+00, 'i': 2, 'j': 0, 'k': 0},
-            {'value': 0.9977187E-01, 'i': 1, 'j': 1, 'k': 0},
-            {'value': 0.7850744E+00, 'i': 2, 'j': 0, 'k': 1},
-            {'value': 0.1847187E+00, 'i': 0, 'j': 2, 'k': 2},
-            {'value': -0.6893466E-01, 'i': 3, 'j': 0, 'k': 0},
-            {'value': 0.9402823E+00, 'i': 0, 'j': 3, 'k': 3},
-            {'value': -0.4649396E+00, 'i': 1, 'j': 2, 'k': 2},
-            {'value': -0.5417402E+00, 'i': 0, 'j': 4, 'k': 3},
-            {'value': 0.1052512E+00, 'i': 3, 'j': 2, 'k': 1},
-            {'value': -0.3419544E+00, 'i': 1, 'j': 0, 'k': 3},
-            {'value': -0.2585986E+00, 'i': 0, 'j': 4, 'k': 0},
-            {'value': 0.3239788E-01, 'i': 6, 'j': 1, 'k': 1},
-            {'value': -0.5742804E-01, 'i': 2, 'j': 3, 'k': 0},
-            {'value': -0.7892603E+00, 'i': 1, 'j': 1, 'k': 1},
-            {'value': -0.5324799E+00, 'i': 0, 'j': 2, 'k': 1},
-            {'value': 0.4870383E-02, 'i': 3, 'j': 3, 'k': 0},
-            {'value': 0.3483905E+00, 'i': 1, 'j': 4, 'k': 1},
-            {'value': 0.3204546E-01, 'i': 4, 'j': 3, 'k': 0},
-            {'value': 0.5473935E-02, 'i': 7, 'j': 4, 'k': 3},
-            {'value': 0.1084547E-01, 'i': 5, 'j': 0, 'k': 1},
-            {'value': -0.1448536E+00, 'i': 4, 'j': 3, 'k': 1},
-            {'value': 0.2210349E+00, 'i': 1, 'j': 3, 'k': 0},
-            {'value': -0.5244457E-01, 'i': 4, 'j': 1, 'k': 0},
-            {'value': 0.3545902E+00, 'i': 0, 'j': 1, 'k': 3},
-            {'value': -0.1878683E-01, 'i': 6, 'j': 0, 'k': 2}
-        ]
+logger = get_logger('gui')
 
-        # 5叶桨KT系数表
-        self.kt_coeffs_5 = [
-            {'value': 0.5367018E-01, 'i': 0, 'j': 0, 'k': 0},
-            {'value': -0.3023566E+00, 'i': 0, 'j': 1, 'k': 0},
-            {'value': 0.4333625E+00, 'i': 1, 'j': 0, 'k': 0},
-            {'value': -0.1065471E+00, 'i': 0, 'j': 2, 'k': 1},
-            {'value': -0.6582904E+00, 'i': 2, 'j': 0, 'k': 3},
-            {'value': 0.1189101E+00, 'i': 1, 'j': 3, 'k': 1},
-            {'value': -0.4408557E-03, 'i': 6, 'j': 0, 'k': 0},
-            {'value': -0.3317857E-01, 'i': 1, 'j': 4, 'k': 1},
-            {'value': 0.1151124E+01, 'i': 2, 'j': 0, 'k': 2},
-            {'value': 0.1960773E+00, 'i': 0, 'j': 0, 'k': 3},
-            {'value': -0.9747062E-01, 'i': 3, 'j': 0, 'k': 1},
-            {'value': 0.2036384E+00, 'i': 1, 'j': 1, 'k': 0},
-            {'value': -0.2566153E+00, 'i': 1, 'j': 1, 'k': 1},
-            {'value': -0.1370242E+00, 'i': 0, 'j': 2, 'k': 0},
-            {'value': -0.2874294E+00, 'i': 0, 'j': 0, 'k': 2},
-            {'value': -0.2854609E+00, 'i': 2, 'j': 0, 'k': 1}
-        ]
-
-        # 5叶桨KQ系数表
-        self.kq_coeffs_5 = [
-            {'value': -0.9251390E-01, 'i': 0, 'j': 0, 'k': 0},
-            {'value': -0.1229000E+00, 'i': 2, 'j': 0, 'k': 0},
-            {'value': 0.3050697E+00, 'i': 1, 'j': 1, 'k': 0},
-            {'value': -0.2935303E+00, 'i': 0, 'j': 2, 'k': 0},
-            {'value': -0.3991474E+00, 'i': 2, 'j': 0, 'k': 1},
-            {'value': -0.1022050E+01, 'i': 1, 'j': 1, 'k': 1},
-            {'value': 0.1022833E-01, 'i': 7, 'j': 0, 'k': 0},
-            {'value': 0.3521100E-02, 'i': 1, 'j': 0, 'k': 3},
-            {'value': 0.2552059E-02, 'i': 5, 'j': 2, 'k': 0},
-            {'value': 0.2143532E+00, 'i': 0, 'j': 1, 'k': 3},
-            {'value': 0.7131110E-03, 'i': 4, 'j': 4, 'k': 0},
-            {'value': 0.2078488E+00, 'i': 1, 'j': 2, 'k': 1},
-            {'value': 0.6397058E+00, 'i': 1, 'j': 0, 'k': 0},
-            {'value': 0.9404846E-03, 'i': 7, 'j': 1, 'k': 0},
-            {'value': -0.2930044E-01, 'i': 0, 'j': 1, 'k': 1},
-            {'value': -0.7807623E-01, 'i': 0, 'j': 4, 'k': 0},
-            {'value': -0.3025523E+00, 'i': 2, 'j': 2, 'k': 3},
-            {'value': 0.1855105E+00, 'i': 1, 'j': 3, 'k': 1},
-            {'value': -0.6724210E+00, 'i': 2, 'j': 1, 'k': 2},
-            {'value': -0.2087142E+00, 'i': 4, 'j': 0, 'k': 3},
-            {'value': 0.9400654E+00, 'i': 3, 'j': 0, 'k': 1},
-            {'value': 0.9316346E+00, 'i': 2, 'j': 1, 'k': 3},
-            {'value': -0.4348397E-01, 'i': 6, 'j': 0, 'k': 0}
-        ]
-
-        # 当前选中的系数表
-        self.current_kt_coeffs = self.kt_coeffs_4
-        self.current_kq_coeffs = self.kq_coeffs_4
-
-    def update_coefficients_by_blade_count(self, blade_count):
-        """根据桨叶数更新当前系数表"""
-        if blade_count == 4:
-            self.current_kt_coeffs = self.kt_coeffs_4
-            self.current_kq_coeffs = self.kq_coeffs_4
-            return True
-        elif blade_count == 5:
-            self.current_kt_coeffs = self.kt_coeffs_5
-            self.current_kq_coeffs = self.kq_coeffs_5
-            return True
-        else:
-            return False
+# ---------- 全局常量 ----------
+LIVE_DEBOUNCE_MS = 30  # 敞水曲线实时预览的防抖间隔
+LIVE_DEBOUNCE_MAX_MS = 240  # 超出帧时间预算时防抖间隔的上限
+LIVE_FRAME_BUDGET_MS = 16  # 实时预览每帧的时间预算
+LIVE_SETTLE_MS = 300  # 实时预览参数停止变化后再更新标题
 
 
 class StyledButton(QPushButton):
@@ -322,6 +210,216 @@ class StyledTextEdit(QTextEdit):
         """)
 
 
+class BlitCanvas(FigureCanvas):
+    """支持曲线原地更新的画布：按子图缓存背景，只重绘有变化的子图
+
+    位置相同的子图（如twinx双坐标轴）为一组，每组占据一块互不重叠的区域。坐标范围不变的组
+    只恢复背景并局部重绘(blitting)动态图元；坐标范围变化或 stale 指定的组在自己的区域内
+    单独重绘；首次绘图、relayout 或外部重绘（缩放、窗口尺寸变化）后才完整重绘。
+    """
+    HEADROOM = 0.15  # 'grow' 模式重设纵坐标范围时两端预留的比例
+    MIN_FILL = 0.4  # 'grow' 模式数据只占纵坐标范围的比例低于此值时收缩
+
+    def __init__(self, figure):
+        super().__init__(figure)
+        self.artists = {}  # 动态图元，按键保存以便重复绘图时原地更新
+        self._blank = None  # 不含子图的整幅背景，重绘单个子图组时用来擦除
+        self._groups = {}  # 组键 -> {'axes', 'bbox', 'background', 'dirty'}
+        self._limits = {}
+        self._capturing = False
+        self.mpl_connect('draw_event', self._on_draw)
+
+    def artist(self, key, factory):
+        """按键获取动态图元，不存在时调用factory创建"""
+        if key not in self.artists:
+            self.artists[key] = factory()
+        return self.artists[key]
+
+    def _on_draw(self, event):
+        # 缩放、平移、窗口尺寸变化等外部重绘后背景失效
+        if not self._capturing:
+            self._blank = None
+
+    def _group_axes(self):
+        groups = {}
+        for ax in self.figure.axes:
+            groups.setdefault(tuple(round(v, 6) for v in ax.get_position().bounds), []).append(ax)
+        return groups
+
+    def _cells(self, groups):
+        """按完整重绘时的紧凑边界为各组划分区域，向四周扩展到与相邻组的中线或图边"""
+        renderer = self.get_renderer()
+        tight = {key: Bbox.union([ax.get_tightbbox(renderer) for ax in axes]) for key, axes in groups.items()}
+        fig = self.figure.bbox
+        cells = {}
+        for key, box in tight.items():
+            x0, y0, x1, y1 = fig.x0, fig.y0, fig.x1, fig.y1
+            for other, o in tight.items():
+                if other == key:
+                    continue
+                if o.y0 < box.y1 and o.y1 > box.y0:
+                    if o.x1 <= box.x0:
+                        x0 = max(x0, (o.x1 + box.x0) / 2)
+                    elif o.x0 >= box.x1:
+                        x1 = min(x1, (o.x0 + box.x1) / 2)
+                if o.x0 < box.x1 and o.x1 > box.x0:
+                    if o.y1 <= box.y0:
+                        y0 = max(y0, (o.y1 + box.y0) / 2)
+                    elif o.y0 >= box.y1:
+                        y1 = min(y1, (o.y0 + box.y1) / 2)
+            cells[key] = Bbox([[round(x0), round(y0)], [round(x1), round(y1)]])
+        return cells
+
+    def _region(self, bbox):
+        """显示坐标的 Bbox 转为 restore_region 使用的像素范围（原点在左上角）"""
+        height = round(self.figure.bbox.height)
+        return (int(bbox.x0), height - int(bbox.y1), int(bbox.x1), height - int(bbox.y0))
+
+    def _draw_dynamic(self, axes):
+        for artist in self.artists.values():
+            if artist.get_visible() and artist.axes in axes:
+                self.figure.draw_artist(artist)
+
+    def _dirty_bbox(self, group):
+        """组内动态图元所在区域：子图区域加上不受子图裁剪的动态图元（如标注）"""
+        renderer = self.get_renderer()
+        boxes = [ax.bbox for ax in group['axes']]
+        boxes += [artist.get_window_extent(renderer) for artist in self.artists.values()
+                  if artist.axes in group['axes'] and artist.get_visible() and not artist.get_clip_on()]
+        return Bbox.intersection(Bbox.union(boxes).padded(2), group['bbox']) or group['bbox']
+
+    def _hide_dynamic(self):
+        visible = {artist: artist.get_visible() for artist in self.artists.values()}
+        for artist in visible:
+            artist.set_visible(False)
+        return visible
+
+    def _full_redraw(self, groups):
+        """完整重绘一次，缓存空白背景和各组子图的背景"""
+        self._capturing = True
+        visible = self._hide_dynamic()
+        try:
+            shown = {ax: ax.get_visible() for ax in self.figure.axes}
+            for ax in shown:
+                ax.set_visible(False)
+            self.draw()
+            self._blank = self.copy_from_bbox(self.figure.bbox)
+            for ax, flag in shown.items():
+                ax.set_visible(flag)
+            self.draw()
+            self._groups = {key: {'axes': groups[key], 'bbox': bbox, 'background': self.copy_from_bbox(bbox),
+                                  'dirty': bbox}
+                            for key, bbox in self._cells(groups).items()}
+        finally:
+            for artist, flag in visible.items():
+                artist.set_visible(flag)
+            self._capturing = False
+        for group in self._groups.values():
+            self._draw_dynamic(group['axes'])
+        self.blit(self.figure.bbox)
+
+    def _redraw_groups(self, keys):
+        """在空白背景上重绘指定子图组并更新背景缓存，区域与其他组重叠时一并重绘"""
+        keys = set(keys)
+        pending = list(keys)
+        while pending:
+            bbox = self._groups[pending.pop()]['bbox']
+            for key, group in self._groups.items():
+                if key not in keys and group['bbox'].overlaps(bbox):
+                    keys.add(key)
+                    pending.append(key)
+        visible = self._hide_dynamic()
+        try:
+            for key in keys:
+                self.restore_region(self._blank, bbox=self._region(self._groups[key]['bbox']), xy=(0, 0))
+            for key in keys:
+                group = self._groups[key]
+                for ax in group['axes']:
+                    self.figure.draw_artist(ax)
+            for key in keys:
+                group = self._groups[key]
+                group['background'] = self.copy_from_bbox(group['bbox'])
+        finally:
+            for artist, flag in visible.items():
+                artist.set_visible(flag)
+        return keys
+
+    def _grow_limits(self, ax):
+        """纵坐标在数据超出范围或只占范围很小一部分时才重设，并预留余量"""
+        ax.autoscale_view(scaley=False)
+        d0, d1 = ax.dataLim.intervaly
+        if not (ax.get_autoscaley_on() and np.isfinite(d0) and np.isfinite(d1)):
+            return
+        y0, y1 = sorted(ax.get_ylim())
+        if ax not in self._limits or d0 < y0 or d1 > y1 or d1 - d0 < self.MIN_FILL * (y1 - y0):
+            span = max(d1 - d0, 1e-6 * max(abs(d0), abs(d1), 1.0))
+            ax.set_ylim(d0 - self.HEADROOM * span, d1 + self.HEADROOM * span, auto=True)
+
+    def refresh(self, relayout=False, autoscale=True, stale=()):
+        """刷新画布，只重绘坐标范围变化或 stale 中子图所在的组
+
+        autoscale为'grow'时纵坐标带余量且只在必要时重设，重复绘图时尽量保持坐标范围不变以便局部重绘。
+        """
+        if autoscale:
+            for ax in self.figure.axes:
+                ax.relim(visible_only=True)
+                if autoscale == 'grow':
+                    self._grow_limits(ax)
+                else:
+                    ax.autoscale_view()
+        limits = {ax: (ax.get_xlim(), ax.get_ylim()) for ax in self.figure.axes}
+        groups = self._group_axes()
+        if relayout or self._blank is None or groups.keys() != self._groups.keys():
+            self._full_redraw(groups)
+        else:
+            changed = [key for key, axes in groups.items()
+                       if any(ax in stale or limits[ax] != self._limits.get(ax) for ax in axes)]
+            self._capturing = True
+            try:
+                redrawn = self._redraw_groups(changed) if changed else set()
+                for key, group in self._groups.items():
+                    if key not in redrawn:
+                        self.restore_region(group['background'])
+                    self._draw_dynamic(group['axes'])
+                # 重绘的组刷新整个区域，其余组只刷新动态图元本次和上次所在的区域
+                for key, group in self._groups.items():
+                    dirty = self._dirty_bbox(group)
+                    self.blit(group['bbox'] if key in redrawn else Bbox.union([dirty, group['dirty']]))
+                    group['dirty'] = dirty
+            finally:
+                self._capturing = False
+        self._limits = limits
+
+
+class PlotWindow(QDialog):
+    """可复用的绘图窗口，重复绘图时不再新建窗口、画布和工具栏"""
+
+    def __init__(self, title, geometry, figsize, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setGeometry(*geometry)
+        self.figure = Figure(figsize=figsize, dpi=100)
+        self.canvas = BlitCanvas(self.figure)
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        self.legend_labels = None
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+        self.setLayout(layout)
+
+    def update_legends(self, labels, **kwargs):
+        """图例标签变化时重建图例，返回需要重绘的子图"""
+        labels = tuple(labels)
+        if labels == self.legend_labels:
+            return []
+        axes = [ax for ax in self.figure.axes if ax.get_legend_handles_labels()[0]]
+        for ax in axes:
+            ax.legend(**kwargs)
+        self.legend_labels = labels
+        return axes
+
+
 class PropellerDesignSystem(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -369,17 +467,58 @@ class PropellerDesignSystem(QMainWindow):
         """)
 
         # 初始化变量
-        self.res = {}
-        self.opt_res = {}
-        self.mass_details = []
+        self.res = None  # DesignInputs
+        self.opt_res = None  # DesignPoint
+        self.mass_details = {}
         self.au_coeffs = AUCoefficients()
-        self.cavitation_results = {}
-        self.optimum_results = {}
+        self.cavitation_results = None  # CAVITATION_DTYPE 结构化数组
+        self.optimum_results = None  # DesignPoint
+        self.voyage_results = None  # VoyageResults
+        self.compare_results = []  # 各方案的对比结果
+        self.compare_executor = None  # 方案对比的进程池，首次使用时创建
+        self.compare_futures = []
+        self.compare_names = []
+        self.diagnostics = {}  # 各计算阶段最近一次运行的 SolverDiagnostics
         self.blade_count = 4
+        self.plot_windows = {}  # 复用的绘图窗口
+        self.ow_atlas = load_atlas()  # 敞水性能图集，没有图集文件时为None；勾选状态栏选项后才使用
 
         # 创建主界面
         self.init_ui()
 
+        # 状态栏：当前标签页上次计算的耗时，以及事件循环阻塞统计
+        self.ui_monitor = UiMonitor(lambda: self.tabs.tabText(self.tabs.currentIndex()), parent=self)
+        self.latency_label = QLabel("")
+        self.block_label = QLabel("")
+        self.atlas_check = QCheckBox("敞水性能查图集")
+        if self.ow_atlas is None:
+            self.atlas_check.setEnabled(False)
+            self.atlas_check.setToolTip("未找到图集文件，运行 open_water_atlas.py 生成；当前按AU多项式计算")
+        else:
+            self.atlas_check.setToolTip("勾选后敞水曲线、系柱与航行特性的KT、KQ由图集插值，否则按AU多项式计算")
+        self.statusBar().addWidget(self.latency_label)
+        self.statusBar().addPermanentWidget(self.atlas_check)
+        self.statusBar().addPermanentWidget(self.block_label)
+        self.ui_monitor.latency_recorded.connect(self.update_latency_status)
+        self.ui_monitor.block_detected.connect(self.update_block_status)
+        self.tabs.currentChanged.connect(self.update_latency_status)
+        self.ui_monitor.start()
+
+    def update_latency_status(self, *args):
+        """状态栏显示当前标签页最近一次计算的耗时，悬停提示列出全部标签页"""
+        tab = self.ui_monitor.current_tab()
+        if tab in self.ui_monitor.latencies:
+            name, seconds = self.ui_monitor.latencies[tab]
+            self.latency_label.setText(f"本页上次计算: {name} {seconds * 1000:.1f} ms")
+        else:
+            self.latency_label.setText("本页尚未计算")
+        self.latency_label.setToolTip("\n".join(f"{t}: {n} {s * 1000:.1f} ms"
+                                                for t, (n, s) in self.ui_monitor.latencies.items()))
+
+    def update_block_status(self, block):
+        self.block_label.setText(f"界面阻塞 {self.ui_monitor.block_count} 次，最近 {block['duration'] * 1000:.0f} ms"
+                                 f"（{block['handler']}）")
+
     def setup_high_dpi_support(self):
         """设置高DPI支持以改善字体渲染"""
         try:
@@ -476,10 +615,40 @@ class PropellerDesignSystem(QMainWindow):
         self.tabs.addTab(self.create_open_water_tab(), "🌊 敞水曲线")
         self.tabs.addTab(self.create_mooring_tab(), "⚓ 系柱计算")
         self.tabs.addTab(self.create_voyage_characteristics_tab(), "📊 航行特性")
+        self.tabs.addTab(self.create_compare_tab(), "🆚 方案对比")
 
         main_layout.addWidget(self.tabs)
         self.setCentralWidget(central_widget)
 
+    def uses_atlas(self, blade_count):
+        """是否按图集查表：须勾选状态栏选项，且图集中有该叶数的数据"""
+        return (self.ow_atlas is not None and self.atlas_check.isChecked()
+                and self.ow_atlas.supports(blade_count))
+
+    def open_water_source(self, blade_count):
+        return "图集查表" if self.uses_atlas(blade_count) else "AU多项式"
+
+    def open_water(self, J, p_d, ae_a0, blade_count):
+        """敞水性能 (KT, 10KQ, η0)：选用图集时查表，否则按AU多项式计算"""
+        if self.uses_atlas(blade_count):
+            return self.ow_atlas.lookup(J, p_d, ae_a0, blade_count)
+        return calc_open_water(J, p_d, ae_a0, blade_count)
+
+    def open_water_kt_kq(self, J, p_d, ae_a0, blade_count):
+        """敞水性能 (KT, KQ)：选用图集时查表，否则按AU多项式计算"""
+        if self.uses_atlas(blade_count):
+            return self.ow_atlas.kt_kq(J, p_d, ae_a0, blade_count)
+        return calc_kt_kq(J, p_d, ae_a0, blade_count)
+
+    def get_plot_window(self, key, title, geometry, figsize):
+        """获取复用的绘图窗口，返回 (窗口, 是否新建)"""
+        window = self.plot_windows.get(key)
+        if window is not None:
+            return window, False
+        window = PlotWindow(title, geometry, figsize, self)
+        self.plot_windows[key] = window
+        return window, True
+
     def create_styled_input(self, label_text, default_value=""):
         """创建带标签的样式化输入"""
         label = QLabel(label_text)
@@ -580,10 +749,16 @@ class PropellerDesignSystem(QMainWindow):
         self.btn_calc_speed = StyledButton("计算航速")
         self.btn_clear = StyledButton("清空数据")
         self.btn_plot_speed = StyledButton("绘制曲线")
+        self.btn_save_session = StyledButton("保存会话")
+        self.btn_load_session = StyledButton("打开会话")
+        self.btn_diagnostics = StyledButton("求解诊断")
 
         btn_layout.addWidget(self.btn_calc_speed)
         btn_layout.addWidget(self.btn_clear)
         btn_layout.addWidget(self.btn_plot_speed)
+        btn_layout.addWidget(self.btn_save_session)
+        btn_layout.addWidget(self.btn_load_session)
+        btn_layout.addWidget(self.btn_diagnostics)
         lay.addLayout(btn_layout)
 
         # 结果表格
@@ -601,6 +776,9 @@ class PropellerDesignSystem(QMainWindow):
         self.btn_calc_speed.clicked.connect(self.calculate_max_speed)
         self.btn_clear.clicked.connect(self.clear_all)
         self.btn_plot_speed.clicked.connect(self.plot_max_speed_results)
+        self.btn_save_session.clicked.connect(self.save_session)
+        self.btn_load_session.clicked.connect(self.load_session)
+        self.btn_diagnostics.clicked.connect(self.show_diagnostics)
 
         return w
 
@@ -613,6 +791,7 @@ class PropellerDesignSystem(QMainWindow):
         else:  # 5叶桨
             self.tbl_speed.setVerticalHeaderLabels(["MAU5-50", "MAU5-65", "MAU5-80"])
 
+    @timed_handler
     def calculate_max_speed(self):
         try:
             # 首先检查必要的输入控件是否存在
@@ -689,11 +868,8 @@ class PropellerDesignSystem(QMainWindow):
             pd = ps * 0.9 * eta_s * eta_r
             eta_h = (1 - t) / (1 - w)
 
-            self.res = {
-                'PD': pd, 'N': n, 'w': w, 't': t,
-                'eta_H': eta_h, 'speeds': speeds, 'pes': pes,
-                'Ps': ps, 'eta_s': eta_s, 'eta_r': eta_r
-            }
+            self.res = DesignInputs(PD=pd, N=n, w=w, t=t, eta_H=eta_h, speeds=speeds, pes=pes,
+                                    Ps=ps, eta_s=eta_s, eta_r=eta_r)
 
             # 根据桨叶数选择型号
             if self.blade_count == 4:
@@ -701,14 +877,19 @@ class PropellerDesignSystem(QMainWindow):
             else:  # 5叶桨
                 types = ["MAU5-50", "MAU5-65", "MAU5-80"]
 
-            print(f"计算参数: PD={pd:.1f}kW, N={n}rpm, w={w:.3f}, t={t:.3f}")
-            print(f"航速范围: {min(speeds)}-{max(speeds)}kn, 功率范围: {min(pes)}-{max(pes)}kW")
+            logger.debug("计算参数: PD=%(PD).1fkW, N=%(N)srpm, w=%(w).3f, t=%(t).3f",
+                         {'PD': pd, 'N': n, 'w': w, 't': t})
+            logger.debug("航速范围: %(v_min)s-%(v_max)skn, 功率范围: %(pe_min)s-%(pe_max)skW",
+                         {'v_min': min(speeds), 'v_max': max(speeds), 'pe_min': min(pes), 'pe_max': max(pes)})
 
             # 计算每个型号的结果
+            diagnostics = self.diagnostics['max_speed'] = SolverDiagnostics()
             for row, tp in enumerate(types):
                 try:
-                    vmax, p_d, delta, D, eta0 = self.calculate_for_type(tp, speeds, pes)
-                    print(f"型号 {tp}: Vmax={vmax:.2f}kn, P/D={p_d:.3f}, δ={delta:.1f}, D={D:.3f}m, η0={eta0:.4f}")
+                    vmax, p_d, delta, D, eta0 = self.calculate_for_type(tp, speeds, pes, diagnostics)
+                    logger.debug("型号 %(type)s: Vmax=%(vmax).2fkn, P/D=%(p_d).3f, δ=%(delta).1f, D=%(D).3fm, "
+                                 "η0=%(eta0).4f", {'type': tp, 'vmax': vmax, 'p_d': p_d, 'delta': delta, 'D': D,
+                                                   'eta0': eta0})
 
                     # 更新表格
                     for col, val in enumerate(
@@ -718,7 +899,8 @@ class PropellerDesignSystem(QMainWindow):
                         self.tbl_speed.setItem(row, col, item)
 
                 except Exception as e:
-                    print(f"计算型号 {tp} 时出错: {str(e)}")
+                    diagnostics.record('max_speed', FAILED, detail=tp)
+                    logger.warning("计算型号 %(type)s 时出错: %(error)s", {'type': tp, 'error': str(e)})
                     # 在表格中显示错误信息
                     for col in range(6):
                         error_msg = "计算错误" if col == 0 else ""
@@ -726,139 +908,31 @@ class PropellerDesignSystem(QMainWindow):
                         item.setTextAlignment(Qt.AlignCenter)
                         self.tbl_speed.setItem(row, col, item)
 
-            QMessageBox.information(self, "成功", "最大航速计算完成")
+            self.notify_diagnostics("最大航速计算完成", 'max_speed')
 
         except ValueError as e:
             QMessageBox.critical(self, "输入错误", f"参数格式错误: {str(e)}\n\n请检查所有输入框是否填写了有效的数字。")
         except Exception as e:
             QMessageBox.critical(self, "计算错误", f"计算过程中发生错误: {str(e)}")
 
-    def calculate_for_type(self, tp, speeds, pes):
-        bp = self.get_bp_data(tp)
-
-        # 使用更高精度的插值方法 - 三次样条插值
-        interp_delta = CubicSpline(bp['sqrt'], bp['delta'])
-        interp_pd = CubicSpline(bp['sqrt'], bp['p_d'])
-        interp_eta = CubicSpline(bp['sqrt'], bp['eta'])
-
-        try:
-            # 使用三次样条插值拟合PE曲线
-            pe_func = CubicSpline(speeds, pes)
-        except:
-            # 如果三次样条失败，使用Akima插值
-            pe_func = Akima1DInterpolator(speeds, pes)
-
-        def pte(V):
-            VA = (1 - self.res['w']) * V
-            Bp = (self.res['N'] * np.sqrt(self.res['PD'])) / (VA ** 2.5) * 1.166
-            sqrt_bp = np.sqrt(Bp)
-            eta0_val = float(interp_eta(sqrt_bp))
-            return self.res['PD'] * self.res['eta_H'] * eta0_val
-
-        vmax = max(speeds)
-        try:
-            # 使用更精确的求解方法
-            vmax = float(fsolve(lambda v: pte(v) - pe_func(v), vmax, xtol=1e-6)[0])
-            vmax = max(min(speeds), min(max(speeds), vmax))  # 限制在有效范围内
-        except:
-            vmax = max(speeds)
+    def calculate_for_type(self, tp, speeds, pes, diagnostics=None):
+        # 在连续图谱曲面上取该型号对应的盘面比求解
+        surface = get_chart_surface(self.blade_count)
+        ae_a0 = surface.area_ratios[surface.series.index(tp)]
 
-        VA = (1 - self.res['w']) * vmax
-        Bp = (self.res['N'] * np.sqrt(self.res['PD'])) / (VA ** 2.5) * 1.166
-        sqrt_bp = np.sqrt(Bp)
-        delta = float(interp_delta(sqrt_bp))
-        p_d = float(interp_pd(sqrt_bp))
-        eta0 = float(interp_eta(sqrt_bp))
-        D = (delta * VA) / self.res['N']
-        return vmax, p_d, delta, D, eta0
+        res = self.res
+        vmax = solve_max_speed(surface, ae_a0, res.PD, res.N, res.w, res.eta_H, speeds, pes,
+                               diagnostics=diagnostics, detail=tp)
+        point = chart_design_point(surface, ae_a0, vmax, res.PD, res.N, res.w)
+        return vmax, point['p_d'], point['delta'], point['D'], point['eta0']
 
     def get_bp_data(self, tp):
-        # 使用新的MAU4系列图谱数据
-        if tp == "MAU4-40":
-            # 过滤掉无效数据点
-            sqrt_vals = [2.43, 2.5, 2.75, 3, 3.25, 3.5, 3.75, 4, 4.25, 4.5, 4.75, 5, 5.25, 5.5, 5.75, 6, 6.25, 6.5,
-                         6.75, 7, 7.25, 7.5, 7.75, 8, 8.25, 8.5, 8.75, 9, 9.25, 9.5, 9.75, 10, 10.07]
-            delta_vals = [32.1337, 33.0527, 35.6638, 38.8661, 41.6769, 44.1932, 47.0351, 49.4805, 52.5412, 55.0486,
-                          57.6749, 60.6623, 62.792, 65.4302, 68, 70.9688, 73.4625, 75.5852, 78.1068, 80.4074, 82.4419,
-                          84.9337, 87.5578, 89.5028, 92.4124, 94, 96, 98.9679, 100.738, 102.8976, 105.1432, 107.2132,
-                          107.7646]
-            p_d_vals = [1.11168, 1.08883, 1.02299, 0.95694, 0.91488, 0.87439, 0.83645, 0.81378, 0.78523, 0.75768,
-                        0.7395, 0.72046, 0.7014, 0.68219, 0.672, 0.65867, 0.64867, 0.6405, 0.63474, 0.6282, 0.61852,
-                        0.61276, 0.60609, 0.60127, 0.59407, 0.59, 0.582, 0.57692, 0.57457, 0.57087, 0.56892, 0.56446,
-                        0.56274]
-            eta_vals = [0.76169, 0.75949, 0.75125, 0.73741, 0.72345, 0.70847, 0.69006, 0.67778, 0.66364, 0.65216,
-                        0.64142, 0.62654, 0.61688, 0.60503, 0.592, 0.5806, 0.56823, 0.55987, 0.5475, 0.53862, 0.53122,
-                        0.52179, 0.51156, 0.50677, 0.49276, 0.485, 0.48, 0.47189, 0.4657, 0.45899, 0.45096, 0.44431,
-                        0.44269]
-
-            return {
-                'sqrt': sqrt_vals,
-                'delta': delta_vals,
-                'p_d': p_d_vals,
-                'eta': eta_vals
-            }
-        elif tp == "MAU4-55":
-            # 更新为新的MAU4-55数据
-            sqrt_vals = [4.586, 4.971, 5.419, 5.945, 6.5, 7.0, 7.5, 8.0, 8.5, 9.0, 9.5, 10.0, 11.0, 13.01]
-            delta_vals = [55.6, 58.8, 63.4, 69.1, 74.0, 78.5, 82.8, 86.9, 90.8, 94.5, 98.0, 101.0, 107.0, 132.3]
-            p_d_vals = [0.807, 0.774, 0.742, 0.711, 0.680, 0.650, 0.620, 0.595, 0.570, 0.545, 0.525, 0.505, 0.470,
-                        0.400]
-            eta_vals = [0.634, 0.614, 0.592, 0.565, 0.540, 0.515, 0.490, 0.465, 0.440, 0.415, 0.390, 0.365, 0.330,
-                        0.260]
-
-            return {
-                'sqrt': sqrt_vals,
-                'delta': delta_vals,
-                'p_d': p_d_vals,
-                'eta': eta_vals
-            }
-        elif tp == "MAU4-70":
-            # 过滤掉0值数据点
-            sqrt_vals = [2.65, 2.75, 3, 3.25, 3.5, 3.75, 4, 4.25, 4.5, 4.75, 5, 5.25, 5.5, 5.75, 6, 6.25, 6.5, 6.75, 7,
-                         7.25, 7.5, 7.75, 8, 8.25, 8.5, 8.75, 9, 9.25, 9.5, 9.75, 10, 10.07]
-            delta_vals = [32, 33.3173, 36.5182, 39.3473, 42, 45.3888, 48, 51.0038, 53.4893, 56, 58, 60.6577, 63.5746,
-                          65.5697, 68, 70.4972, 73.0047, 75.485, 78, 80, 83.0763, 85.5071, 87.658, 89.4571, 92.5176,
-                          94.4395, 97.0423, 99.2439, 101.1474, 103.479, 106, 106.5729]
-            p_d_vals = [1.21, 1.17707, 1.09708, 1.02612, 0.97, 0.91193, 0.88, 0.84889, 0.83298, 0.81, 0.79, 0.76611,
-                        0.75225, 0.74212, 0.73, 0.71751, 0.70499, 0.69253, 0.68, 0.67, 0.66274, 0.65275, 0.64117,
-                        0.63713, 0.62315, 0.62297, 0.62177, 0.61714, 0.61053, 0.60743, 0.606, 0.6045]
-            eta_vals = [0.705, 0.69778, 0.68784, 0.6728, 0.66, 0.64316, 0.63, 0.61942, 0.60725, 0.595, 0.585, 0.57443,
-                        0.56195, 0.55306, 0.541, 0.531, 0.5215, 0.512, 0.503, 0.495, 0.48542, 0.47661, 0.47013, 0.46359,
-                        0.45545, 0.44874, 0.44245, 0.43662, 0.42907, 0.42284, 0.416, 0.41471]
-
-            return {
-                'sqrt': sqrt_vals,
-                'delta': delta_vals,
-                'p_d': p_d_vals,
-                'eta': eta_vals
-            }
-        # 5叶桨数据保持不变
-        elif tp == "MAU5-50":
-            return {'sqrt': [2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0],
-                    'delta': [30.0, 35.0, 40.0, 45.0, 50.0, 55.0, 60.0, 65.0, 70.0, 75.0, 80.0, 85.0],
-                    'p_d': [1.10, 1.05, 0.95, 0.88, 0.82, 0.78, 0.74, 0.71, 0.68, 0.65, 0.63, 0.61],
-                    'eta': [0.75, 0.73, 0.70, 0.67, 0.64, 0.61, 0.58, 0.55, 0.52, 0.49, 0.46, 0.43]}
-        elif tp == "MAU5-65":
-            return {'sqrt': [2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0],
-                    'delta': [32.0, 38.0, 44.0, 50.0, 56.0, 62.0, 68.0, 74.0, 80.0, 86.0, 92.0, 98.0],
-                    'p_d': [1.08, 1.02, 0.93, 0.85, 0.79, 0.74, 0.70, 0.67, 0.64, 0.61, 0.59, 0.57],
-                    'eta': [0.72, 0.70, 0.67, 0.64, 0.61, 0.58, 0.55, 0.52, 0.49, 0.46, 0.43, 0.40]}
-        elif tp == "MAU5-80":
-            return {'sqrt': [2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0],
-                    'delta': [34.0, 41.0, 48.0, 55.0, 62.0, 69.0, 76.0, 83.0, 90.0, 97.0, 104.0, 111.0],
-                    'p_d': [1.05, 0.98, 0.90, 0.83, 0.77, 0.72, 0.68, 0.65, 0.62, 0.59, 0.57, 0.55],
-                    'eta': [0.68, 0.66, 0.63, 0.60, 0.57, 0.54, 0.51, 0.48, 0.45, 0.42, 0.39, 0.36]}
-        else:
-            # 默认返回MAU4-55的数据
-            return {'sqrt': [4.586, 4.971, 5.419, 5.945, 6.5, 7.0, 7.5, 8.0, 8.5, 9.0, 9.5, 10.0, 11.0, 13.01],
-                    'delta': [55.6, 58.8, 63.4, 69.1, 74.0, 78.5, 82.8, 86.9, 90.8, 94.5, 98.0, 101.0, 107.0, 132.3],
-                    'p_d': [0.807, 0.774, 0.742, 0.711, 0.680, 0.650, 0.620, 0.595, 0.570, 0.545, 0.525, 0.505, 0.470,
-                            0.400],
-                    'eta': [0.634, 0.614, 0.592, 0.565, 0.540, 0.515, 0.490, 0.465, 0.440, 0.415, 0.390, 0.365, 0.330,
-                            0.260]}
+        # 图谱数据统一保存在核心计算模块中，未知型号默认返回MAU4-55的数据
+        return BP_CHART_DATA.get(tp, BP_CHART_DATA["MAU4-55"])
 
+    @timed_handler
     def plot_max_speed_results(self):
-        """绘制最大航速计算结果曲线 - 改进版本"""
+        """绘制最大航速计算结果曲线 - 复用绘图窗口并原地更新曲线"""
         if not self.res:
             QMessageBox.warning(self, "警告", "请先完成最大航速计算")
             return
@@ -883,169 +957,131 @@ class PropellerDesignSystem(QMainWindow):
             speeds = list(map(float, speeds_str))
             pes = list(map(float, pes_str))
 
-            # 创建绘图窗口 - 调整大小为800x1000
-            self.plot_window = QDialog(self)
-            self.plot_window.setWindowTitle("最大航速计算结果")
-            self.plot_window.setGeometry(150, 150, 800, 1000)  # 调整大小
+            # 获取复用的绘图窗口 - 大小为800x1000
+            window, created = self.get_plot_window('max_speed', "最大航速计算结果",
+                                                   (150, 150, 800, 1000), (8, 10))
+            fig = window.figure
+            canvas = window.canvas
+
+            if created:
+                # 设置全局字体
+                plt.rcParams.update({
+                    'font.size': 12,
+                    'axes.unicode_minus': False
+                })
+
+                # 创建四个子图
+                ax1 = fig.add_subplot(4, 1, 1)  # η0
+                ax2 = fig.add_subplot(4, 1, 2)  # P/D
+                ax3 = fig.add_subplot(4, 1, 3)  # δ
+                ax4 = fig.add_subplot(4, 1, 4)  # PE和PTE
+
+                # 设置子图标题和标签
+                ax1.set_ylabel('敞水效率 η₀', fontsize=12)
+                ax1.grid(True, alpha=0.3)
 
-            # 创建图表
-            fig = Figure(figsize=(8, 10), dpi=100)  # 调整图形大小
-            canvas = FigureCanvas(fig)
-            toolbar = NavigationToolbar(canvas, self.plot_window)
+                ax2.set_ylabel('螺距比 P/D', fontsize=12)
+                ax2.grid(True, alpha=0.3)
 
-            # 设置全局字体
-            plt.rcParams.update({
-                'font.size': 12,
-                'font.family': 'SimHei',
-                'axes.unicode_minus': False
-            })
+                ax3.set_ylabel('直径系数 δ', fontsize=12)
+                ax3.grid(True, alpha=0.3)
+
+                ax4.set_ylabel('功率 PE, PTE (kW)', fontsize=12)
+                ax4.set_xlabel('航速 V (kn)', fontsize=12)
+                ax4.grid(True, alpha=0.3)
+
+                # 设置标题
+                fig.suptitle('螺旋桨性能参数随航速变化曲线',
+                             fontsize=14, fontweight='bold')
+
+            ax1, ax2, ax3, ax4 = fig.axes
+            axes = [ax1, ax2, ax3, ax4]
 
             # 根据桨叶数确定型号
             if self.blade_count == 4:
                 types = ["MAU4-40", "MAU4-55", "MAU4-70"]
-                colors = ['red', 'blue', 'green']
-                line_styles = ['-', '--', '-.']  # 不同线型
-                markers = ['o', 's', '^']  # 不同标记
-                labels = ['MAU4-40', 'MAU4-55', 'MAU4-70']
             else:  # 5叶桨
                 types = ["MAU5-50", "MAU5-65", "MAU5-80"]
-                colors = ['red', 'blue', 'green']
-                line_styles = ['-', '--', '-.']
-                markers = ['o', 's', '^']
-                labels = ['MAU5-50', 'MAU5-65', 'MAU5-80']
+            labels = types
+            colors = ['red', 'blue', 'green']
+            line_styles = ['-', '--', '-.']  # 不同线型
+            markers = ['o', 's', '^']  # 不同标记
 
             # 生成航速范围 - 增加采样点以提高光滑度
             v_min = min(speeds)
             v_max = max(speeds)
             v_range = np.linspace(v_min, v_max, 200)  # 增加采样点
 
-            # 创建四个子图
-            ax1 = fig.add_subplot(4, 1, 1)  # η0
-            ax2 = fig.add_subplot(4, 1, 2)  # P/D
-            ax3 = fig.add_subplot(4, 1, 3)  # δ
-            ax4 = fig.add_subplot(4, 1, 4)  # PE和PTE
-
-            # 设置子图标题和标签
-            ax1.set_ylabel('敞水效率 η₀', fontsize=12)
-            ax1.grid(True, alpha=0.3)
-
-            ax2.set_ylabel('螺距比 P/D', fontsize=12)
-            ax2.grid(True, alpha=0.3)
-
-            ax3.set_ylabel('直径系数 δ', fontsize=12)
-            ax3.grid(True, alpha=0.3)
+            # 使用三次样条插值拟合PE曲线
+            pe_func = CubicSpline(speeds, pes)
+            pe_vals = pe_func(v_range)
 
-            ax4.set_ylabel('功率 PE, PTE (kW)', fontsize=12)
-            ax4.set_xlabel('航速 V (kn)', fontsize=12)
-            ax4.grid(True, alpha=0.3)
+            # 各航速下的sqrt(Bp)对所有型号相同
+            VA = (1 - self.res['w']) * v_range
+            sqrt_bp = np.sqrt((self.res['N'] * np.sqrt(self.res['PD'])) / (VA ** 2.5) * 1.166)
 
-            # 对每个型号计算曲线
             intersection_points = []  # 存储交点信息
 
             for i, tp in enumerate(types):
-                # 获取该型号的Bp数据
+                # 获取该型号的Bp数据，使用三次样条插值
                 bp_data = self.get_bp_data(tp)
-
-                # 创建更高精度的插值函数 - 使用三次样条插值
-                interp_delta = CubicSpline(bp_data['sqrt'], bp_data['delta'])
-                interp_pd = CubicSpline(bp_data['sqrt'], bp_data['p_d'])
-                interp_eta = CubicSpline(bp_data['sqrt'], bp_data['eta'])
-
-                # 计算每个航速下的参数
-                p_d_vals = []
-                delta_vals = []
-                eta0_vals = []
-                pte_vals = []
-
-                for v in v_range:
-                    try:
-                        VA = (1 - self.res['w']) * v
-                        Bp = (self.res['N'] * np.sqrt(self.res['PD'])) / (VA ** 2.5) * 1.166
-                        sqrt_bp = np.sqrt(Bp)
-
-                        delta_val = float(interp_delta(sqrt_bp))
-                        p_d_val = float(interp_pd(sqrt_bp))
-                        eta0_val = float(interp_eta(sqrt_bp))
-                        pte_val = self.res['PD'] * self.res['eta_H'] * eta0_val
-
-                        p_d_vals.append(p_d_val)
-                        delta_vals.append(delta_val)
-                        eta0_vals.append(eta0_val)
-                        pte_vals.append(pte_val)
-                    except:
-                        p_d_vals.append(0)
-                        delta_vals.append(0)
-                        eta0_vals.append(0)
-                        pte_vals.append(0)
-
-                # 绘制曲线 - 使用不同颜色和线型
-                ax1.plot(v_range, eta0_vals, color=colors[i], linestyle=line_styles[i],
-                         linewidth=2, label=labels[i], marker=markers[i], markersize=4, markevery=20)
-                ax2.plot(v_range, p_d_vals, color=colors[i], linestyle=line_styles[i],
-                         linewidth=2, label=labels[i], marker=markers[i], markersize=4, markevery=20)
-                ax3.plot(v_range, delta_vals, color=colors[i], linestyle=line_styles[i],
-                         linewidth=2, label=labels[i], marker=markers[i], markersize=4, markevery=20)
-                ax4.plot(v_range, pte_vals, color=colors[i], linestyle=line_styles[i],
-                         linewidth=2, label=f'{labels[i]} PTE', marker=markers[i], markersize=4, markevery=20)
-
-                # 计算PE和PTE的交点
-                try:
-                    # 使用三次样条插值拟合PE曲线
-                    pe_func = CubicSpline(speeds, pes)
-                    pe_vals = pe_func(v_range)
-
-                    # 找到交点
-                    for j in range(len(v_range) - 1):
-                        if (pte_vals[j] - pe_vals[j]) * (pte_vals[j + 1] - pe_vals[j + 1]) <= 0:
-                            # 线性插值求交点
-                            t = (pe_vals[j] - pte_vals[j]) / (
-                                    pte_vals[j + 1] - pte_vals[j] - (pe_vals[j + 1] - pe_vals[j]))
-                            v_intersect = v_range[j] + t * (v_range[j + 1] - v_range[j])
-                            p_intersect = pe_vals[j] + t * (pe_vals[j + 1] - pe_vals[j])
-
-                            intersection_points.append((v_intersect, p_intersect, labels[i]))
-
-                            # 在所有子图中绘制竖直虚线
-                            for ax in [ax1, ax2, ax3, ax4]:
-                                ax.axvline(x=v_intersect, color=colors[i], linestyle=':', alpha=0.7, linewidth=2)
-
-                            # 在PTE子图中标记交点
-                            ax4.plot(v_intersect, p_intersect, 'o', color=colors[i], markersize=8)
-                            ax4.annotate(f'{v_intersect:.2f} kn',
-                                         xy=(v_intersect, p_intersect),
-                                         xytext=(10, 10), textcoords='offset points',
-                                         fontsize=9, color=colors[i])
-                            break
-                except Exception as e:
-                    print(f"计算交点时出错: {str(e)}")
-
-            # 绘制有效功率曲线
-            try:
-                pe_func = CubicSpline(speeds, pes)
-                pe_vals = pe_func(v_range)
-                ax4.plot(v_range, pe_vals, 'k-', linewidth=3, label='有效功率 PE')
-            except Exception as e:
-                print(f"绘制PE曲线时出错: {str(e)}")
-
-            # 添加图例
-            ax1.legend(loc='best', fontsize=10)
-            ax2.legend(loc='best', fontsize=10)
-            ax3.legend(loc='best', fontsize=10)
-            ax4.legend(loc='best', fontsize=10)
-
-            # 设置标题
-            fig.suptitle('螺旋桨性能参数随航速变化曲线',
-                         fontsize=14, fontweight='bold')
-
-            # 调整子图间距
-            fig.tight_layout(rect=[0, 0, 1, 0.96])
-
-            # 添加到布局
-            layout = QVBoxLayout()
-            layout.addWidget(toolbar)
-            layout.addWidget(canvas)
-            self.plot_window.setLayout(layout)
-            self.plot_window.show()
+                delta_vals = CubicSpline(bp_data['sqrt'], bp_data['delta'])(sqrt_bp)
+                p_d_vals = CubicSpline(bp_data['sqrt'], bp_data['p_d'])(sqrt_bp)
+                eta0_vals = CubicSpline(bp_data['sqrt'], bp_data['eta'])(sqrt_bp)
+                pte_vals = self.res['PD'] * self.res['eta_H'] * eta0_vals
+
+                # 原地更新曲线数据 - 使用不同颜色和线型
+                curve_data = [(ax1, eta0_vals, labels[i]), (ax2, p_d_vals, labels[i]),
+                              (ax3, delta_vals, labels[i]), (ax4, pte_vals, f'{labels[i]} PTE')]
+                for k, (ax, y_vals, label) in enumerate(curve_data):
+                    line = canvas.artist(('curve', i, k), lambda ax=ax, i=i: ax.plot(
+                        [], [], color=colors[i], linestyle=line_styles[i], linewidth=2,
+                        marker=markers[i], markersize=4, markevery=20)[0])
+                    line.set_data(v_range, y_vals)
+                    line.set_label(label)
+
+                # 交点竖直虚线、交点标记和标注，没有交点时隐藏
+                vlines = [canvas.artist(('vline', i, k), lambda ax=ax, i=i: ax.axvline(
+                    x=v_min, color=colors[i], linestyle=':', alpha=0.7, linewidth=2))
+                          for k, ax in enumerate(axes)]
+                point = canvas.artist(('point', i), lambda i=i: ax4.plot(
+                    [], [], 'o', color=colors[i], markersize=8)[0])
+                note = canvas.artist(('note', i), lambda i=i: ax4.annotate(
+                    '', xy=(v_min, 0), xytext=(10, 10), textcoords='offset points',
+                    fontsize=9, color=colors[i]))
+
+                # 计算PE和PTE的交点，取第一个变号区间线性插值
+                diff = pte_vals - pe_vals
+                crossing = np.nonzero(diff[:-1] * diff[1:] <= 0)[0]
+                found = len(crossing) > 0
+                if found:
+                    j = crossing[0]
+                    t = (pe_vals[j] - pte_vals[j]) / (
+                            pte_vals[j + 1] - pte_vals[j] - (pe_vals[j + 1] - pe_vals[j]))
+                    v_intersect = v_range[j] + t * (v_range[j + 1] - v_range[j])
+                    p_intersect = pe_vals[j] + t * (pe_vals[j + 1] - pe_vals[j])
+                    intersection_points.append((v_intersect, p_intersect, labels[i]))
+
+                    for vline in vlines:
+                        vline.set_xdata([v_intersect, v_intersect])
+                    point.set_data([v_intersect], [p_intersect])
+                    note.xy = (v_intersect, p_intersect)
+                    note.set_text(f'{v_intersect:.2f} kn')
+                for artist in vlines + [point, note]:
+                    artist.set_visible(found)
+
+            # 有效功率曲线
+            pe_line = canvas.artist('pe', lambda: ax4.plot([], [], 'k-', linewidth=3, label='有效功率 PE')[0])
+            pe_line.set_data(v_range, pe_vals)
+
+            # 型号变化时更新图例并调整子图间距
+            stale = window.update_legends(labels, loc='best', fontsize=10)
+            if created:
+                fig.tight_layout(rect=[0, 0, 1, 0.96])
+            canvas.refresh(autoscale='grow', stale=stale)
+
+            window.show()
+            window.raise_()
 
         except Exception as e:
             QMessageBox.critical(self, "绘图错误", f"绘制曲线时发生错误: {str(e)}")
@@ -1192,23 +1228,9 @@ class PropellerDesignSystem(QMainWindow):
 
     def get_tau_c(self, sigma, source='wag'):
         """统一 τc 计算"""
-        if source == 'wag':
-            try:
-                tau_c = float(Akima1DInterpolator(SIGMA_WAG, TAU_C_WAG)(sigma))
-            except:
-                tau_c = 0.15
-        else:  # ber
-            if sigma < 0.36:
-                tau_c = 0.14
-            elif sigma > 1.82:
-                tau_c = 0.35
-            else:
-                try:
-                    tau_c = float(Akima1DInterpolator(SIGMA_BER, TAU_C_BER)(sigma))
-                except:
-                    tau_c = 0.15
-        return max(0.05, min(0.5, tau_c))
+        return core_tau_c(sigma, source)
 
+    @timed_handler
     def calculate_cavitation(self):
         try:
             if not self.res:
@@ -1231,10 +1253,9 @@ class PropellerDesignSystem(QMainWindow):
             p0 = float(p0_text)
 
             rho = 1025.0
-            g = 9.81
-            p0_total = p0 + rho * g * hs
 
-            self.cavitation_results = {}
+            rows = []
+            diagnostics = self.diagnostics['cavitation'] = SolverDiagnostics()
 
             # 根据桨叶数确定型号
             if self.blade_count == 4:
@@ -1269,22 +1290,13 @@ class PropellerDesignSystem(QMainWindow):
                     continue
 
                 PD = self.res['PD']
-                N = self.res['N']
-                w = self.res['w']
-                VA = 0.5144 * vmax * (1 - w)
-                omega = 0.7 * np.pi * N * D / 60
-                V_0_7R_sq = VA ** 2 + omega ** 2
-                sigma = (p0_total - pv) / (0.5 * rho * V_0_7R_sq)
-                if self.rb_wag.isChecked():
-                    tau_c = self.get_tau_c(sigma, source='wag')
-                else:
-                    tau_c = self.get_tau_c(sigma, source='ber')
-                T = PD * eta0 * 1000 / VA
-                Ap = T / (0.5 * rho * V_0_7R_sq * tau_c)
-                AE = Ap / (1.067 - 0.229 * p_d)
-                AE_A0 = AE / (np.pi * D ** 2 / 4)
-                self.cavitation_results[propeller_type] = {
-                    'AE_A0': AE_A0, 'p_d': p_d, 'D': D, 'eta0': eta0, 'vmax': vmax}
+                source = 'wag' if self.rb_wag.isChecked() else 'ber'
+                cav = core_cavitation(PD, self.res['N'], self.res['w'], vmax, D, p_d, eta0,
+                                      hs, pv, p0, source=source, rho=rho, diagnostics=diagnostics,
+                                      detail=propeller_type)
+                VA, omega, V_0_7R_sq = cav['VA'], cav['omega'], cav['V_0_7R_sq']
+                sigma, tau_c, T, AE_A0 = cav['sigma'], cav['tau_c'], cav['T'], cav['AE_A0']
+                rows.append((propeller_type, PD, vmax, p_d, D, eta0, VA, omega, V_0_7R_sq, sigma, tau_c, T, AE_A0))
                 # 填表
                 self.cavitation_table.setItem(0, col, QTableWidgetItem(f"{PD:.1f}"))
                 self.cavitation_table.setItem(1, col, QTableWidgetItem(f"{vmax:.2f}"))
@@ -1296,19 +1308,21 @@ class PropellerDesignSystem(QMainWindow):
                 self.cavitation_table.setItem(7, col, QTableWidgetItem(f"{T:.0f}"))
                 self.cavitation_table.setItem(8, col, QTableWidgetItem(f"{AE_A0:.4f}"))
 
-            if self.cavitation_results:
-                self.opt_res = self.cavitation_results[propeller_types[0]]
+            self.cavitation_results = np.array(rows, dtype=CAVITATION_DTYPE) if rows else None
+            if self.cavitation_results is not None:
+                self.opt_res = DesignPoint.from_mapping(self.cavitation_results[0])
                 self.plot_btn.setEnabled(True)
                 self.results_btn.setEnabled(True)
-                QMessageBox.information(self, "成功", "空泡校核计算完成")
+                self.notify_diagnostics("空泡校核计算完成", 'cavitation')
             else:
                 QMessageBox.warning(self, "警告", "空泡校核计算失败，请检查数据")
 
         except Exception as e:
             QMessageBox.critical(self, "计算错误", f"空泡校核计算失败: {str(e)}")
 
+    @timed_handler
     def plot_curves_and_find_optimum(self):
-        if not self.cavitation_results:
+        if self.cavitation_results is None:
             QMessageBox.warning(self, "警告", "请先完成空泡校核计算")
             return
 
@@ -1318,103 +1332,86 @@ class PropellerDesignSystem(QMainWindow):
             else:
                 blade_ratios = np.array([0.50, 0.65, 0.80])
 
-            AE_A0 = np.array([self.cavitation_results[t]['AE_A0'] for t in self.cavitation_results.keys()])
-            p_d = np.array([self.cavitation_results[t]['p_d'] for t in self.cavitation_results.keys()])
-            D = np.array([self.cavitation_results[t]['D'] for t in self.cavitation_results.keys()])
-            eta0 = np.array([self.cavitation_results[t]['eta0'] for t in self.cavitation_results.keys()])
-            vmax = np.array([self.cavitation_results[t]['vmax'] for t in self.cavitation_results.keys()])
-
-            x_min, x_max = blade_ratios.min(), blade_ratios.max()
-            x_fine = np.linspace(x_min, x_max, 100)
-
-            # 使用曲线拟合而不是简单的线性插值
-            try:
-                # 使用三次样条插值获得平滑曲线
-                f_ae = CubicSpline(blade_ratios, AE_A0)
-                f_pd = CubicSpline(blade_ratios, p_d)
-                f_d = CubicSpline(blade_ratios, D)
-                f_eta = CubicSpline(blade_ratios, eta0)
-                f_v = CubicSpline(blade_ratios, vmax)
-            except:
-                # 如果三次样条失败，使用Akima插值
-                f_ae = Akima1DInterpolator(blade_ratios, AE_A0)
-                f_pd = Akima1DInterpolator(blade_ratios, p_d)
-                f_d = Akima1DInterpolator(blade_ratios, D)
-                f_eta = Akima1DInterpolator(blade_ratios, eta0)
-                f_v = Akima1DInterpolator(blade_ratios, vmax)
-
-            # 找到交点
-            diff = f_ae(x_fine) - x_fine
-            idx = np.argmin(np.abs(diff))
-            opt_r = x_fine[idx]
-            opt_ae = f_ae(opt_r)
-            opt_pd = f_pd(opt_r)
-            opt_d = f_d(opt_r)
-            opt_eta = f_eta(opt_r)
-            opt_v = f_v(opt_r)
-
-            self.optimum_results = {'blade_ratio': opt_r, 'AE_A0': opt_ae, 'p_d': opt_pd,
-                                    'D': opt_d, 'eta0': opt_eta, 'vmax': opt_v}
-
-            # 创建绘图窗口
-            self.plot_window = QDialog(self)
-            self.plot_window.setWindowTitle("最佳螺旋桨要素确定")
-            self.plot_window.setGeometry(150, 150, 800, 1000)
-            fig = Figure(figsize=(8, 10), dpi=100)
-            canvas = FigureCanvas(fig)
-            toolbar = NavigationToolbar(canvas, self.plot_window)
-
-            # 设置字体大小
-            plt.rcParams.update({'font.size': 10})
+            cav = self.cavitation_results
+            AE_A0, p_d, D, eta0, vmax = cav['AE_A0'], cav['p_d'], cav['D'], cav['eta0'], cav['vmax']
+
+            hs = float(self.depth_input.text().strip() or "5.0")
+            pv = float(self.pv_input.text().strip() or "1706")
+            p0 = float(self.p0_input.text().strip() or "101325")
+            source = 'wag' if self.rb_wag.isChecked() else 'ber'
+
+            # 在连续图谱曲面上一次性求解各盘面比的要素及最佳盘面比
+            res = self.res
+            diagnostics = self.diagnostics['optimum'] = SolverDiagnostics()
+            optimum, curves = solve_optimum_area_ratio(
+                self.blade_count, res.PD, res.N, res.w, res.eta_H, res.speeds, res.pes, hs, pv, p0, source=source,
+                diagnostics=diagnostics)
+            self.optimum_results = DesignPoint.from_mapping(optimum)
+            opt_r = self.optimum_results.blade_ratio
+            x_fine = curves['blade_ratio']
+            x_min, x_max = x_fine.min(), x_fine.max()
+
+            # 获取复用的绘图窗口
+            window, created = self.get_plot_window('optimum', "最佳螺旋桨要素确定",
+                                                   (150, 150, 800, 1000), (8, 10))
+            fig = window.figure
+            canvas = window.canvas
 
             # 使用中文标签
             ylabels = ['敞水效率 η₀', '直径 D (m)', '盘面比 AE/A₀',
                        '螺距比 P/D', '最大航速 Vmax (kn)']
             ydatas = [eta0, D, AE_A0, p_d, vmax]
-            f_funcs = [f_eta, f_d, f_ae, f_pd, f_v]
+            ycurves = [curves['eta0'], curves['D'], curves['AE_A0'], curves['p_d'], curves['vmax']]
 
             # 定义不同的线型和颜色
             line_styles = ['-', '--', '-.', ':']
             colors = ['blue', 'red', 'green', 'orange', 'purple']
             markers = ['o', 's', '^', 'D', 'v']
 
-            axes = []
-
-            for i in range(5):
-                ax = fig.add_subplot(5, 1, i + 1)
-                axes.append(ax)
-
-                y_cur = f_funcs[i](x_fine)
-
-                # 绘制平滑曲线 - 使用不同线型和颜色
-                ax.plot(x_fine, y_cur, color=colors[i], linestyle=line_styles[i % len(line_styles)],
-                        lw=2, alpha=0.8, label='拟合曲线')
-                ax.plot(blade_ratios, ydatas[i], color=colors[i], marker=markers[i % len(markers)],
-                        markersize=6, linestyle='none', label='数据点')
-                ax.axvline(opt_r, color='r', ls='--', lw=2, label=f'最佳值: {opt_r:.3f}')
-                ax.set_ylabel(ylabels[i], fontsize=12)
+            if created:
+                # 设置字体大小
+                plt.rcParams.update({'font.size': 10})
+
+                for i in range(5):
+                    ax = fig.add_subplot(5, 1, i + 1)
+                    ax.set_ylabel(ylabels[i], fontsize=12)
+                    ax.grid(True, alpha=0.3)
+                    if i == 4:
+                        ax.set_xlabel('盘面比', fontsize=12)
+
+                fig.suptitle('最佳螺旋桨要素确定曲线', fontsize=14, fontweight='bold')
+                fig.subplots_adjust(hspace=0.3)
+
+            for i, ax in enumerate(fig.axes):
+                # 原地更新连续曲线、数据点和最佳值竖线
+                curve = canvas.artist(('curve', i), lambda ax=ax, i=i: ax.plot(
+                    [], [], color=colors[i], linestyle=line_styles[i % len(line_styles)],
+                    lw=2, alpha=0.8, label='图谱曲面')[0])
+                curve.set_data(x_fine, ycurves[i])
+                points = canvas.artist(('points', i), lambda ax=ax, i=i: ax.plot(
+                    [], [], color=colors[i], marker=markers[i % len(markers)],
+                    markersize=6, linestyle='none', label='数据点')[0])
+                points.set_data(blade_ratios, ydatas[i])
+                opt_line = canvas.artist(('opt', i), lambda ax=ax: ax.axvline(
+                    x_min, color='r', ls='--', lw=2))
+                opt_line.set_xdata([opt_r, opt_r])
+                opt_line.set_label(f'最佳值: {opt_r:.3f}')
                 ax.set_xlim(x_min - 0.05, x_max + 0.05)
-                ax.grid(True, alpha=0.3)
-                ax.legend(loc='best', fontsize=9)
-
-                if i == 4:
-                    ax.set_xlabel('盘面比', fontsize=12)
 
-            fig.suptitle('最佳螺旋桨要素确定曲线', fontsize=14, fontweight='bold')
-            fig.subplots_adjust(hspace=0.3)
-            layout = QVBoxLayout()
-            layout.addWidget(toolbar)
-            layout.addWidget(canvas)
-            self.plot_window.setLayout(layout)
-            self.plot_window.show()
+            stale = window.update_legends([f'{opt_r:.3f}'], loc='best', fontsize=9)
+            canvas.refresh(autoscale='grow', stale=stale)
+            window.show()
+            window.raise_()
 
             self.update_results_text()
+            if diagnostics.has_issues():
+                self.result_text.append(f"\n求解诊断：\n{diagnostics.report()}")
 
         except Exception as e:
             QMessageBox.critical(self, "绘图错误", f"绘制曲线时发生错误: {str(e)}")
 
     def update_results_text(self):
-        if hasattr(self, 'optimum_results'):
+        if self.optimum_results is not None:
             r = self.optimum_results
             text = (f"最佳螺旋桨要素计算结果:\n\n"
                     f"盘面比: {r['blade_ratio']:.4f}\n"
@@ -1426,7 +1423,7 @@ class PropellerDesignSystem(QMainWindow):
             self.result_text.setText(text)
 
     def show_optimum_results(self):
-        if hasattr(self, 'optimum_results'):
+        if self.optimum_results is not None:
             self.update_results_text()
         else:
             QMessageBox.warning(self, "警告", "请先完成最佳要素确定计算")
@@ -1484,6 +1481,7 @@ class PropellerDesignSystem(QMainWindow):
         except (ValueError, TypeError):
             return default
 
+    @timed_handler
     def calculate_strength(self):
         # 检查必要的前置计算是否完成
         if not self.opt_res:
@@ -1516,62 +1514,28 @@ class PropellerDesignSystem(QMainWindow):
             Z = self.blade_count
             G = 7.6
 
-            # 计算弦长
-            b_66 = (0.226 * D * Ad) / (0.1 * Z)
-            b_025 = 0.7212 * b_66
-            b_06 = 0.9911 * b_66
-
-            D_P = 1.0 / P_D if P_D > 0 else 0
-
+            # 0.25R与0.6R处的强度校核
+            strength = calc_strength(D, P_D, Ad, ne, Ne, Z, epsilon=epsilon, K=K, G=G)
             results = {}
-            radius_points = [(0.25, b_025), (0.6, b_06)]
-
-            for r_R, b in radius_points:
-                if r_R == 0.25:
-                    K1, K2, K3, K4 = 634, 250, 1410, 4
-                    K5, K6, K7, K8 = 82, 34, 41, 380
-                else:
-                    K1, K2, K3, K4 = 207, 151, 635, 34
-                    K5, K6, K7, K8 = 23, 12, 65, 330
-
-                # 计算A1和Y
-                A1 = D_P * (K1 - K2 * D_P) + K3 * D_P - K4
-                Y = (1.36 * A1 * Ne) / (Z * b * ne) if (Z * b * ne) > 0 else 0
-
-                # 计算A2和X
-                A2 = D_P * (K5 + K6 * epsilon) + K7 * epsilon + K8
-                X = (A2 * G * Ad * ne ** 2 * D ** 3) / (1e10 * Z * b) if (Z * b) > 0 else 0
-
-                # 计算厚度
-                t_req = np.sqrt(Y / (K - X)) if (K - X) > 0 and Y > 0 else 0
-
-                # 标准厚度
-                if r_R == 0.25:
-                    t_std = ((4.06 + 3.59) / 2) * D * 10
-                else:
-                    t_std = 2.18 * D * 10
-
-                t_actual = max(t_std, t_req) if t_std < t_req else t_std
-
-                results[r_R] = {
-                    'b': b, 'A1': A1, 'Y': Y, 'A2': A2, 'X': X,
-                    't_req': t_req, 't_std': t_std, 't_actual': t_actual,
-                    'conclusion': "满足" if t_std >= t_req else "不满足"
-                }
+            for idx, r_R in enumerate(strength['stations']):
+                results[float(r_R)] = {key: float(strength[key][idx]) for key in
+                                       ('b', 'A1', 'Y', 'A2', 'X', 't_req', 't_std', 't_actual')}
+                results[float(r_R)]['conclusion'] = "满足" if strength['ok'][idx] else "不满足"
+            k25, k60 = STRENGTH_RULE_COEFFS.astype(int).tolist()
 
             # 填充表格
             rows = [
                 ("弦长 b", results[0.25]['b'], results[0.6]['b'], "m"),
-                ("系数 K1", 634, 207, ""),
-                ("系数 K2", 250, 151, ""),
-                ("系数 K3", 1410, 635, ""),
-                ("系数 K4", 4, 34, ""),
+                ("系数 K1", k25[0], k60[0], ""),
+                ("系数 K2", k25[1], k60[1], ""),
+                ("系数 K3", k25[2], k60[2], ""),
+                ("系数 K4", k25[3], k60[3], ""),
                 ("A1", results[0.25]['A1'], results[0.6]['A1'], ""),
                 ("Y", results[0.25]['Y'], results[0.6]['Y'], "N"),
-                ("系数 K5", 82, 23, ""),
-                ("系数 K6", 34, 12, ""),
-                ("系数 K7", 41, 65, ""),
-                ("系数 K8", 380, 330, ""),
+                ("系数 K5", k25[4], k60[4], ""),
+                ("系数 K6", k25[5], k60[5], ""),
+                ("系数 K7", k25[6], k60[6], ""),
+                ("系数 K8", k25[7], k60[7], ""),
                 ("A2", results[0.25]['A2'], results[0.6]['A2'], ""),
                 ("材料系数 K", K, K, ""),
                 ("X", results[0.25]['X'], results[0.6]['X'], "N"),
@@ -1646,13 +1610,14 @@ class PropellerDesignSystem(QMainWindow):
         self.btn_pc.clicked.connect(self.calculate_pitch_correction)
         return w
 
+    @timed_handler
     def calculate_pitch_correction(self):
-        if not (self.res and (self.opt_res or hasattr(self, 'optimum_results'))):
+        if not (self.res and (self.opt_res or self.optimum_results)):
             QMessageBox.warning(self, "警告", "请先完成最大航速和空泡校核或最佳要素确定计算")
             return
 
         # 检查是否有最佳要素确定的结果
-        if not hasattr(self, 'optimum_results') or not self.optimum_results:
+        if not self.optimum_results:
             QMessageBox.warning(self, "警告", "请先完成最佳要素确定计算")
             return
 
@@ -1671,108 +1636,15 @@ class PropellerDesignSystem(QMainWindow):
             dhD_text = self.pc_dhD_input.text().strip() or "0.18"
             dhD = float(dhD_text)
 
-            print(f"螺距修正参数 - 使用最佳要素结果:")
-            print(f"PoD={PoD:.4f}, D={D:.3f}, Ad={Ad:.4f}, Vmax={Vmax:.2f}, N={N}")
-
-            # 计算设计桨在0.7R处的厚度和弦长
-            # 使用MAU型值表中的厚度百分比数据
-            t_02_pct = MAU_THICKNESS['0.2R']  # 4.06%
-            t_06_pct = MAU_THICKNESS['0.6R']  # 2.18%
-            t_07_pct = MAU_THICKNESS['0.7R']  # 1.71%
-
-            # 转换为实际厚度(mm)
-            t_02 = (t_02_pct / 100.0) * D * 1000  # mm
-            t_06 = (t_06_pct / 100.0) * D * 1000  # mm
-            t_07 = (t_07_pct / 100.0) * D * 1000  # mm
-
-            # 计算0.7R处的弦长
-            b_ref_066 = 0.226 * D * Ad / (0.1 * Z)  # 0.66R参考弦长(m)
-            b_07_pct = MAU_WIDTH['0.7R']  # 99.64%
-            b_07 = (b_07_pct / 100.0) * b_ref_066  # 0.7R弦长(m)
-
-            # 设计桨的[t/b]0.7 (单位: m/m)
-            tob_des = (t_07 / 1000.0) / b_07  # 转换为米后计算
-
-            # 标准桨的[t/b]0.7 (使用标准盘面比0.55)
-            b_ref_066_std = 0.226 * D * 0.55 / (0.1 * Z)
-            b_07_std = (b_07_pct / 100.0) * b_ref_066_std
-            tob_std = (t_07 / 1000.0) / b_07_std
-
-            # 厚度修正量
-            delta_tob = (tob_des - tob_std) * 0.75
-
-            # 计算滑脱比相关参数
-            VA = 0.5144 * Vmax * (1 - self.res['w'])  # 进速(m/s)
-            P = PoD * D  # 螺距(m)
-
-            # 计算滑脱比 1-s = VA / (P * n)
-            # n = N / 60 (rps)
-            n = N / 60.0  # rps
-            if P * n > 0:
-                one_minus_s = VA / (P * n)
-            else:
-                one_minus_s = 0
-
-            print(f"滑脱比计算: VA={VA:.3f} m/s, P={P:.3f} m, n={n:.3f} rps, 1-s={one_minus_s:.3f}")
-
-            # 厚度修正引起的螺距比变化
-            # 修正公式: Δ(P/D)_t = -2 * (P/D) * (1-s) * Δ(t/b)
-            delta_PoD_t = -2 * PoD * one_minus_s * delta_tob
-
-            # 毂径比修正
-            # Δ(P/D)_h = (1/10) * (dh/D - 0.18)
-            delta_PoD_h = 0.0 if abs(dhD - 0.18) < 1e-6 else (1.0 / 10.0) * (dhD - 0.18)
-
-            # 总修正量
-            delta_PoD_total = delta_PoD_t + delta_PoD_h
-
-            # 修正后的螺距比
-            PoD_corrected = PoD + delta_PoD_total
-
-            print(
-                f"修正量: Δtob={delta_tob:.6f}, ΔPoD_t={delta_PoD_t:.6f}, ΔPoD_h={delta_PoD_h:.6f}, ΔPoD_total={delta_PoD_total:.6f}")
-            print(f"螺距比: 原值={PoD:.4f}, 修正后={PoD_corrected:.4f}")
-
-            # 生成报告
-            report = (f"螺距修正计算结果：\n\n"
-                      f"设计参数（使用最佳要素确定结果）：\n"
-                      f"- 螺旋桨直径 D = {D:.3f} m\n"
-                      f"- 最佳螺距比 P/D = {PoD:.4f}\n"
-                      f"- 最佳盘面比 Ae/Ao = {Ad:.4f}\n"
-                      f"- 桨叶数 Z = {Z}\n"
-                      f"- 最大航速 Vmax = {Vmax:.2f} kn\n"
-                      f"- 主机转速 N = {N} rpm\n"
-                      f"- 毂径比 dh/D = {dhD:.3f}\n\n"
-
-                      f"厚度修正计算：\n"
-                      f"1) 设计桨0.2R厚度 t₀.₂ = {t_02:.1f} mm\n"
-                      f"2) 设计桨0.6R厚度 t₀.₆ = {t_06:.1f} mm\n"
-                      f"3) 设计桨0.7R厚度 t₀.₇ = {t_07:.1f} mm\n"
-                      f"4) 设计桨0.7R弦长 b₀.₇ = {b_07:.4f} m\n"
-                      f"5) 设计桨[t/b]₀.₇ = {tob_des:.6f}\n"
-                      f"6) 标准桨[t/b]₀.₇ = {tob_std:.6f}\n"
-                      f"7) Δ[t/b]₀.₇ = {delta_tob:.6f}\n\n"
-
-                      f"滑脱比计算：\n"
-                      f"8) 进速 VA = {VA:.3f} m/s\n"
-                      f"9) 螺距 P = {P:.3f} m\n"
-                      f"10) 转速 n = {n:.3f} rps\n"
-                      f"11) 滑脱比 1-s = {one_minus_s:.4f}\n\n"
-
-                      f"修正量计算：\n"
-                      f"12) 厚度修正 Δ(P/D)ₜ = {delta_PoD_t:.6f}\n"
-                      f"13) 毂径比修正 Δ(P/D)ₕ = {delta_PoD_h:.6f}\n"
-                      f"14) 总修正量 Δ(P/D) = {delta_PoD_total:.6f}\n"
-                      f"15) 修正后螺距比 (P/D)' = {PoD_corrected:.4f}\n\n"
-
-                      f"验证：原最佳P/D {PoD:.4f} + 修正量 {delta_PoD_total:.6f} = {PoD_corrected:.4f}")
-
+            result = calc_pitch_correction(dhD, D, PoD, Ad, Vmax, N, self.res['w'], Z)
+            logger.debug("螺距修正: dh/D=%(dh_D)s, Δ(P/D)=%(delta_PoD).4f, 修正后P/D=%(p_d_corrected).4f",
+                         {key: float(result[key]) for key in ('dh_D', 'delta_PoD', 'p_d_corrected')})
+            report = pitch_correction_report(result)
             self.txt_pc_result.setText(report)
 
         except Exception as e:
+            logger.exception("螺距修正计算错误: %(error)s", {'error': str(e)})
             QMessageBox.critical(self, "螺距修正错误", f"计算错误: {str(e)}")
-            import traceback
-            traceback.print_exc()
 
     # ===================== 5. 质量及惯性矩 =====================
 
@@ -1847,10 +1719,11 @@ class PropellerDesignSystem(QMainWindow):
 
         return w
 
+    @timed_handler
     def calculate_mass_properties(self):
         """根据图片中的公式重新实现质量及惯性矩计算"""
         try:
-            if not (self.opt_res or hasattr(self, 'optimum_results')):
+            if not (self.opt_res or self.optimum_results):
                 QMessageBox.warning(self, "警告", "请先完成空泡校核或最佳要素确定计算")
                 return
 
@@ -1863,38 +1736,37 @@ class PropellerDesignSystem(QMainWindow):
             K = self.safe_float_convert(self.mass_K.text(), 1.0)  # 材料系数 K
 
             # 获取螺旋桨基本参数 - 优先使用最佳要素确定的结果
-            if hasattr(self, 'optimum_results') and self.optimum_results:
+            if self.optimum_results:
                 # 使用最佳要素确定的结果
                 D = self.safe_float_convert(self.optimum_results.get('D', 0))
                 Ae_Ao = self.safe_float_convert(self.optimum_results.get('AE_A0', 0))
-                print(f"使用最佳要素确定结果计算质量惯性矩: D={D}m, Ae/Ao={Ae_Ao}")
+                logger.debug("使用最佳要素确定结果计算质量惯性矩: D=%(D)sm, Ae/Ao=%(AE_A0)s", {'D': D, 'AE_A0': Ae_Ao})
             else:
                 # 使用空泡校核结果
                 D = self.safe_float_convert(self.opt_res.get('D', 0))
                 Ae_Ao = self.safe_float_convert(self.opt_res.get('AE_A0', 0))
-                print(f"使用空泡校核结果计算质量惯性矩: D={D}m, Ae/Ao={Ae_Ao}")
+                logger.debug("使用空泡校核结果计算质量惯性矩: D=%(D)sm, Ae/Ao=%(AE_A0)s", {'D': D, 'AE_A0': Ae_Ao})
 
             if D <= 0 or Ae_Ao <= 0:
                 QMessageBox.warning(self, "警告", "螺旋桨直径或盘面比数据无效")
                 return
 
             # 获取功率和转速参数
-            if hasattr(self, 'res'):
+            if self.res:
                 PD = self.res.get('PD', 0)  # 推进功率 kW
                 N = self.res.get('N', 0)  # 转速 rpm
             else:
                 PD = 0
                 N = 0
 
-            print(f"计算参数: D={D}m, Ae/Ao={Ae_Ao}, Z={Z}, ρ={rho}kg/m³, PD={PD}kW, N={N}rpm, K={K}")
+            logger.debug("计算参数: D=%(D)sm, Ae/Ao=%(AE_A0)s, Z=%(Z)s, ρ=%(rho)skg/m³, PD=%(PD)skW, N=%(N)srpm, "
+                         "K=%(K)s", {'D': D, 'AE_A0': Ae_Ao, 'Z': Z, 'rho': rho, 'PD': PD, 'N': N, 'K': K})
 
             # 计算参考弦长（0.66R处的弦长）- 即最大宽度
             b_max = 0.226 * D * Ae_Ao / (0.1 * Z)
-            print(f"桨叶最大宽度 b_max: {b_max:.4f}m")
 
             # 计算桨毂直径
             hub_diameter = d_D * D  # 桨毂直径 d
-            print(f"桨毂直径: {hub_diameter:.4f}m")
 
             # 计算桨轴中央处轴径 d0
             # 公式: d0 = 0.045 + 0.12(P_D/N)^(1/3) - (K * Lk) / 2
@@ -1907,16 +1779,12 @@ class PropellerDesignSystem(QMainWindow):
             # 确保d0不为负值
             d0 = max(0.01, d0)
 
-            print(f"桨轴中央处轴径 d0: {d0:.4f}m (K={K}, Lk={hub_length}m)")
-
             # 获取0.2R和0.6R处的厚度
             t_02_pct = MAU_THICKNESS['0.2R']  # 4.06%
             t_06_pct = MAU_THICKNESS['0.6R']  # 2.18%
             t_02 = (t_02_pct / 100.0) * D  # 转换为实际厚度(m)
             t_06 = (t_06_pct / 100.0) * D  # 转换为实际厚度(m)
 
-            print(f"0.2R厚度: {t_02:.4f}m, 0.6R厚度: {t_06:.4f}m")
-
             # 根据图片中的公式计算桨叶质量
             # M_b1 = 0.169 * ρ * Z * b_max * (0.5*t_0.2 + t_0.6) * (1 - d/D) * D
             blade_mass = 0.169 * rho * Z * b_max * (0.5 * t_02 + t_06) * (1 - d_D) * D
@@ -1931,8 +1799,6 @@ class PropellerDesignSystem(QMainWindow):
             # 总质量
             total_mass = blade_mass + hub_mass
 
-            print(f"桨叶质量: {blade_mass:.2f}kg, 桨毂质量: {hub_mass:.2f}kg, 总质量: {total_mass:.2f}kg")
-
             # 计算螺旋桨质量惯性矩 - 根据d/D选择不同公式
             if d_D <= 0.18:
                 # 当 d/D ≤ 0.18 时
@@ -1945,7 +1811,12 @@ class PropellerDesignSystem(QMainWindow):
                 inertia = (0.0648 + 0.167 * d_D) * rho * Z * b_max * (0.5 * t_02 + t_06) * (D ** 3)
                 inertia_formula = f"I_mp = [0.0648+0.167·d/D]·ρ·Z·b_max·(0.5t₀₂+t₀₆)·D³ (d/D > 0.18)"
 
-            print(f"螺旋桨质量惯性矩: {inertia:.2f} kg·m²")
+            logger.debug("b_max=%(b_max).4fm, 桨毂直径=%(hub_diameter).4fm, d0=%(d0).4fm, t0.2=%(t_02).4fm, "
+                         "t0.6=%(t_06).4fm, 桨叶质量=%(blade_mass).2fkg, 桨毂质量=%(hub_mass).2fkg, "
+                         "总质量=%(total_mass).2fkg, 惯性矩=%(inertia).2fkg·m²",
+                         {'b_max': b_max, 'hub_diameter': hub_diameter, 'd0': d0, 't_02': t_02, 't_06': t_06,
+                          'blade_mass': blade_mass, 'hub_mass': hub_mass, 'total_mass': total_mass,
+                          'inertia': inertia})
 
             # 更新结果表格
             results = [
@@ -1981,83 +1852,41 @@ class PropellerDesignSystem(QMainWindow):
             QMessageBox.information(self, "成功", "质量及惯性矩计算完成")
 
         except Exception as e:
-            print(f"质量计算错误: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("质量计算错误: %(error)s", {'error': str(e)})
             QMessageBox.critical(self, "计算错误", f"质量计算失败: {str(e)}")
 
     def update_mass_details_table(self, D, Ae_Ao, Z, rho):
         """更新详细计算表格（辛普森法）"""
-        # 计算参考弦长
-        b_ref_066 = 0.226 * D * Ae_Ao / (0.1 * Z)
-
-        # 计算每个半径位置的参数
-        r_positions = [0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
-
-        self.mass_details = []
-        total_4x5 = 0
-        total_6x7 = 0
-        total_6x8 = 0
-
-        for r_R in r_positions:
-            position_key = f'{r_R:.1f}R'
-
-            # 获取型值数据
-            t_pct = MAU_THICKNESS[position_key]  # 厚度百分比
-            b_pct = MAU_WIDTH[position_key]  # 宽度百分比
-            Ka = AREA_COEFF[position_key]  # 面积系数
-            SM = SIMPSON_COEFF[position_key]  # 辛普森系数
-
-            # 计算实际尺寸（单位：米）
-            t_actual = (t_pct / 100.0) * D  # 厚度，单位：m
-            b_actual = (b_pct / 100.0) * b_ref_066  # 弦长，单位：m
-
-            # 计算各项参数
-            b_t = b_actual * t_actual  # b×t
-            section_area = b_t * Ka  # 切面面积S
-            col_4x5 = section_area * SM  # 4×5
-            col_6x7 = col_4x5 * r_R  # 6×7
-            col_6x8 = col_4x5 * (r_R ** 2)  # 6×8
-
-            # 累加
-            total_4x5 += col_4x5
-            total_6x7 += col_6x7
-            total_6x8 += col_6x8
-
-            self.mass_details.append({
-                'position': position_key,
-                'r_R': r_R,
-                'Ka': Ka,
-                'b_t': b_t,
-                'section_area': section_area,
-                'SM': SM,
-                'col_4x5': col_4x5,
-                'col_6x7': col_6x7,
-                'col_6x8': col_6x8
-            })
+        # 各站数据以数组保存，辛普森求和为一次点积
+        integrals = blade_section_integrals(D, Ae_Ao, Z, rho)
+        self.mass_details = {key: integrals[key] for key in
+                             ('r_R', 'Ka', 'b_t', 'section_area', 'SM', 'col_4x5', 'col_6x7', 'col_6x8')}
+        self.mass_details['position'] = [f'{r_R:.1f}R' for r_R in integrals['r_R']]
+        details = self.mass_details
 
         # 更新详细计算表格
-        self.tbl_mass_details.setRowCount(len(self.mass_details) + 1)
-
-        for row, detail in enumerate(self.mass_details):
-            self.tbl_mass_details.setItem(row, 0, QTableWidgetItem(detail['position']))
-            self.tbl_mass_details.setItem(row, 1, QTableWidgetItem(f"{detail['r_R']:.1f}"))
-            self.tbl_mass_details.setItem(row, 2, QTableWidgetItem(f"{detail['Ka']:.4f}"))
-            self.tbl_mass_details.setItem(row, 3, QTableWidgetItem(f"{detail['b_t']:.4f}"))
-            self.tbl_mass_details.setItem(row, 4, QTableWidgetItem(f"{detail['section_area']:.4f}"))
-            self.tbl_mass_details.setItem(row, 5, QTableWidgetItem(str(detail['SM'])))
-            self.tbl_mass_details.setItem(row, 6, QTableWidgetItem(f"{detail['col_4x5']:.4f}"))
-            self.tbl_mass_details.setItem(row, 7, QTableWidgetItem(f"{detail['r_R']:.1f}"))
-            self.tbl_mass_details.setItem(row, 8, QTableWidgetItem(f"{detail['r_R'] ** 2:.2f}"))
-            self.tbl_mass_details.setItem(row, 9, QTableWidgetItem(f"{detail['col_6x7']:.4f}"))
-            self.tbl_mass_details.setItem(row, 10, QTableWidgetItem(f"{detail['col_6x8']:.4f}"))
+        count = len(details['r_R'])
+        self.tbl_mass_details.setRowCount(count + 1)
+
+        for row in range(count):
+            r_R = details['r_R'][row]
+            self.tbl_mass_details.setItem(row, 0, QTableWidgetItem(details['position'][row]))
+            self.tbl_mass_details.setItem(row, 1, QTableWidgetItem(f"{r_R:.1f}"))
+            self.tbl_mass_details.setItem(row, 2, QTableWidgetItem(f"{details['Ka'][row]:.4f}"))
+            self.tbl_mass_details.setItem(row, 3, QTableWidgetItem(f"{details['b_t'][row]:.4f}"))
+            self.tbl_mass_details.setItem(row, 4, QTableWidgetItem(f"{details['section_area'][row]:.4f}"))
+            self.tbl_mass_details.setItem(row, 5, QTableWidgetItem(f"{details['SM'][row]:g}"))
+            self.tbl_mass_details.setItem(row, 6, QTableWidgetItem(f"{details['col_4x5'][row]:.4f}"))
+            self.tbl_mass_details.setItem(row, 7, QTableWidgetItem(f"{r_R:.1f}"))
+            self.tbl_mass_details.setItem(row, 8, QTableWidgetItem(f"{r_R ** 2:.2f}"))
+            self.tbl_mass_details.setItem(row, 9, QTableWidgetItem(f"{details['col_6x7'][row]:.4f}"))
+            self.tbl_mass_details.setItem(row, 10, QTableWidgetItem(f"{details['col_6x8'][row]:.4f}"))
 
         # 添加汇总行
-        summary_row = len(self.mass_details)
-        self.tbl_mass_details.setItem(summary_row, 0, QTableWidgetItem("辛普森求和"))
-        self.tbl_mass_details.setItem(summary_row, 6, QTableWidgetItem(f"{total_4x5:.4f}"))
-        self.tbl_mass_details.setItem(summary_row, 9, QTableWidgetItem(f"{total_6x7:.4f}"))
-        self.tbl_mass_details.setItem(summary_row, 10, QTableWidgetItem(f"{total_6x8:.4f}"))
+        self.tbl_mass_details.setItem(count, 0, QTableWidgetItem("辛普森求和"))
+        self.tbl_mass_details.setItem(count, 6, QTableWidgetItem(f"{integrals['sum_4x5']:.4f}"))
+        self.tbl_mass_details.setItem(count, 9, QTableWidgetItem(f"{integrals['sum_6x7']:.4f}"))
+        self.tbl_mass_details.setItem(count, 10, QTableWidgetItem(f"{integrals['sum_6x8']:.4f}"))
 
     def export_mass_details(self):
         try:
@@ -2071,12 +1900,13 @@ class PropellerDesignSystem(QMainWindow):
                 writer = csv.writer(f)
                 writer.writerow(["半径位置", "r/R", "面积系数Ka", "b×t", "切面面积S",
                                  "辛氏系数SM", "4×5", "R", "R²", "6×7", "6×8"])
-                for d in self.mass_details:
+                d = self.mass_details
+                for i, position in enumerate(d['position']):
                     writer.writerow([
-                        d['position'], f"{d['r_R']:.1f}", f"{d['Ka']:.4f}",
-                        f"{d['b_t']:.4f}", f"{d['section_area']:.4f}", d['SM'],
-                        f"{d['col_4x5']:.4f}", f"{d['r_R']:.1f}", f"{d['r_R'] ** 2:.2f}",
-                        f"{d['col_6x7']:.4f}", f"{d['col_6x8']:.4f}"
+                        position, f"{d['r_R'][i]:.1f}", f"{d['Ka'][i]:.4f}",
+                        f"{d['b_t'][i]:.4f}", f"{d['section_area'][i]:.4f}", f"{d['SM'][i]:g}",
+                        f"{d['col_4x5'][i]:.4f}", f"{d['r_R'][i]:.1f}", f"{d['r_R'][i] ** 2:.2f}",
+                        f"{d['col_6x7'][i]:.4f}", f"{d['col_6x8'][i]:.4f}"
                     ])
             QMessageBox.information(self, "成功", f"已导出到 {path}")
         except Exception as e:
@@ -2174,8 +2004,30 @@ class PropellerDesignSystem(QMainWindow):
         step_layout.addWidget(self.step_spin)
         plot_settings_layout.addLayout(step_layout)
 
+        # 实时预览：参数变化后防抖重算并局部重绘
+        live_layout = QVBoxLayout()
+        self.live_check = QCheckBox("实时预览")
+        self.live_check.setStyleSheet("font-weight: 600;")
+        self.live_check.toggled.connect(self.on_live_preview_toggled)
+        live_layout.addWidget(self.live_check)
+        self.live_status_label = QLabel("")
+        live_layout.addWidget(self.live_status_label)
+        plot_settings_layout.addLayout(live_layout)
+
         plot_settings_group.setLayout(plot_settings_layout)
 
+        self.live_timer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.setInterval(LIVE_DEBOUNCE_MS)
+        self.live_timer.timeout.connect(self.update_live_preview)
+        self.title_timer = QTimer(self)
+        self.title_timer.setSingleShot(True)
+        self.title_timer.setInterval(LIVE_SETTLE_MS)
+        self.title_timer.timeout.connect(self.settle_open_water_title)
+        for spin in (self.plot_blade_spin, self.plot_area_ratio_spin, self.plot_pitch_ratio_spin,
+                     self.j_min_spin, self.j_max_spin, self.step_spin):
+            spin.valueChanged.connect(self.schedule_live_preview)
+
         # 按钮组
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(8)
@@ -2188,10 +2040,17 @@ class PropellerDesignSystem(QMainWindow):
         save_btn.clicked.connect(self.save_plot)
         btn_layout.addWidget(save_btn)
 
-        # 图表区域
+        # 图表区域 - 坐标轴只创建一次，重复绘图时原地更新曲线
         self.figure = Figure(figsize=(8, 6), dpi=100)
-        self.canvas = FigureCanvas(self.figure)
+        self.canvas = BlitCanvas(self.figure)
         self.canvas.setMinimumHeight(400)
+        self.ow_ax = self.figure.add_subplot(111)
+        self.ow_ax2 = self.ow_ax.twinx()
+        self.ow_ax.set_xlabel('进速系数 J', fontsize=11)
+        self.ow_ax.set_ylabel('KT, 10KQ', fontsize=11)
+        self.ow_ax2.set_ylabel('敞水效率 η0', fontsize=11)
+        self.ow_ax2.set_ylim(0, 1)  # KQ趋近0时η0发散，固定效率坐标范围以免实时预览时坐标轴跳动
+        self.ow_ax.grid(True, linestyle='--', alpha=0.7)
 
         # 添加到主布局
         layout.addWidget(input_group)
@@ -2206,8 +2065,65 @@ class PropellerDesignSystem(QMainWindow):
         blade_num = self.plot_blade_spin.value()
         self.au_coeffs.update_coefficients_by_blade_count(blade_num)
 
+    @timed_handler
     def generate_plot(self):
         """生成敞水性能曲线"""
+        self.draw_open_water()
+
+    def on_live_preview_toggled(self, checked):
+        """开启实时预览时立即刷新一次"""
+        self.live_status_label.clear()
+        if checked:
+            self.live_timer.setInterval(LIVE_DEBOUNCE_MS)
+            self.update_live_preview()
+        else:
+            self.live_timer.stop()
+            if self.title_timer.isActive():
+                self.title_timer.stop()
+                self.settle_open_water_title()
+
+    def schedule_live_preview(self):
+        """参数变化时重新计时，停止调整一段时间后再重算（防抖）"""
+        if self.live_check.isChecked():
+            self.live_timer.start()
+
+    def update_live_preview(self):
+        """实时预览：重算并局部重绘敞水曲线，按帧耗时调整防抖间隔"""
+        start = time.perf_counter()
+        self.draw_open_water(autoscale='grow', update_title=False)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        # 超出帧时间预算时延长防抖间隔以免界面卡顿，低于预算时逐步恢复
+        if elapsed > LIVE_FRAME_BUDGET_MS:
+            interval = min(LIVE_DEBOUNCE_MAX_MS, self.live_timer.interval() * 2)
+        else:
+            interval = max(LIVE_DEBOUNCE_MS, self.live_timer.interval() // 2)
+        self.live_timer.setInterval(interval)
+
+        # 标题文字重绘代价高，调整过程中参数显示在状态栏，停止调整后再更新标题
+        self.live_status_label.setText(
+            f"AU{self.plot_blade_spin.value()}-{self.plot_area_ratio_spin.value():.2f} "
+            f"P/D={self.plot_pitch_ratio_spin.value():.2f}  更新耗时 {elapsed:.1f} ms")
+        self.title_timer.start()
+
+    def set_open_water_title(self):
+        """按当前参数设置敞水曲线标题，返回标题是否变化"""
+        blade_num = self.plot_blade_spin.value()
+        title = (f"AU{blade_num}-{self.plot_area_ratio_spin.value():.2f} "
+                 f"螺距比(P/D)={self.plot_pitch_ratio_spin.value():.2f} 敞水性能曲线"
+                 f"（{self.open_water_source(blade_num)}）")
+        if self.ow_ax.get_title() == title:
+            return False
+        self.ow_ax.set_title(title, fontsize=12, fontweight='bold')
+        return True
+
+    def settle_open_water_title(self):
+        """实时预览停止调整后更新标题，只重绘敞水曲线所在的子图"""
+        if self.set_open_water_title():
+            self.canvas.refresh(autoscale=False, stale=(self.ow_ax,))
+
+    def draw_open_water(self, autoscale=True, update_title=True):
+        """计算并原地更新敞水性能曲线，实时预览时由调用方延后更新标题"""
         blade_num = self.plot_blade_spin.value()
         if not self.au_coeffs.update_coefficients_by_blade_count(blade_num):
             QMessageBox.warning(self, "警告", f"暂不支持{blade_num}叶桨的计算")
@@ -2224,83 +2140,34 @@ class PropellerDesignSystem(QMainWindow):
         # 生成J值序列
         j_values = np.arange(j_min, j_max + step, step)
 
-        # 计算KT, 10KQ和η0
-        kt_values = []
-        ten_kq_values = []
-        eta0_values = []
-
-        for j in j_values:
-            # 计算KT
-            kt = np.float64(self.au_coeffs.current_kt_coeffs[0]['value'])
-            for coeff in self.au_coeffs.current_kt_coeffs[1:]:
-                term = np.float64(coeff['value'])
-                if coeff['i'] > 0:
-                    term *= np.power(np.float64(pitch_ratio), np.int32(coeff['i']))
-                if coeff['j'] > 0:
-                    term *= np.power(np.float64(j), np.int32(coeff['j']))
-                if coeff['k'] > 0:
-                    term *= np.power(np.float64(area_ratio), np.int32(coeff['k']))
-                kt += term
-            kt_values.append(kt)
-
-            # 计算10KQ
-            ten_kq = np.float64(self.au_coeffs.current_kq_coeffs[0]['value'])
-            for coeff in self.au_coeffs.current_kq_coeffs[1:]:
-                term = np.float64(coeff['value'])
-                if coeff['i'] > 0:
-                    term *= np.power(np.float64(pitch_ratio), np.int32(coeff['i']))
-                if coeff['j'] > 0:
-                    term *= np.power(np.float64(j), np.int32(coeff['j']))
-                if coeff['k'] > 0:
-                    term *= np.power(np.float64(area_ratio), np.int32(coeff['k']))
-                ten_kq += term
-            ten_kq_values.append(ten_kq)
-
-            # 计算KQ (10KQ / 10)
-            kq = ten_kq / 10.0
-
-            # 计算敞水效率
-            if j != 0 and kq != 0:
-                eta0 = (kt * j) / (2 * np.pi * kq)
-            else:
-                eta0 = 0.0
-            eta0_values.append(eta0)
-
-        # 绘制图表
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        # 向量化计算KT, 10KQ和η0
+        kt_values, ten_kq_values, eta0_values = self.open_water(j_values, pitch_ratio, area_ratio, blade_num)
 
-        # 定义不同的线型和标记
+        # 原地更新曲线数据
+        ax, ax2 = self.ow_ax, self.ow_ax2
         line_styles = ['-', '--', '-.']
-        markers = ['o', 's', '^']
-
-        # 绘制KT曲线 - 使用不同线型
-        ax.plot(j_values, kt_values, 'b-', linewidth=2, label='KT', linestyle=line_styles[0])
-
-        # 绘制10KQ曲线 - 使用不同线型
-        ax.plot(j_values, ten_kq_values, 'r-', linewidth=2, label='10KQ', linestyle=line_styles[1])
-
-        # 绘制η0曲线
-        ax2 = ax.twinx()
-        ax2.plot(j_values, eta0_values, 'g-', linewidth=2, label='η0', linestyle=line_styles[2])
-
-        # 设置标题和标签 - 使用中文
-        ax.set_title(f"AU{blade_num}-{area_ratio:.2f} 螺距比(P/D)={pitch_ratio:.2f} 敞水性能曲线",
-                     fontsize=12, fontweight='bold')
-        ax.set_xlabel('进速系数 J', fontsize=11)
-        ax.set_ylabel('KT, 10KQ', fontsize=11)
-        ax2.set_ylabel('敞水效率 η0', fontsize=11)
-
-        # 添加网格
-        ax.grid(True, linestyle='--', alpha=0.7)
-
-        # 添加图例
-        lines1, labels1 = ax.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax.legend(lines1 + lines2, labels1 + labels2, loc='upper right', fontsize=10)
+        kt_line = self.canvas.artist('kt', lambda: ax.plot(
+            [], [], 'b', linewidth=2, label='KT', linestyle=line_styles[0])[0])
+        kq_line = self.canvas.artist('10kq', lambda: ax.plot(
+            [], [], 'r', linewidth=2, label='10KQ', linestyle=line_styles[1])[0])
+        eta_line = self.canvas.artist('eta0', lambda: ax2.plot(
+            [], [], 'g', linewidth=2, label='η0', linestyle=line_styles[2])[0])
+        kt_line.set_data(j_values, kt_values)
+        kq_line.set_data(j_values, ten_kq_values)
+        eta_line.set_data(j_values, eta0_values)
+
+        # 标题是静态图元，变化时重绘所在子图
+        stale = (ax,) if update_title and self.set_open_water_title() else ()
+
+        # 首次绘图时添加图例
+        relayout = ax.get_legend() is None
+        if relayout:
+            lines1, labels1 = ax.get_legend_handles_labels()
+            lines2, labels2 = ax2.get_legend_handles_labels()
+            ax.legend(lines1 + lines2, labels1 + labels2, loc='upper right', fontsize=10)
 
         # 刷新画布
-        self.canvas.draw()
+        self.canvas.refresh(relayout=relayout, autoscale=autoscale, stale=stale)
 
     def save_plot(self):
         """保存图表为图片"""
@@ -2446,7 +2313,7 @@ class PropellerDesignSystem(QMainWindow):
                 self.mooring_eta_r.setText("1.0")
 
             # 获取螺旋桨直径从空泡校核结果
-            if hasattr(self, 'opt_res') and self.opt_res and 'D' in self.opt_res:
+            if self.opt_res and 'D' in self.opt_res:
                 self.mooring_d.setText(f"{self.opt_res['D']:.4f}")
             else:
                 # 如果没有空泡校核结果，尝试从最大航速计算获取
@@ -2467,39 +2334,17 @@ class PropellerDesignSystem(QMainWindow):
                 return
 
             # 计算KT和KQ在J=0时的值
-            j = 0.0
-            kt_j0 = np.float64(self.au_coeffs.current_kt_coeffs[0]['value'])
-            for coeff in self.au_coeffs.current_kt_coeffs[1:]:
-                term = np.float64(coeff['value'])
-                if coeff['i'] > 0:
-                    term *= np.power(np.float64(pitch_ratio), np.int32(coeff['i']))
-                if coeff['j'] > 0:
-                    term *= np.power(np.float64(j), np.int32(coeff['j']))
-                if coeff['k'] > 0:
-                    term *= np.power(np.float64(area_ratio), np.int32(coeff['k']))
-                kt_j0 += term
-
-            ten_kq_j0 = np.float64(self.au_coeffs.current_kq_coeffs[0]['value'])
-            for coeff in self.au_coeffs.current_kq_coeffs[1:]:
-                term = np.float64(coeff['value'])
-                if coeff['i'] > 0:
-                    term *= np.power(np.float64(pitch_ratio), np.int32(coeff['i']))
-                if coeff['j'] > 0:
-                    term *= np.power(np.float64(j), np.int32(coeff['j']))
-                if coeff['k'] > 0:
-                    term *= np.power(np.float64(area_ratio), np.int32(coeff['k']))
-                ten_kq_j0 += term
-
-            kq_j0 = ten_kq_j0 / 10.0
+            kt_j0, kq_j0 = (float(v) for v in self.open_water_kt_kq(0.0, pitch_ratio, area_ratio, blade_num))
 
             self.mooring_kt_j0.setText(f"{kt_j0:.6f}")
             self.mooring_kq_j0.setText(f"{kq_j0:.6f}")
 
-            QMessageBox.information(self, "成功", "已获取前面计算的数据")
+            QMessageBox.information(self, "成功", f"已获取前面计算的数据（KT、KQ：{self.open_water_source(blade_num)}）")
 
         except Exception as e:
             QMessageBox.critical(self, "获取数据错误", f"获取数据失败: {str(e)}")
 
+    @timed_handler
     def calculate_mooring(self):
         """计算系柱工况"""
         try:
@@ -2515,11 +2360,9 @@ class PropellerDesignSystem(QMainWindow):
             rho = self.safe_float_convert(self.mooring_rho.text(), 1025)
 
             # 计算推力
-            pd = ps * eta_r * eta_s
-            q = pd / (2 * math.pi * n / 60) if n > 0 else 0
-            t = (kt_j0 / kq_j0) * (q / D) if (kq_j0 > 0 and D > 0) else 0
-            n_mooring = 60 * math.sqrt(t * 1000 / (rho * (D ** 4) * kt_j0)) if (
-                    rho > 0 and D > 0 and kt_j0 > 0 and t > 0) else 0
+            result = bollard_pull(ps, n, D, kt_j0, kq_j0, t0, eta_s=eta_s, eta_r=eta_r, rho=rho)
+            pd, q, t = float(result['PD']), float(result['Q']), float(result['T'])
+            n_mooring = float(result['n_mooring']) if rho > 0 else 0
 
             # 显示结果
             self.mooring_pd.setText(f"{pd:.4f}")
@@ -2644,192 +2487,6 @@ class PropellerDesignSystem(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "获取数据错误", f"获取数据失败: {str(e)}")
 
-    def calculate_voyage_characteristics(self):
-        """计算航行特性"""
-        try:
-            # 检查必要的前置计算
-            if not self.res or not self.opt_res:
-                QMessageBox.warning(self, "警告", "请先完成最大航速和最佳要素确定计算")
-                return
-
-            # 获取输入参数
-            n1 = self.safe_float_convert(self.voyage_n1.text())
-            n2 = self.safe_float_convert(self.voyage_n2.text())
-            n3 = self.safe_float_convert(self.voyage_n3.text())
-            v_min = self.safe_float_convert(self.voyage_v_min.text(), 12)
-            v_max = self.safe_float_convert(self.voyage_v_max.text(), 17)
-            step = self.safe_float_convert(self.voyage_step.text(), 1)
-            rho = self.safe_float_convert(self.voyage_rho.text(), 1025)
-
-            # 获取螺旋桨参数
-            D = self.opt_res['D']
-            p_d = self.opt_res['p_d']
-            ae_a0 = self.opt_res['AE_A0']
-            w = self.res['w']
-            t = self.res['t']
-            eta_r = self.res['eta_r']
-            eta_s = self.res['eta_s']
-
-            # 生成航速序列
-            speeds = np.arange(v_min, v_max + step, step)
-
-            # 计算三个转速下的航行特性
-            self.voyage_results = {}
-            rpm_values = [n1, n2, n3]
-
-            for i, n_rpm in enumerate(rpm_values):
-                n_rps = n_rpm / 60.0  # 转换为r/s
-                results = []
-
-                for v in speeds:
-                    # 计算进速VA
-                    VA = 0.5144 * (1 - w) * v  # m/s
-
-                    # 计算进速系数J
-                    J = VA / n_rps / D if n_rps > 0 else 0
-
-                    # 计算KT和KQ
-                    kt = self.calculate_kt(J, p_d, ae_a0)
-                    kq = self.calculate_kq(J, p_d, ae_a0)
-
-                    # 计算推力T (kN)
-                    T = kt * rho * (n_rps ** 2) * (D ** 4) / 1000
-
-                    # 计算有效推力功率PTE (kW)
-                    PTE = T * (1 - t) * 0.5144 * v
-
-                    # 计算转矩Q (kN·m)
-                    Q = kq * rho * (n_rps ** 2) * (D ** 5) / 1000
-
-                    # 计算收到功率PD (kW) - 注意：这里加回了10%功率储备
-                    PD = 2 * math.pi * n_rps * Q
-                    PD_without_reserve = PD / 0.9  # 去除10%储备
-
-                    # 计算主机功率PS (kW)
-                    PS = PD_without_reserve / (eta_r * eta_s)
-
-                    results.append({
-                        'V': v, 'VA': VA, 'J': J, 'KT': kt, 'KQ': kq,
-                        'T': T, 'PTE': PTE, 'Q': Q, 'PD': PD, 'PS': PS
-                    })
-
-                self.voyage_results[f'N={n_rpm}rpm'] = results
-
-            # 获取有效功率曲线数据
-            pe_data = self.pe_edit.text().split(';')
-            if len(pe_data) == 2:
-                pe_speeds = list(map(float, pe_data[0].split(',')))
-                pe_powers = list(map(float, pe_data[1].split(',')))
-                self.pe_curve = CubicSpline(pe_speeds, pe_powers)
-            else:
-                # 使用默认有效功率曲线
-                pe_speeds = [12, 13, 14, 15, 16, 17]
-                pe_powers = [1497, 1953, 2505, 3213, 4070, 5161]
-                self.pe_curve = CubicSpline(pe_speeds, pe_powers)
-
-            # 计算三种航行状态的有效功率曲线
-            self.voyage_states = {
-                'Ⅰ-满载': lambda v: self.pe_curve(v),
-                'Ⅱ-压载(85%)': lambda v: 0.85 * self.pe_curve(v),
-                'Ⅲ-120%满载': lambda v: 1.2 * self.pe_curve(v)
-            }
-
-            # 在表格中显示详细结果
-            self.display_voyage_results()
-
-            QMessageBox.information(self, "成功", "航行特性计算完成")
-
-        except Exception as e:
-            QMessageBox.critical(self, "计算错误", f"航行特性计算失败: {str(e)}")
-
-    def calculate_kt(self, J, p_d, ae_a0):
-        """计算推力系数KT"""
-        blade_num = self.blade_count
-        if not self.au_coeffs.update_coefficients_by_blade_count(blade_num):
-            return 0.0
-
-        kt = np.float64(self.au_coeffs.current_kt_coeffs[0]['value'])
-        for coeff in self.au_coeffs.current_kt_coeffs[1:]:
-            term = np.float64(coeff['value'])
-            if coeff['i'] > 0:
-                term *= np.power(np.float64(p_d), np.int32(coeff['i']))
-            if coeff['j'] > 0:
-                term *= np.power(np.float64(J), np.int32(coeff['j']))
-            if coeff['k'] > 0:
-                term *= np.power(np.float64(ae_a0), np.int32(coeff['k']))
-            kt += term
-
-        return max(0.0, kt)
-
-    def calculate_kq(self, J, p_d, ae_a0):
-        """计算转矩系数KQ"""
-        blade_num = self.blade_count
-        if not self.au_coeffs.update_coefficients_by_blade_count(blade_num):
-            return 0.0
-
-        ten_kq = np.float64(self.au_coeffs.current_kq_coeffs[0]['value'])
-        for coeff in self.au_coeffs.current_kq_coeffs[1:]:
-            term = np.float64(coeff['value'])
-            if coeff['i'] > 0:
-                term *= np.power(np.float64(p_d), np.int32(coeff['i']))
-            if coeff['j'] > 0:
-                term *= np.power(np.float64(J), np.int32(coeff['j']))
-            if coeff['k'] > 0:
-                term *= np.power(np.float64(ae_a0), np.int32(coeff['k']))
-            ten_kq += term
-
-        kq = ten_kq / 10.0
-        return max(0.0, kq)
-
-    def display_voyage_results(self):
-        """在表格中显示航行特性计算结果"""
-        if not hasattr(self, 'voyage_results'):
-            return
-
-        # 获取第一个转速的结果来设置表格
-        first_rpm = list(self.voyage_results.keys())[0]
-        results = self.voyage_results[first_rpm]
-
-        # 设置表格行数和列数
-        num_rows = len(results)
-        num_cols = 10  # V, VA, J, KT, KQ, T, PTE, Q, PD, PS
-
-        self.voyage_table.setRowCount(num_rows * 3)  # 三个转速
-        self.voyage_table.setColumnCount(num_cols + 1)  # 增加一列显示转速
-
-        # 设置表头
-        headers = ["转速", "V (kn)", "VA (m/s)", "J", "KT", "KQ",
-                   "T (kN)", "PTE (kW)", "Q (kN·m)", "PD (kW)", "PS (kW)"]
-        self.voyage_table.setHorizontalHeaderLabels(headers)
-
-        # 填充表格数据
-        row_index = 0
-        for rpm_name, results in self.voyage_results.items():
-            # 添加转速标题行
-            title_item = QTableWidgetItem(rpm_name)
-            title_item.setBackground(QColor(200, 220, 240))
-            self.voyage_table.setItem(row_index, 0, title_item)
-            for col in range(1, num_cols + 1):
-                item = QTableWidgetItem("")
-                item.setBackground(QColor(200, 220, 240))
-                self.voyage_table.setItem(row_index, col, item)
-            row_index += 1
-
-            # 填充数据行
-            for result in results:
-                self.voyage_table.setItem(row_index, 0, QTableWidgetItem(""))
-                self.voyage_table.setItem(row_index, 1, QTableWidgetItem(f"{result['V']:.1f}"))
-                self.voyage_table.setItem(row_index, 2, QTableWidgetItem(f"{result['VA']:.3f}"))
-                self.voyage_table.setItem(row_index, 3, QTableWidgetItem(f"{result['J']:.4f}"))
-                self.voyage_table.setItem(row_index, 4, QTableWidgetItem(f"{result['KT']:.4f}"))
-                self.voyage_table.setItem(row_index, 5, QTableWidgetItem(f"{result['KQ']:.4f}"))
-                self.voyage_table.setItem(row_index, 6, QTableWidgetItem(f"{result['T']:.1f}"))
-                self.voyage_table.setItem(row_index, 7, QTableWidgetItem(f"{result['PTE']:.1f}"))
-                self.voyage_table.setItem(row_index, 8, QTableWidgetItem(f"{result['Q']:.3f}"))
-                self.voyage_table.setItem(row_index, 9, QTableWidgetItem(f"{result['PD']:.1f}"))
-                self.voyage_table.setItem(row_index, 10, QTableWidgetItem(f"{result['PS']:.1f}"))
-                row_index += 1
-
     # ===================== 8. 航行特性 =====================
     # ===================== 8. 航行特性 =====================
     def create_voyage_characteristics_tab(self):
@@ -2922,7 +2579,7 @@ class PropellerDesignSystem(QMainWindow):
         layout.addWidget(result_group)
 
         # 初始化变量
-        self.voyage_results = {}
+        self.voyage_results = None
         self.voyage_intersections = []
 
         return tab
@@ -2950,6 +2607,7 @@ class PropellerDesignSystem(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "获取数据错误", f"获取数据失败: {str(e)}")
 
+    @timed_handler
     def calculate_voyage_characteristics(self):
         """计算航行特性"""
         try:
@@ -2989,89 +2647,76 @@ class PropellerDesignSystem(QMainWindow):
                 QMessageBox.warning(self, "输入错误", "航速范围内无有效数据点")
                 return
 
-            # 计算三个转速下的航行特性
-            self.voyage_results = {}
-            rpm_values = [n1, n2, n3]
-
-            for i, n_rpm in enumerate(rpm_values):
-                n_rps = n_rpm / 60.0
-                results = []
-
-                for v in speeds:
-                    VA = 0.5144 * (1 - w) * v
-                    J = VA / (n_rps * D) if (n_rps > 0 and D > 0) else 0
-                    J = max(0.0, min(1.5, J))
-
-                    kt = self.calculate_kt(J, p_d, ae_a0)
-                    kq = self.calculate_kq(J, p_d, ae_a0)
-
-                    T = kt * rho * (n_rps ** 2) * (D ** 4) / 1000
-                    PTE = T * (1 - t) * 0.5144 * v
-                    Q = kq * rho * (n_rps ** 2) * (D ** 5) / 1000
-                    PD = 2 * math.pi * n_rps * Q
-                    PD_without_reserve = PD / 0.9
-                    PS = PD_without_reserve / (eta_r * eta_s)
-
-                    results.append({
-                        'V': v, 'VA': VA, 'J': J, 'KT': kt, 'KQ': kq,
-                        'T': T, 'PTE': PTE, 'Q': Q, 'PD': PD, 'PS': PS
-                    })
-
-                self.voyage_results[f'N={n_rpm}rpm'] = results
-
-            # 获取有效功率曲线数据
-            pe_data = self.pe_edit.text().split(';')
-            if len(pe_data) == 2:
-                pe_speeds = list(map(float, pe_data[0].split(',')))
-                pe_powers = list(map(float, pe_data[1].split(',')))
-                self.pe_curve = CubicSpline(pe_speeds, pe_powers)
+            # 三个转速下的航行特性一次向量化计算，结果为 (转速, 航速) 结构化数组
+            if self.blade_count in AU_POLYNOMIALS:
+                kt_kq = lambda J, p_d, ae_a0: self.open_water_kt_kq(J, p_d, ae_a0, self.blade_count)
             else:
-                pe_speeds = np.linspace(v_min, v_max, 6)
-                pe_powers = np.linspace(1000, 5000, 6)
-                self.pe_curve = CubicSpline(pe_speeds, pe_powers)
-
-            # 三种航行状态
-            self.voyage_states = {
-                'Ⅰ-满载': lambda v: self.pe_curve(v),
-                'Ⅱ-压载(85%)': lambda v: 0.85 * self.pe_curve(v),
-                'Ⅲ-120%满载': lambda v: 1.2 * self.pe_curve(v)
-            }
+                kt_kq = lambda J, p_d, ae_a0: (np.zeros_like(J), np.zeros_like(J))
+            self.voyage_results = compute_voyage(D, p_d, ae_a0, w, t, eta_r, eta_s, [n1, n2, n3], speeds,
+                                                 kt_kq, rho=rho)
+
+            self.update_voyage_states(v_min, v_max)
 
             # 在表格中显示详细结果
             self.display_voyage_results()
 
-            QMessageBox.information(self, "成功", "航行特性计算完成")
+            QMessageBox.information(self, "成功", f"航行特性计算完成（KT、KQ：{self.open_water_source(self.blade_count)}）")
 
         except Exception as e:
             QMessageBox.critical(self, "计算错误", f"航行特性计算失败: {str(e)}")
 
+    def update_voyage_states(self, v_min, v_max):
+        """由有效功率曲线输入生成三种航行状态的PE曲线"""
+        pe_data = self.pe_edit.text().split(';')
+        if len(pe_data) == 2:
+            pe_speeds = list(map(float, pe_data[0].split(',')))
+            pe_powers = list(map(float, pe_data[1].split(',')))
+            self.pe_curve = CubicSpline(pe_speeds, pe_powers)
+        else:
+            pe_speeds = np.linspace(v_min, v_max, 6)
+            pe_powers = np.linspace(1000, 5000, 6)
+            self.pe_curve = CubicSpline(pe_speeds, pe_powers)
+
+        # 三种航行状态
+        self.voyage_states = {
+            'Ⅰ-满载': lambda v: self.pe_curve(v),
+            'Ⅱ-压载(85%)': lambda v: 0.85 * self.pe_curve(v),
+            'Ⅲ-120%满载': lambda v: 1.2 * self.pe_curve(v)
+        }
+
+    @timed_handler
     def plot_voyage_characteristics(self):
         """绘制航行特性图，只标记交点圆点"""
-        if not hasattr(self, 'voyage_results') or not self.voyage_results:
+        if not self.voyage_results:
             QMessageBox.warning(self, "警告", "请先完成航行特性计算")
             return
 
         try:
-            # 创建绘图窗口
-            self.voyage_plot_window = QDialog(self)
-            self.voyage_plot_window.setWindowTitle("航行特性图")
-            self.voyage_plot_window.setGeometry(100, 100, 1000, 800)
+            # 获取复用的绘图窗口
+            window, created = self.get_plot_window('voyage', "航行特性图", (100, 100, 1000, 800), (10, 8))
+            fig = window.figure
+            canvas = window.canvas
+
+            if created:
+                plt.rcParams.update({'font.size': 10})
 
-            # 创建图表
-            fig = Figure(figsize=(10, 8), dpi=100)
-            canvas = FigureCanvas(fig)
-            toolbar = NavigationToolbar(canvas, self.voyage_plot_window)
+                # 创建包含第一象限和第四象限的图表
+                gs = fig.add_gridspec(2, 1, height_ratios=[1, 1], hspace=0.3)
+                ax1 = fig.add_subplot(gs[0])
+                ax2 = fig.add_subplot(gs[1])
 
-            plt.rcParams.update({'font.size': 10})
+                ax1.set_ylabel('功率 PE, PTE (kW)', fontsize=12)
+                ax1.set_title('第一象限: 有效功率和推力功率曲线', fontsize=13, fontweight='bold')
+                ax1.grid(True, alpha=0.3)
 
-            # 创建包含第一象限和第四象限的图表
-            gs = fig.add_gridspec(2, 1, height_ratios=[1, 1], hspace=0.3)
-            ax1 = fig.add_subplot(gs[0])
-            ax2 = fig.add_subplot(gs[1])
+                ax2.set_xlabel('航速 V (kn)', fontsize=12)
+                ax2.set_ylabel('主机功率 PS (kW)', fontsize=12)
+                ax2.set_title('第四象限: 主机功率曲线', fontsize=13, fontweight='bold')
+                ax2.grid(True, alpha=0.3)
+            ax1, ax2 = fig.axes
 
             # 获取航速范围
-            first_rpm = list(self.voyage_results.keys())[0]
-            speeds = [result['V'] for result in self.voyage_results[first_rpm]]
+            speeds = self.voyage_results.data[0]['V']
             v_min, v_max = min(speeds), max(speeds)
             v_fine = np.linspace(v_min, v_max, 200)
 
@@ -3082,26 +2727,30 @@ class PropellerDesignSystem(QMainWindow):
 
             # 存储所有交点信息
             intersection_points = []
+            diagnostics = self.diagnostics['voyage'] = SolverDiagnostics()
 
             # 第一象限：绘制有效功率曲线和PTE曲线
             # 绘制三种航行状态的有效功率曲线
             for i, (state_name, pe_func) in enumerate(self.voyage_states.items()):
-                pe_values = [pe_func(v) for v in v_fine]
-                ax1.plot(v_fine, pe_values, color=colors[i], linestyle=line_styles[i],
-                         linewidth=2, label=state_name)
+                pe_line = canvas.artist(('pe', i), lambda i=i: ax1.plot(
+                    [], [], color=colors[i], linestyle=line_styles[i], linewidth=2)[0])
+                pe_line.set_data(v_fine, pe_func(v_fine))
+                pe_line.set_label(state_name)
 
             # 绘制三个转速的PTE曲线并计算交点
             for i, (rpm_name, results) in enumerate(self.voyage_results.items()):
                 # 使用更精确的插值计算PTE曲线
-                pte_speeds = [result['V'] for result in results]
-                pte_values = [result['PTE'] for result in results]
+                pte_speeds = results['V']
+                pte_values = results['PTE']
 
                 # 使用三次样条插值获得平滑的PTE曲线
                 pte_spline = CubicSpline(pte_speeds, pte_values)
                 pte_smooth = pte_spline(v_fine)
 
-                ax1.plot(v_fine, pte_smooth, color=colors[i], linestyle=line_styles[i % len(line_styles)],
-                         linewidth=2, label=f'{rpm_name} PTE')
+                pte_line = canvas.artist(('pte', i), lambda i=i: ax1.plot(
+                    [], [], color=colors[i], linestyle=line_styles[i % len(line_styles)], linewidth=2)[0])
+                pte_line.set_data(v_fine, pte_smooth)
+                pte_line.set_label(f'{rpm_name} PTE')
 
                 # 计算该转速PTE曲线与所有状态PE曲线的交点
                 for j, (state_name, pe_func) in enumerate(self.voyage_states.items()):
@@ -3116,12 +2765,19 @@ class PropellerDesignSystem(QMainWindow):
 
                         # 检查是否有交点
                         if diff1 * diff2 <= 0:
+                            detail = f'{rpm_name} {state_name}'
                             try:
-                                # 使用二分法精确求解交点
-                                v_intersect = fsolve(diff_func, (v1 + v2) / 2)[0]
+                                # 精确求解交点，记录收敛状态、函数调用次数和残差
+                                solution, info, ier, _ = fsolve(diff_func, (v1 + v2) / 2, full_output=True)
+                                v_intersect = solution[0]
+                                residual = abs(float(np.ravel(info['fvec'])[0]))
+                                in_range = v_min <= v_intersect <= v_max
+                                status = CONVERGED if ier == 1 else NOT_CONVERGED
+                                diagnostics.record('voyage_intersection', status if in_range else OUT_OF_RANGE,
+                                                   info['nfev'], residual, detail=detail)
 
                                 # 确保交点在有效范围内
-                                if v_min <= v_intersect <= v_max:
+                                if in_range:
                                     pte_intersect = pte_spline(v_intersect)
                                     pe_intersect = pe_func(v_intersect)
 
@@ -3134,9 +2790,7 @@ class PropellerDesignSystem(QMainWindow):
 
                                     if ps_intersect is None:
                                         # 使用插值计算PS
-                                        ps_speeds = [r['V'] for r in results]
-                                        ps_values = [r['PS'] for r in results]
-                                        ps_spline = CubicSpline(ps_speeds, ps_values)
+                                        ps_spline = CubicSpline(results['V'], results['PS'])
                                         ps_intersect = ps_spline(v_intersect)
 
                                     intersection_info = {
@@ -3159,33 +2813,27 @@ class PropellerDesignSystem(QMainWindow):
 
                                     if not is_duplicate:
                                         intersections.append(intersection_info)
-                            except:
-                                continue
+                            except Exception as e:
+                                diagnostics.record('voyage_intersection', FAILED, detail=f'{detail}: {e}'[:64])
 
                     # 存储所有交点
                     intersection_points.extend(intersections)
 
-            # 在图表上标记所有交点（只保留圆点，不添加标注）
-            for point in intersection_points:
-                ax1.plot(point['speed'], point['pte'], 'o',
-                         color=point['color'], markersize=8, zorder=5)
-
-            ax1.set_ylabel('功率 PE, PTE (kW)', fontsize=12)
-            ax1.set_title('第一象限: 有效功率和推力功率曲线', fontsize=13, fontweight='bold')
-            ax1.grid(True, alpha=0.3)
-            ax1.legend(loc='best', fontsize=10)
+            # 在图表上标记所有交点（只保留圆点，不添加标注），同一状态的交点共用一个图元
+            for j in range(len(self.voyage_states)):
+                points = [point for point in intersection_points if point['color'] == colors[j]]
+                marker_line = canvas.artist(('points', j), lambda j=j: ax1.plot(
+                    [], [], 'o', color=colors[j], markersize=8, zorder=5)[0])
+                marker_line.set_data([point['speed'] for point in points], [point['pte'] for point in points])
 
             # 第四象限：绘制Ps曲线
             for i, (rpm_name, results) in enumerate(self.voyage_results.items()):
-                ps_values = [result['PS'] for result in results]
-                ax2.plot(speeds, ps_values, color=colors[i], linestyle=line_styles[i % len(line_styles)],
-                         linewidth=2, label=f'{rpm_name} PS', marker=markers[i % len(markers)], markersize=4)
-
-            ax2.set_xlabel('航速 V (kn)', fontsize=12)
-            ax2.set_ylabel('主机功率 PS (kW)', fontsize=12)
-            ax2.set_title('第四象限: 主机功率曲线', fontsize=13, fontweight='bold')
-            ax2.grid(True, alpha=0.3)
-            ax2.legend(loc='best', fontsize=10)
+                ps_values = results['PS']
+                ps_line = canvas.artist(('ps', i), lambda i=i: ax2.plot(
+                    [], [], color=colors[i], linestyle=line_styles[i % len(line_styles)],
+                    linewidth=2, marker=markers[i % len(markers)], markersize=4)[0])
+                ps_line.set_data(speeds, ps_values)
+                ps_line.set_label(f'{rpm_name} PS')
 
             # 存储交点信息供后续使用
             self.voyage_intersections = intersection_points
@@ -3193,29 +2841,25 @@ class PropellerDesignSystem(QMainWindow):
             # 更新关键点显示
             self.update_keypoints_display()
 
-            fig.tight_layout()
+            # 转速变化时更新图例
+            stale = window.update_legends(self.voyage_results.keys(), loc='best', fontsize=10)
+            if created:
+                fig.tight_layout()
+            canvas.refresh(autoscale='grow', stale=stale)
 
-            # 添加到布局
-            layout = QVBoxLayout()
-            layout.addWidget(toolbar)
-            layout.addWidget(canvas)
-            self.voyage_plot_window.setLayout(layout)
-            self.voyage_plot_window.show()
+            window.show()
+            window.raise_()
 
         except Exception as e:
             QMessageBox.critical(self, "绘图错误", f"绘制航行特性图时发生错误: {str(e)}")
 
     def display_voyage_results(self):
         """在表格中显示航行特性计算结果"""
-        if not hasattr(self, 'voyage_results'):
+        if not self.voyage_results:
             return
 
-        # 获取第一个转速的结果来设置表格
-        first_rpm = list(self.voyage_results.keys())[0]
-        results = self.voyage_results[first_rpm]
-
-        # 设置表格行数和列数
-        num_rows = len(results)
+        # 按第一个转速的航速点数设置表格
+        num_rows = self.voyage_results.data.shape[1]
         num_cols = 10
 
         # 设置总行数：详细结果（三个转速）
@@ -3294,6 +2938,399 @@ class PropellerDesignSystem(QMainWindow):
 
         # 更新文本显示
         self.voyage_keypoints_text.setText(keypoints_text)
+    # ===================== 9. 方案对比 =====================
+    COMPARE_COLUMNS = (('name', "方案名称"), ('blade_count', "叶数 Z"), ('ps', "Ps (kW)"), ('N', "N (r/min)"),
+                       ('w', "w"), ('t', "t"), ('eta_s', "ηs"), ('eta_r', "ηR"))
+
+    def create_compare_tab(self):
+        """多方案对比：各方案在工作进程中并行计算，结果列表对比并叠加绘制曲线"""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setSpacing(8)
+        layout.setContentsMargins(8, 8, 8, 8)
+
+        design_group = StyledGroupBox("对比方案（PE曲线、沉深、蒸汽压等取前面标签页的输入）")
+        design_layout = QVBoxLayout()
+        self.tbl_compare_designs = StyledTableWidget(0, len(self.COMPARE_COLUMNS))
+        self.tbl_compare_designs.setHorizontalHeaderLabels([label for _, label in self.COMPARE_COLUMNS])
+        design_layout.addWidget(self.tbl_compare_designs)
+        design_group.setLayout(design_layout)
+        layout.addWidget(design_group)
+
+        btn_layout = QHBoxLayout()
+        self.btn_compare_add = StyledButton("添加当前方案")
+        self.btn_compare_add_blades = StyledButton("添加4/5叶对比")
+        self.btn_compare_remove = StyledButton("删除选中方案")
+        self.btn_compare_run = StyledButton("并行计算对比")
+        self.btn_compare_plot = StyledButton("绘制对比曲线")
+        for btn in (self.btn_compare_add, self.btn_compare_add_blades, self.btn_compare_remove,
+                    self.btn_compare_run, self.btn_compare_plot):
+            btn_layout.addWidget(btn)
+        layout.addLayout(btn_layout)
+
+        result_group = StyledGroupBox("对比结果")
+        result_layout = QVBoxLayout()
+        self.tbl_compare_results = StyledTableWidget(len(SUMMARY_FIELDS), 1)
+        self.tbl_compare_results.setHorizontalHeaderLabels(["参数"])
+        self.compare_status = QLabel("")
+        result_layout.addWidget(self.tbl_compare_results)
+        result_layout.addWidget(self.compare_status)
+        result_group.setLayout(result_layout)
+        layout.addWidget(result_group)
+
+        self.compare_timer = QTimer(self)
+        self.compare_timer.setInterval(50)
+        self.compare_timer.timeout.connect(self.poll_compare_results)
+
+        self.btn_compare_add.clicked.connect(lambda: self.add_compare_design())
+        self.btn_compare_add_blades.clicked.connect(self.add_blade_count_designs)
+        self.btn_compare_remove.clicked.connect(self.remove_compare_designs)
+        self.btn_compare_run.clicked.connect(self.run_comparison)
+        self.btn_compare_plot.clicked.connect(self.plot_comparison)
+        return tab
+
+    def current_design(self):
+        """由前面标签页的输入组成一个方案字典"""
+        pe_text = self.pe_edit.text().strip()
+        if pe_text:
+            pe_data = pe_text.split(';')
+            speeds = tuple(float(v) for v in pe_data[0].split(',') if v.strip())
+            pes = tuple(float(v) for v in pe_data[1].split(',') if v.strip())
+        else:
+            speeds, pes = DEFAULT_DESIGN['speeds'], DEFAULT_DESIGN['pes']
+        return {
+            'name': f"Z={self.blade_count}", 'blade_count': self.blade_count,
+            'ps': self.safe_float_convert(self.ps_input.text(), 6222), 'N': self.safe_float_convert(self.n_input.text(), 155),
+            'w': self.safe_float_convert(self.w_input.text(), 0.35), 't': self.safe_float_convert(self.t_input.text(), 0.21),
+            'eta_s': self.safe_float_convert(self.etas_input.text(), 0.97),
+            'eta_r': self.safe_float_convert(self.etar_input.text(), 1.0),
+            'speeds': speeds, 'pes': pes,
+            'hs': self.safe_float_convert(self.depth_input.text(), 5.0),
+            'pv': self.safe_float_convert(self.pv_input.text(), 1706), 'p0': self.safe_float_convert(self.p0_input.text(), 101325),
+            'source': 'wag' if self.rb_wag.isChecked() else 'ber',
+            'epsilon': self.safe_float_convert(self.epsilon_input.text(), 8.0),
+            'K': self.safe_float_convert(self.k_coef_input.text(), 1.0),
+            'material_rho': self.safe_float_convert(self.mass_rho.text(), 8400),
+        }
+
+    def add_compare_design(self, **overrides):
+        """把当前输入作为一个方案加入对比表，overrides 覆盖其中的参数"""
+        try:
+            design = dict(self.current_design(), **overrides)
+        except (ValueError, IndexError):
+            QMessageBox.warning(self, "输入错误", "有效功率曲线格式错误，无法添加方案")
+            return
+        table = self.tbl_compare_designs
+        row = table.rowCount()
+        table.insertRow(row)
+        for col, (key, _) in enumerate(self.COMPARE_COLUMNS):
+            value = design[key]
+            table.setItem(row, col, QTableWidgetItem(value if isinstance(value, str) else f"{value:g}"))
+
+    def add_blade_count_designs(self):
+        """以当前输入分别加入4叶与5叶方案"""
+        for z in (4, 5):
+            self.add_compare_design(name=f"Z={z}", blade_count=z)
+
+    def remove_compare_designs(self):
+        rows = sorted({index.row() for index in self.tbl_compare_designs.selectedIndexes()}, reverse=True)
+        for row in rows:
+            self.tbl_compare_designs.removeRow(row)
+
+    def compare_designs_from_table(self):
+        """读取对比表中的方案，表中未列出的参数取当前输入"""
+        base = self.current_design()
+        table = self.tbl_compare_designs
+        designs = []
+        for row in range(table.rowCount()):
+            design = dict(base)
+            for col, (key, _) in enumerate(self.COMPARE_COLUMNS):
+                text = table.item(row, col).text() if table.item(row, col) else ''
+                if key == 'name':
+                    design[key] = text or f"方案{row + 1}"
+                elif key == 'blade_count':
+                    design[key] = int(self.safe_float_convert(text, base[key]))
+                else:
+                    design[key] = self.safe_float_convert(text, base[key])
+            designs.append(design)
+        return designs
+
+    @timed_handler
+    def run_comparison(self):
+        """把各方案提交给进程池并行计算，界面不等待，由定时器收集结果"""
+        if self.compare_futures:
+            QMessageBox.information(self, "提示", "方案对比正在计算中")
+            return
+        try:
+            designs = self.compare_designs_from_table()
+        except (ValueError, IndexError):
+            QMessageBox.warning(self, "输入错误", "有效功率曲线格式错误")
+            return
+        if not designs:
+            QMessageBox.warning(self, "警告", "请先添加对比方案")
+            return
+        if self.compare_executor is None:
+            # 按CPU核数创建并复用；工作进程按需启动，方案少时不会多占进程
+            self.compare_executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        self.compare_start = time.perf_counter()
+        self.compare_tab = self.ui_monitor.current_tab()
+        self.compare_names = [design['name'] for design in designs]
+        self.compare_futures = [self.compare_executor.submit(evaluate_design, design) for design in designs]
+        self.btn_compare_run.setEnabled(False)
+        self.compare_status.setText(f"正在计算 {len(designs)} 个方案……")
+        self.compare_timer.start()
+
+    def poll_compare_results(self):
+        done = sum(future.done() for future in self.compare_futures)
+        if done < len(self.compare_futures):
+            self.compare_status.setText(f"正在计算：已完成 {done}/{len(self.compare_futures)}")
+            return
+        self.compare_timer.stop()
+        self.ui_monitor.record('run_comparison（后台）', time.perf_counter() - self.compare_start, self.compare_tab)
+        futures, self.compare_futures = self.compare_futures, []
+        self.btn_compare_run.setEnabled(True)
+        self.compare_results = [self.compare_result(name, future) for name, future in zip(self.compare_names, futures)]
+        self.display_compare_results()
+        failed = [r['name'] for r in self.compare_results if 'error' in r]
+        self.compare_status.setText(
+            f"{len(self.compare_results)} 个方案计算完成，用时 {time.perf_counter() - self.compare_start:.2f} s"
+            + (f"；计算失败: {', '.join(failed)}" if failed else ""))
+
+    def compare_result(self, name, future):
+        """取出单个方案的结果，工作进程异常退出等错误转为带 'error' 的结果"""
+        try:
+            return future.result()
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # 进程池损坏后不能再提交任务，下次对比时重新创建
+                self.shutdown_compare_executor()
+            logger.warning("方案 %(name)s 计算失败: %(error)s", {'name': name, 'error': str(e)})
+            return {'name': name, 'error': str(e) or type(e).__name__}
+
+    def shutdown_compare_executor(self):
+        if self.compare_executor is not None:
+            self.compare_executor.shutdown(cancel_futures=True)
+            self.compare_executor = None
+
+    def display_compare_results(self):
+        results = self.compare_results
+        table = self.tbl_compare_results
+        table.setColumnCount(len(results) + 1)
+        table.setHorizontalHeaderLabels(["参数"] + [r['name'] for r in results])
+        table.setRowCount(len(SUMMARY_FIELDS))
+        for row, values in enumerate(summary_table(results)):
+            for col, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignCenter)
+                table.setItem(row, col, item)
+
+    @timed_handler
+    def plot_comparison(self):
+        """叠加绘制各方案的敞水曲线与航行特性曲线"""
+        results = [r for r in self.compare_results if 'error' not in r]
+        if not results:
+            QMessageBox.warning(self, "警告", "请先完成方案对比计算")
+            return
+        try:
+            window, created = self.get_plot_window('compare', "方案对比", (120, 120, 1100, 800), (11, 8))
+            fig = window.figure
+            canvas = window.canvas
+            if created:
+                titles = [("J", "KT, 10KQ"), ("J", "η₀"), ("V (kn)", "PTE, PE (kW)"), ("V (kn)", "PS (kW)")]
+                for i, (xlabel, ylabel) in enumerate(titles):
+                    ax = fig.add_subplot(2, 2, i + 1)
+                    ax.set_xlabel(xlabel)
+                    ax.set_ylabel(ylabel)
+                    ax.grid(True, alpha=0.3)
+                fig.suptitle('多方案对比', fontsize=14, fontweight='bold')
+            ax_ktkq, ax_eta, ax_pte, ax_ps = fig.axes
+            colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+
+            # 每个方案一组图元，方案减少时多余的图元清空并隐藏
+            count = max(len(results), sum(1 for key in canvas.artists if key[0] == 'kt'))
+            for i in range(count):
+                color = colors[i % len(colors)]
+                lines = {
+                    'kt': canvas.artist(('kt', i), lambda c=color: ax_ktkq.plot([], [], color=c, lw=2)[0]),
+                    'kq': canvas.artist(('kq', i), lambda c=color: ax_ktkq.plot([], [], color=c, ls='--')[0]),
+                    'eta': canvas.artist(('eta', i), lambda c=color: ax_eta.plot([], [], color=c, lw=2)[0]),
+                    'pte': canvas.artist(('pte', i), lambda c=color: ax_pte.plot([], [], color=c, lw=2)[0]),
+                    'pe': canvas.artist(('pe', i), lambda c=color: ax_pte.plot([], [], color=c, ls=':')[0]),
+                    'ps': canvas.artist(('ps', i), lambda c=color: ax_ps.plot([], [], color=c, lw=2, marker='o',
+                                                                          markersize=3)[0]),
+                }
+                if i >= len(results):
+                    for line in lines.values():
+                        line.set_data([], [])
+                        line.set_visible(False)
+                        line.set_label('_nolegend_')
+                    continue
+                r = results[i]
+                ow, voyage = r['open_water'], r['voyage']
+                data = {'kt': (ow['J'], ow['KT']), 'kq': (ow['J'], ow['10KQ']), 'eta': (ow['J'], ow['eta0']),
+                        'pte': (voyage['V'], voyage['PTE']), 'pe': (voyage['V'], r['PE']),
+                        'ps': (voyage['V'], voyage['PS'])}
+                labels = {'kt': f"{r['name']} KT", 'kq': f"{r['name']} 10KQ", 'eta': r['name'],
+                          'pte': f"{r['name']} PTE", 'pe': f"{r['name']} PE", 'ps': r['name']}
+                for key, line in lines.items():
+                    line.set_data(*data[key])
+                    line.set_visible(True)
+                    line.set_label(labels[key])
+            ax_eta.set_ylim(0, 1)
+
+            stale = window.update_legends([r['name'] for r in results], loc='best', fontsize=8)
+            if created:
+                fig.tight_layout()
+            canvas.refresh(autoscale='grow', stale=stale)
+            window.show()
+            window.raise_()
+        except Exception as e:
+            QMessageBox.critical(self, "绘图错误", f"绘制对比曲线时发生错误: {str(e)}")
+
+    def closeEvent(self, event):
+        self.ui_monitor.stop()
+        self.shutdown_compare_executor()
+        super().closeEvent(event)
+
+    # ---------- 会话保存与读取 ----------
+    def session_widgets(self):
+        """按类型收集界面控件：(输入控件, 文本框, 表格)，均为 {属性名: 控件}"""
+        inputs, texts, tables = {}, {}, {}
+        for name, widget in vars(self).items():
+            if isinstance(widget, (QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QRadioButton, QCheckBox)):
+                inputs[name] = widget
+            elif isinstance(widget, QTextEdit):
+                texts[name] = widget
+            elif isinstance(widget, QTableWidget):
+                tables[name] = widget
+        return inputs, texts, tables
+
+    # 各计算阶段的诊断名称
+    DIAGNOSTIC_STAGES = {'max_speed': "最大航速", 'cavitation': "空泡校核", 'optimum': "最佳要素",
+                         'voyage': "航行特性交点"}
+
+    def notify_diagnostics(self, message, stage):
+        """计算完成提示；有求解器退回边界值、未收敛或外插时改为警告并附诊断报告"""
+        diagnostics = self.diagnostics.get(stage)
+        if diagnostics is not None and diagnostics.has_issues():
+            QMessageBox.warning(self, "完成（有求解警告）", f"{message}\n\n求解诊断：\n{diagnostics.report()}")
+        else:
+            QMessageBox.information(self, "成功", message)
+
+    def show_diagnostics(self):
+        """显示各阶段最近一次计算的求解诊断及界面响应记录"""
+        sections = [f"【{self.DIAGNOSTIC_STAGES.get(stage, stage)}】\n{diagnostics.report()}"
+                    for stage, diagnostics in self.diagnostics.items()] or ["尚未进行计算"]
+        sections.append(f"【界面响应】\n{self.ui_monitor.report()}")
+        QMessageBox.information(self, "求解诊断", "\n\n".join(sections))
+
+    def save_session(self):
+        """把全部输入、结果表格和各阶段计算结果保存为会话文件"""
+        try:
+            path, _ = QFileDialog.getSaveFileName(self, "保存设计会话", "", "设计会话 (*.npz)")
+            if not path:
+                return
+            inputs, texts, tables = self.session_widgets()
+
+            input_values = {}
+            for name, widget in inputs.items():
+                if isinstance(widget, QLineEdit):
+                    input_values[name] = widget.text()
+                elif isinstance(widget, QComboBox):
+                    input_values[name] = widget.currentText()
+                elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+                    input_values[name] = repr(widget.value())
+                else:
+                    input_values[name] = '1' if widget.isChecked() else '0'
+
+            table_values = {}
+            for name, table in tables.items():
+                cells = [[table.item(r, c).text() if table.item(r, c) else ''
+                          for c in range(table.columnCount())] for r in range(table.rowCount())]
+                header = [table.horizontalHeaderItem(c).text() if table.horizontalHeaderItem(c) else ''
+                          for c in range(table.columnCount())]
+                vheader = [table.verticalHeaderItem(r).text() if table.verticalHeaderItem(r) else ''
+                           for r in range(table.rowCount())]
+                table_values[name] = (cells, header, vheader)
+
+            state = {'res': self.res, 'opt_res': self.opt_res, 'optimum_results': self.optimum_results,
+                     'cavitation_results': self.cavitation_results, 'voyage_results': self.voyage_results,
+                     'mass_details': self.mass_details, 'voyage_intersections': self.voyage_intersections}
+            save_session(path, input_values, {name: w.toPlainText() for name, w in texts.items()},
+                         table_values, state)
+            QMessageBox.information(self, "成功", f"会话已保存到 {path}")
+        except Exception as e:
+            QMessageBox.critical(self, "保存失败", f"保存会话时发生错误: {str(e)}")
+
+    def load_session(self):
+        """读取会话文件，直接恢复各标签页的输入和结果，不重新计算"""
+        try:
+            path, _ = QFileDialog.getOpenFileName(self, "打开设计会话", "", "设计会话 (*.npz)")
+            if not path:
+                return
+            input_values, text_values, table_values, state = load_session(path)
+            inputs, texts, tables = self.session_widgets()
+
+            # 先设桨叶数（会更新表头），其余控件屏蔽信号，避免触发实时预览等重算
+            if 'blade_combo' in input_values:
+                self.blade_combo.setCurrentText(input_values['blade_combo'])
+            for name, value in input_values.items():
+                widget = inputs.get(name)
+                if widget is None or widget is self.blade_combo:
+                    continue
+                widget.blockSignals(True)
+                try:
+                    if isinstance(widget, QLineEdit):
+                        widget.setText(value)
+                    elif isinstance(widget, QComboBox):
+                        widget.setCurrentText(value)
+                    elif isinstance(widget, QSpinBox):
+                        widget.setValue(int(float(value)))
+                    elif isinstance(widget, QDoubleSpinBox):
+                        widget.setValue(float(value))
+                    else:
+                        widget.setChecked(value == '1')
+                finally:
+                    widget.blockSignals(False)
+            for name, value in text_values.items():
+                if name in texts:
+                    texts[name].setPlainText(value)
+            for name, (cells, header, vheader) in table_values.items():
+                table = tables.get(name)
+                if table is None:
+                    continue
+                table.clearContents()
+                table.setRowCount(len(cells))
+                table.setColumnCount(len(header))
+                table.setHorizontalHeaderLabels(header)
+                if any(vheader):
+                    table.setVerticalHeaderLabels(vheader)
+                for r, row in enumerate(cells):
+                    for c, text in enumerate(row):
+                        if text:
+                            item = QTableWidgetItem(text)
+                            item.setTextAlignment(Qt.AlignCenter)
+                            table.setItem(r, c, item)
+
+            self.res = state['res']
+            self.opt_res = state['opt_res']
+            self.optimum_results = state['optimum_results']
+            self.cavitation_results = state['cavitation_results']
+            self.voyage_results = state['voyage_results']
+            self.mass_details = state['mass_details']
+            self.voyage_intersections = state['voyage_intersections']
+            if self.cavitation_results is not None:
+                self.plot_btn.setEnabled(True)
+                self.results_btn.setEnabled(True)
+            if self.voyage_results:
+                # 航行特性表格带分组底色，按结果重新生成
+                self.update_voyage_states(self.safe_float_convert(self.voyage_v_min.text(), 12),
+                                          self.safe_float_convert(self.voyage_v_max.text(), 17))
+                self.display_voyage_results()
+            QMessageBox.information(self, "成功", f"已打开会话 {path}")
+        except Exception as e:
+            QMessageBox.critical(self, "打开失败", f"读取会话时发生错误: {str(e)}")
+
     # ---------- 工具函数 ----------
     def clear_all(self):
         """清空所有数据"""
@@ -3327,11 +3364,14 @@ class PropellerDesignSystem(QMainWindow):
                         widget.clear()
 
             # 重置变量
-            self.res = {}
-            self.opt_res = {}
-            self.mass_details = []
-            self.cavitation_results = {}
-            self.optimum_results = {}
+            self.res = None
+            self.opt_res = None
+            self.mass_details = {}
+            self.diagnostics = {}
+            self.cavitation_results = None
+            self.optimum_results = None
+            self.voyage_results = None
+            self.voyage_intersections = []
 
             QMessageBox.information(self, "成功", "所有数据已清空")
         except Exception as e:
@@ -3372,6 +3412,7 @@ if __name__ == "__main__":
     app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
+    configure_logging()
     window = PropellerDesignSystem()
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file